@@ -1,5 +1,5 @@
 from app.core.services.jwt import get_user_id_from_token, get_all_details_from_token
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import timedelta
 from fastapi import Depends, Security, HTTPException
 from sqlalchemy.orm import Session
@@ -15,12 +15,14 @@ from app.core.errors.error_strings import (
     MALFORMED_PAYLOAD,
     WRONG_TOKEN_PREFIX,
     UNAUTHORIZED_ACTION,
+    REVOKED_TOKEN,
 )
 from app.repositories.user_repo import user_repo
 from app.core.errors.exceptions import (
     DisallowedLoginException,
     InvalidTokenException,
 )
+from app.core.services.user_cache import CachedUser, user_cache
 from app.models.user_model import User
 from loguru import logger
 from app.core.settings.configurations import settings
@@ -76,7 +78,7 @@ def _extract_refresh_jwt_from_header(
     return token
 
 
-def check_if_user_is_valid(user: User):
+def check_if_user_is_valid(user: Union[User, CachedUser]):
     if not user:
         raise InvalidTokenException(detail=MALFORMED_PAYLOAD)
     if not user.is_active:
@@ -93,13 +95,55 @@ def get_token_details(token: str, method):
         raise InvalidTokenException(detail=MALFORMED_PAYLOAD)
 
 
-def get_currently_authenticated_user(
+def get_current_cached_user(
     *,
     db: Session = Depends(get_db),
     token: str = Depends(_extract_jwt_from_header),
+) -> CachedUser:
+    """
+    Authenticate from the token and the user cache. On a cache miss the
+    user type and `ver` claims are trusted unless `user_cache.sync` has
+    seen a later change to the user, so the database is only hit for the
+    periodic sync, for tokens without those claims, and while the sync is
+    failing. Tokens minted before a (de)activation or user type change
+    carry a lower `ver` and are rejected.
+    """
+    token_details = get_token_details(token, get_all_details_from_token)
+    user_id = token_details.get("id")
+    if not user_id:
+        raise InvalidTokenException(detail=MALFORMED_PAYLOAD)
+    token_version = token_details.get("ver")
+    if token_version is not None and not isinstance(token_version, int):
+        raise InvalidTokenException(detail=REVOKED_TOKEN)
+    user_cache.sync(db)
+    if token_version is not None and user_cache.is_revoked(user_id, token_version):
+        raise InvalidTokenException(detail=REVOKED_TOKEN)
+    cached_user = user_cache.get(user_id)
+    if (
+        cached_user is not None
+        and token_version is not None
+        and token_version > cached_user.activation_version
+    ):
+        # Cached before a change whose invalidation has not been synced yet.
+        cached_user = None
+    if cached_user is None:
+        cached_user = user_cache.from_claims(token_details)
+    if cached_user is None:
+        user = user_repo.get_with_user_type(db, id=user_id)
+        check_if_user_is_valid(user)
+        cached_user = user_cache.set(user)
+    check_if_user_is_valid(cached_user)
+    if token_version is not None and token_version != cached_user.activation_version:
+        raise InvalidTokenException(detail=REVOKED_TOKEN)
+    return cached_user
+
+
+def get_currently_authenticated_user(
+    *,
+    db: Session = Depends(get_db),
+    cached_user: CachedUser = Depends(get_current_cached_user),
 ) -> User:
-    token_details = get_token_details(token, get_user_id_from_token)
-    user = user_repo.get(db, id=token_details["id"])
+    user = user_repo.get_with_user_type(db, id=cached_user.id)
     check_if_user_is_valid(user)
     return user
 
@@ -109,11 +153,10 @@ class PermissionChecker:
         self.allowed_user_types = allowed_user_types + [SUPERUSER_USER_TYPE]
         logger.info(self.allowed_user_types)
 
-    def __call__(self, user: User = Depends(get_currently_authenticated_user)):
-        current_user_type: UserType = user.user_type
-        if current_user_type.name not in self.allowed_user_types:
+    def __call__(self, user: CachedUser = Depends(get_current_cached_user)):
+        if user.user_type not in self.allowed_user_types:
             logger.debug(
-                f"User type '{current_user_type.name}' not allowed. Permitted types: {self.allowed_user_types}"
+                f"User type '{user.user_type}' not allowed. Permitted types: {self.allowed_user_types}"
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=UNAUTHORIZED_ACTION
@@ -1,6 +1,6 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from app.database.sessions.session import SessionLocal
+from app.database.sessions.session import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator:
@@ -9,3 +9,8 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        yield db
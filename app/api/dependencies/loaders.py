@@ -0,0 +1,16 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.dependencies.db import get_async_db, get_db
+from app.core.services.document_names import DocumentNameLoader
+
+
+def get_document_name_loader(db: Session = Depends(get_db)) -> DocumentNameLoader:
+    return DocumentNameLoader(db)
+
+
+def get_async_document_name_loader(
+    db: AsyncSession = Depends(get_async_db),
+) -> DocumentNameLoader:
+    return DocumentNameLoader(db)
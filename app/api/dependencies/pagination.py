@@ -0,0 +1,16 @@
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel
+
+
+class PageParams(BaseModel):
+    cursor: Optional[str] = None
+    limit: int = 100
+
+
+def get_page_params(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
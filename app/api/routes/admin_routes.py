@@ -1,5 +1,6 @@
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import List, Optional
 from unittest.util import safe_repr
 import uuid
 from app.api.routes.court_system_routes import populate_data
@@ -12,12 +13,30 @@ from app.schemas.category_schema import (
     CategoryInResponse,
     FullCategoryInResponse,
 )
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from loguru import logger
 
 from bson import ObjectId
-from app.core.services.invitation import process_user_invite
+from app.core.services.document_names import DocumentNameLoader
+from app.core.services.document_rollup import document_rollup, empty_rollup
+from app.core.services.invitation import invite_users_in_bulk, read_invite_csv
+from app.core.services.reference_data import reference_data
+from app.core.services.template_catalogue import template_catalogue
+from app.core.services.stats import GLOBAL_SCOPE, stats_service
 from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
     LastestAffidavits,
     SlimDocumentInResponse,
     SlimTemplateInResponse,
@@ -27,14 +46,18 @@ from app.schemas.affidavit_schema import (
     TemplateCreateForm,
     TemplateInResponse,
     serialize_mongo_document,
+    slim_document_list_serialiser,
     # template_individual_serializer,
     template_list_serialiser,
 )
 from app.schemas.shared_schema import SlimUserInResponse
 from app.schemas.stats_schema import AdminDashboardStat
 from postmarker import core
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db, get_db
+from app.api.dependencies.loaders import get_document_name_loader
+from app.api.dependencies.pagination import PageParams, get_page_params
 from app.core.errors.exceptions import (
     AlreadyExistsException,
     DoesNotExistException,
@@ -50,7 +73,7 @@ from app.models.user_invite_models import UserInvite
 from app.models.user_model import User
 from app.core.settings.configurations import settings
 from app.repositories.user_invite_repo import user_invite_repo
-from app.repositories.user_repo import user_repo
+from app.repositories.user_repo import async_user_repo, user_repo
 from app.repositories.user_type_repo import user_type_repo
 from app.api.dependencies.authentication import (
     admin_permission_dependency,
@@ -88,49 +111,37 @@ from app.database.sessions.mongo_client import document_collection
 from app.repositories.court_system_repo import (
     state_repo,
     court_repo,
+    jurisdiction_commissioners,
     jurisdiction_repo,
 )
 from app.core.services.email import email_service
 from app.schemas.user_type_schema import UserTypeInDB
+from commonLib.repositories.pagination import paginate_documents
+from commonLib.response.conditional import conditional_response
+from commonLib.response.fast_response import fast_response
 from commonLib.response.response_schema import create_response, GenericResponse
+from commonLib.repositories.unit_of_work import unit_of_work
 from app.database.sessions.mongo_client import template_collection
 
 router = APIRouter()
 
 
 @router.get("/get_dashboard_stats", dependencies=[Depends(admin_permission_dependency)])
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
     """
     This endpoint returns the number of users and invites in the system."""
-    total_affidavits = await document_collection.count_documents({})
-    total_users = user_repo.get_count(db)
-    total_templates = await template_collection.count_documents({})
-
-    pipeline = [
-        {
-            "$match": {
-                "$or": [{"status": "PAID"}, {"is_attested": True}],
-            }
-        },
-        {
-            "$group": {
-                "_id": None,
-                "total_amount": {"$sum": "$amount_paid"},
-            }
-        },
-    ]
-
-    total_revenue_cursor = document_collection.aggregate(pipeline)
-    total_revenue = await total_revenue_cursor.to_list(length=1)
+    stats = await stats_service.get(GLOBAL_SCOPE)
+    total_users = await async_user_repo.get_count(db, approximate=True)
+    total_templates = await template_collection.estimated_document_count()
 
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Dashboard Stats fetched successfully.",
         data=AdminDashboardStat(
-            total_affidavits=total_affidavits,
+            total_affidavits=stats["total"],
             total_users=total_users,
             total_templates=total_templates,
-            total_revenue=total_revenue[0]["total_amount"] if total_revenue else 0,
+            total_revenue=stats["revenue"],
         ),
     )
 
@@ -140,7 +151,9 @@ def get_unit_heads(db: Session = Depends(get_db)):
     user_type = user_type_repo.get_by_name(db=db, name=settings.HEAD_OF_UNIT_USER_TYPE)
     if user_type is None:
         raise HTTPException(status_code=500)
-    head_of_units = user_repo.get_users_by_user_type(db=db, user_type_id=user_type.id)
+    head_of_units = user_repo.get_users_by_user_type(
+        db=db, user_type_id=user_type.id, with_profile="head_of_unit_tree"
+    )
 
     # head_of_units[0].head_of_unit.jurisdiction.courts[0].commissioner_profile[0].user
     return create_response(
@@ -180,10 +193,9 @@ def get_unit_heads(db: Session = Depends(get_db)):
                         verify_token="",
                         is_active=commissioner.is_active,
                     )
-                    for head_of_unit in head_of_units
-                    for court in head_of_unit.head_of_unit.jurisdiction.courts
-                    for commissioner_profile in court.commissioner_profile
-                    for commissioner in [commissioner_profile.user]
+                    for commissioner in jurisdiction_commissioners(
+                        head_of_unit.head_of_unit.jurisdiction
+                    )
                 ],
             )
             for head_of_unit in head_of_units
@@ -196,91 +208,21 @@ def get_unit_heads(db: Session = Depends(get_db)):
     dependencies=[Depends(admin_permission_dependency)],
     # response_model=GenericResponse[List[PublicInResponse]]
 )
-async def get_users(db: Session = Depends(get_db)):
-    users = user_repo.get_all(db)
-    response = []
-    for user in users:
-        pipeline = [
-            {
-                "$match": {
-                    "created_by_id": user.id,
-                    "$or": [{"status": "PAID"}, {"is_attested": True}],
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "total_amount": {"$sum": "$amount_paid"},
-                }
-            },
-        ]
-        total_saved = await document_collection.find(
-            {"created_by_id": user.id, "status": "SAVED"}
-        ).to_list(length=1000)
-        total_paid = await document_collection.find(
-            {"created_by_id": user.id, "status": "PAID"}
-        ).to_list(length=1000)
-        total_attested = await document_collection.find(
-            {"created_by_id": user.id, "status": "ATTESTED"}
-        ).to_list(length=1000)
-        total_documents = await document_collection.find(
-            {"created_by_id": user.id}
-        ).to_list(length=1000)
-        total_amount_result = await document_collection.aggregate(pipeline).to_list(
-            length=100
-        )
-        if total_amount_result:
-            total_amount = total_amount_result[0]["total_amount"]
-        else:
-            total_amount = 0
-
-        new_user = dict(
-            total_documents=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in total_documents
-            ],
-            total_paid=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in total_paid
-            ],
-            total_attested=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in total_attested
-            ],
-            total_saved=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in total_saved
-            ],
+@fast_response
+async def get_users(
+    slim: bool = False,
+    page: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_async_db),
+):
+    users, next_cursor = await async_user_repo.get_page_with_user_type(
+        db, cursor=page.cursor, limit=page.limit
+    )
+    rollups = await document_rollup.get_rollups([user.id for user in users], slim=slim)
+
+    response = [
+        dict(
+            **rollups.get(user.id, empty_rollup(slim)),
             id=user.id,
-            total_amount=total_amount,
             first_name=user.first_name,
             last_name=user.last_name,
             email=user.email,
@@ -289,12 +231,14 @@ async def get_users(db: Session = Depends(get_db)):
             date_created=user.CreatedAt,
             verify_token="",
         )
-        response.append(new_user)
+        for user in users
+    ]
 
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"Users information retrieved successfully.",
         data=response,
+        next_cursor=next_cursor,
     )
 
 
@@ -303,18 +247,55 @@ async def get_users(db: Session = Depends(get_db)):
     dependencies=[Depends(admin_permission_dependency)],
     status_code=status.HTTP_200_OK,
 )
-async def invite_users(
+def invite_users(
     users: List[InviteOperationsForm],
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_currently_authenticated_user),
     db: Session = Depends(get_db),
 ):
-    for user in users:
-        await process_user_invite(user, current_user, db, background_tasks)
+    invited = invite_users_in_bulk(
+        db, list(enumerate(users, start=1)), current_user, background_tasks
+    )
 
     return create_response(
         status_code=status.HTTP_200_OK,
-        message="Users invited successfully.",
+        message=f"{invited} users invited successfully.",
+        data=invited,
+    )
+
+
+@router.post(
+    "/invite_personel/csv",
+    dependencies=[Depends(admin_permission_dependency)],
+    status_code=status.HTTP_200_OK,
+)
+def invite_users_from_csv(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    user_type_id: Optional[str] = Form(None),
+    court_id: Optional[str] = Form(None),
+    jurisdiction_id: Optional[str] = Form(None),
+    current_user: User = Depends(get_currently_authenticated_user),
+    db: Session = Depends(get_db),
+):
+    """Invite everyone in a CSV with a header row of first_name, last_name,
+    email and optionally user_type_id, court_id and jurisdiction_id. The form
+    fields fill in blank cells."""
+    rows, errors = read_invite_csv(
+        file.file,
+        defaults=dict(
+            user_type_id=user_type_id,
+            court_id=court_id,
+            jurisdiction_id=jurisdiction_id,
+        ),
+        max_rows=settings.INVITE_CSV_MAX_ROWS,
+    )
+    invited = invite_users_in_bulk(db, rows, current_user, background_tasks, errors)
+
+    return create_response(
+        status_code=status.HTTP_200_OK,
+        message=f"{invited} users invited successfully.",
+        data=invited,
     )
 
 
@@ -324,7 +305,9 @@ async def invite_users(
     status_code=status.HTTP_200_OK,
     response_model=GenericResponse[List[CommissionerInResponse]],
 )
+@fast_response
 async def get_commissioners(
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
 ):
     results = []
@@ -332,22 +315,19 @@ async def get_commissioners(
     user_type = user_type_repo.get_by_name(db=db, name=settings.COMMISSIONER_USER_TYPE)
     if user_type is None:
         raise HTTPException(status_code=500)
-    commissioners = user_repo.get_users_by_user_type(db, user_type_id=user_type.id)
+    commissioners, next_cursor = user_repo.get_users_page_by_user_type(
+        db,
+        user_type_id=user_type.id,
+        cursor=page.cursor,
+        limit=page.limit,
+        with_profile="commissioner_profile",
+    )
 
     for commissioner in commissioners:
         attested_documents = await document_collection.find(
-            {"commissioner_id": commissioner.id}
+            {"commissioner_id": commissioner.id}, SLIM_DOCUMENT_PROJECTION
         ).to_list(length=1000)
-        documents_serialized = [
-            SlimDocumentInResponse(
-                id=str(document["_id"]),
-                name=document.get("name", ""),
-                attested_date=document.get("attestation_date", ""),
-                created_at=document.get("created_at", ""),
-                status=document.get("status", ""),
-            )
-            for document in attested_documents
-        ]
+        documents_serialized = slim_document_list_serialiser(attested_documents)
         fullcommissioner = CommissionerInResponse(
             id=commissioner.id,
             first_name=commissioner.first_name,
@@ -370,6 +350,7 @@ async def get_commissioners(
         status_code=status.HTTP_200_OK,
         message="Commissioners retireved successfully",
         data=results,
+        next_cursor=next_cursor,
     )
 
 
@@ -377,25 +358,13 @@ async def get_commissioners(
     "/get_latest_affidavits", dependencies=[Depends(admin_permission_dependency)]
 )
 async def get_latest_affidavits(
-    db: Session = Depends(get_db),
+    names: DocumentNameLoader = Depends(get_document_name_loader),
 ):
     try:
-
-        pipeline = [
-            {
-                "$match": {
-                    "$or": [{"status": "PAID"}, {"is_attested": True}],
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "total_amount": {"$sum": "$amount_paid"},
-                }
-            },
-        ]
         documents = (
-            await document_collection.aggregate(pipeline)
+            await document_collection.find(
+                {"$or": [{"status": "PAID"}, {"is_attested": True}]}
+            )
             .sort("created_at", -1)
             .to_list(length=5)
         )
@@ -403,17 +372,7 @@ async def get_latest_affidavits(
             logger.info("No documents found")
             return []
 
-        documents = serialize_mongo_document(documents)
-
-        enriched_documents = []
-        for document in documents:
-            court = court_repo.get(db, id=document["court_id"])
-            template = await template_collection.find_one(
-                {"_id": ObjectId(document["template_id"])}
-            )
-            document["court"] = court.name if court else "Unknown Court"
-            document["template"] = template["name"] if template else "Unknown Template"
-            enriched_documents.append(document)
+        enriched_documents = await names.decorate(serialize_mongo_document(documents))
 
         return create_response(
             status_code=status.HTTP_200_OK,
@@ -510,7 +469,9 @@ async def accept_invite(token: str, db: Session = Depends(get_db)):
 @router.get("/get_public_users")
 def get_public_users(db: Session = Depends(get_db)):
     user_type = user_type_repo.get_by_name(db, name=settings.PUBLIC_USER_TYPE)
-    users = user_type.users
+    users = user_repo.get_users_by_user_type(
+        db, user_type_id=user_type.id, with_profile="user_type"
+    )
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Public Users retrived Successfully",
@@ -530,8 +491,12 @@ def get_public_users(db: Session = Depends(get_db)):
 
 
 @router.get("/get_all_users")
-def get_all_users(db: Session = Depends(get_db)):
-    users = user_repo.get_all(db)
+def get_all_users(
+    page: PageParams = Depends(get_page_params), db: Session = Depends(get_db)
+):
+    users, next_cursor = user_repo.get_page(
+        db, cursor=page.cursor, limit=page.limit, with_profile="user_type"
+    )
 
     return create_response(
         status_code=status.HTTP_200_OK,
@@ -549,6 +514,7 @@ def get_all_users(db: Session = Depends(get_db)):
             )
             for user in users
         ],
+        next_cursor=next_cursor,
     )
 
 
@@ -563,12 +529,15 @@ async def get_all_admins(
 ):
     """Get all admin users"""
     user_type = user_type_repo.get_by_name(db, name=settings.ADMIN_USER_TYPE)
-    admins = user_repo.get_users_by_user_type(db, user_type_id=user_type.id)
+    admins = user_repo.get_users_by_user_type(
+        db, user_type_id=user_type.id, with_profile="invites"
+    )
+    templates_by_creator = defaultdict(list)
+    for template in await template_catalogue.all(include_disabled=True):
+        templates_by_creator[template.get("created_by_id")].append(template)
     result = []
     for admin in admins:
-        templates_created = await template_collection.find(
-            {"created_by_id": admin.id}
-        ).to_list(length=1000)
+        templates_created = templates_by_creator.get(admin.id, [])
         templates_serialized = [
             SlimTemplateInResponse(
                 id=str(template["_id"]),
@@ -635,7 +604,7 @@ def create_admin(
         raise UnauthorizedEndpointException(
             detail="You do not have permission to access this endpoint.",
         )
-    if user_repo.get_by_email(db, email=db_invite.email):
+    if user_repo.email_exists(db, email=db_invite.email):
         raise AlreadyExistsException(detail="This email address already exists.")
     admin_obj = UserCreate(
         first_name=db_invite.first_name,
@@ -646,21 +615,22 @@ def create_admin(
     )
 
     try:
-        new_admin = user_repo.create(db=db, obj_in=admin_obj)
-        verify_token = user_repo.create_verification_token(email=new_admin.email, db=db)
-        verification_link = f"{settings.ADMIN_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
-        template_dict = UserCreationTemplateVariables(
-            name=f"{new_admin.first_name} {new_admin.last_name}",
-            action_url=verification_link,
-        ).dict()
-        print(verification_link)
-        email_service.send_email_with_template(
-            db=db,
-            template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
-            template_dict=template_dict,
-            recipient=new_admin.email,
-            background_tasks=background_tasks,
-        )
+        # The user and the welcome email commit together.
+        with unit_of_work(db):
+            new_admin = user_repo.create(db=db, obj_in=admin_obj)
+            verify_token = new_admin.generate_verification_token()
+            verification_link = f"{settings.ADMIN_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
+            template_dict = UserCreationTemplateVariables(
+                name=f"{new_admin.first_name} {new_admin.last_name}",
+                action_url=verification_link,
+            ).dict()
+            email_service.send_email_with_template(
+                db=db,
+                template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
+                template_dict=template_dict,
+                recipient=new_admin.email,
+                background_tasks=background_tasks,
+            )
         return create_response(
             status_code=status.HTTP_201_CREATED,
             message="Account created successfully",
@@ -743,18 +713,34 @@ async def get_all_jurisdictions(db: Session = Depends(get_db)):
 
 @router.get("/get_jurisdiction/{jurisdiction_id}")
 async def get_jurisdiction(jurisdiction_id: str, db: Session = Depends(get_db)):
-    jurisdiction = jurisdiction_repo.get(db, id=jurisdiction_id)
-    jurisdiction_documents = []
+    jurisdiction = jurisdiction_repo.get_tree(db, id=jurisdiction_id)
     if not jurisdiction:
         raise DoesNotExistException(detail="Jurisdiction does not exist")
-    for court in jurisdiction.courts:
-        document_in = await document_collection.find(
+    court_ids = [court.id for court in jurisdiction.courts]
+    rows = await document_collection.aggregate(
+        [
+            {"$match": {"court_id": {"$in": court_ids}}},
             {
-                "court_id": court.id,
-                "status": {"$in": ["PAID", "ATTESTED"]},
-            }
-        ).to_list(length=1000)
-        jurisdiction_documents.extend(serialize_mongo_document(document_in))
+                "$group": {
+                    "_id": "$court_id",
+                    "documents": {"$sum": 1},
+                    "paid_or_attested": {
+                        "$sum": {
+                            "$cond": [
+                                {"$in": ["$status", ["PAID", "ATTESTED"]]},
+                                1,
+                                0,
+                            ]
+                        }
+                    },
+                }
+            },
+        ]
+    ).to_list(length=None)
+    court_documents = {row["_id"]: row for row in rows}
+    jurisdiction_documents = sum(
+        row["paid_or_attested"] for row in court_documents.values()
+    )
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{jurisdiction.name} Retrieved successfully",
@@ -771,9 +757,7 @@ async def get_jurisdiction(jurisdiction_id: str, db: Session = Depends(get_db)):
                     date_created=court.CreatedAt,
                     name=court.name,
                     commissioners=len(court.commissioner_profile),
-                    documents=await document_collection.count_documents(
-                        {"court_id": court.id}
-                    ),
+                    documents=court_documents.get(court.id, {}).get("documents", 0),
                 )
                 for court in jurisdiction.courts
             ],
@@ -794,11 +778,9 @@ async def get_jurisdiction(jurisdiction_id: str, db: Session = Depends(get_db)):
                     last_name=commissioner.last_name,
                     email=commissioner.email,
                 )
-                for court in jurisdiction.courts
-                for commissioner_profile in court.commissioner_profile
-                for commissioner in [commissioner_profile.user]
+                for commissioner in jurisdiction_commissioners(jurisdiction)
             ],
-            documents=len(jurisdiction_documents),
+            documents=jurisdiction_documents,
         ),
     )
 
@@ -846,7 +828,6 @@ def get_courts_by_jurisdiction(
 )
 async def get_court(court_id: str, db: Session = Depends(get_db)):
     court = court_repo.get(db, id=court_id)
-    court_documents = []
     if not court:
         raise DoesNotExistException(detail="Court does not exist")
 
@@ -854,10 +835,9 @@ async def get_court(court_id: str, db: Session = Depends(get_db)):
         {
             "court_id": court.id,
             "status": {"$in": ["PAID", "ATTESTED"]},
-        }
+        },
+        SLIM_DOCUMENT_PROJECTION,
     ).to_list(length=1000)
-
-    court_documents.extend(serialize_mongo_document(db_document))
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{court.name} Retrieved successfully",
@@ -879,17 +859,7 @@ async def get_court(court_id: str, db: Session = Depends(get_db)):
                 for commissioner_profile in court.commissioner_profile
                 for commissioner in [commissioner_profile.user]
             ],
-            documents=[
-                SlimDocumentInResponse(
-                    id=str(document.get("id")),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in court_documents
-            ],
+            documents=slim_document_list_serialiser(db_document),
         ),
     )
 
@@ -947,10 +917,13 @@ def get_state(id: int, db: Session = Depends(get_db)):
     response_model=GenericResponse[List[CourtSystemInDB]],
     dependencies=[Depends(admin_permission_dependency)],
 )
-def get_all_states(db: Session = Depends(get_db)):
+def get_all_states(request: Request, response: Response, db: Session = Depends(get_db)):
     """Return a list of all states"""
     try:
-        states = state_repo.get_all(db)
+        not_modified = conditional_response(request, response, reference_data.etag(db))
+        if not_modified:
+            return not_modified
+        states = reference_data.states(db)
         return create_response(
             status_code=status.HTTP_200_OK,
             message="Successful",
@@ -1003,6 +976,7 @@ async def create_template(
         logger.error("Failed to insert template")
         raise HTTPException(status_code=500, detail="Failed to create template")
 
+    template_catalogue.invalidate()
     new_template = await template_collection.find_one({"_id": result.inserted_id})
     return create_response(
         status_code=status.HTTP_201_CREATED,
@@ -1016,9 +990,14 @@ async def create_template(
     dependencies=[Depends(admin_permission_dependency)],
     response_model=GenericResponse[List[TemplateBase]],
 )
-async def get_templates():
+@fast_response
+async def get_templates(page: PageParams = Depends(get_page_params)):
     try:
-        templates = await template_collection.find().to_list(length=100)
+        templates, next_cursor = paginate_documents(
+            await template_catalogue.all(include_disabled=True),
+            cursor=page.cursor,
+            limit=page.limit,
+        )
         if not templates:
             logger.info("No templates found")
             return create_response(
@@ -1030,7 +1009,11 @@ async def get_templates():
         return create_response(
             status_code=status.HTTP_200_OK,
             message="Templates retrieved successfully",
-            data=serialize_mongo_document(templates),
+            data=[
+                TemplateBase(**template)
+                for template in serialize_mongo_document(templates)
+            ],
+            next_cursor=next_cursor,
         )
 
     except Exception as e:
@@ -1053,7 +1036,7 @@ async def get_template(template_id: str):
     # Log the ObjectId
     logger.info(f"Fetching template with ID: {object_id}")
 
-    template_obj = await template_collection.find_one({"_id": object_id})
+    template_obj = await template_catalogue.get(object_id)
 
     # Log the result of the query
     if template_obj:
@@ -1099,6 +1082,7 @@ async def disable_template(
     if not update_result.modified_count:
         logger.error("Failed to update template")
         raise HTTPException(status_code=500, detail="Failed to update template")
+    template_catalogue.invalidate()
 
     updated_template = await template_collection.find_one(
         {"_id": existing_template["_id"]}
@@ -1132,6 +1116,7 @@ async def enable_template(
     if not update_result.modified_count:
         logger.error("Failed to update template")
         raise HTTPException(status_code=500, detail="Failed to update template")
+    template_catalogue.invalidate()
 
     updated_template = await template_collection.find_one(
         {"_id": existing_template["_id"]}
@@ -1167,6 +1152,7 @@ async def update_template(
     if not update_result.modified_count:
         logger.error("Failed to update template")
         raise HTTPException(status_code=500, detail="Failed to update template")
+    template_catalogue.invalidate()
 
     updated_template = await template_collection.find_one(
         {"_id": existing_template["_id"]}
@@ -1237,10 +1223,13 @@ async def get_categories(db: Session = Depends(get_db)):
     categories = category_repo.get_all(db)
     full_categories = []
     for category in categories:
-        templates = (
-            await template_collection.find({"category_id": category.id})
-            .sort([("updated_at", -1), ("created_at", -1)])
-            .to_list(length=1000)
+        templates = sorted(
+            await template_catalogue.by_category(category.id, include_disabled=True),
+            key=lambda template: (
+                template.get("updated_at") or datetime.min,
+                template.get("created_at") or datetime.min,
+            ),
+            reverse=True,
         )  # Sorting by updated_at, then by created_at
         full_category = FullCategoryInResponse(
             name=category.name,
@@ -1319,10 +1308,15 @@ def update_category(category: CategoryInResponse, db: Session = Depends(get_db))
 
 
 @router.get("/get_invites", response_model=GenericResponse[List[InviteResponse]])
-def get_all_invites(db: Session = Depends(get_db)):
+def get_all_invites(
+    page: PageParams = Depends(get_page_params), db: Session = Depends(get_db)
+):
     current_time = datetime.utcnow().replace(tzinfo=timezone.utc)
-    invites = (
-        db.query(
+    invites, next_cursor = user_invite_repo.get_page(
+        db,
+        cursor=page.cursor,
+        limit=page.limit,
+        query=db.query(
             UserInvite.id,
             UserInvite.first_name,
             UserInvite.last_name,
@@ -1332,9 +1326,7 @@ def get_all_invites(db: Session = Depends(get_db)):
             UserInvite.CreatedAt,
             UserType.name.label("user_type"),
             UserType.id.label("user_type_id"),
-        )
-        .join(UserType, UserInvite.user_type_id == UserType.id)
-        .all()
+        ).join(UserType, UserInvite.user_type_id == UserType.id),
     )
 
     result = []
@@ -1375,6 +1367,7 @@ def get_all_invites(db: Session = Depends(get_db)):
         data=result,
         message="User invites retrieved successfully",
         status_code=status.HTTP_200_OK,
+        next_cursor=next_cursor,
     )
 
 
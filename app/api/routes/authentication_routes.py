@@ -35,14 +35,12 @@ from app.schemas.user_schema import (
 from app.schemas.user_type_schema import UserTypeInDB
 from commonLib.response.response_schema import GenericResponse, create_response
 from app.core.services.email import email_service
-from app.core.settings.security import security
 
 router = APIRouter()
 
 
 def check_unique_user(db: Session, user_in: UserCreate):
-    user_with_same_email = user_repo.get_by_email(db, email=user_in.email)
-    if user_with_same_email:
+    if user_repo.email_exists(db, email=user_in.email):
         raise AlreadyExistsException(
             entity_name="user with email {}".format(user_in.email)
         )
@@ -143,10 +141,10 @@ def resend_token(
     template_dict = UserVerificationTemplateVariables(
         name=f"{user.first_name} {user.last_name}", action_url=verification_link
     ).dict()
-    background_task.add_task(
-        email_service.send_email_with_template,
-        client=core.PostmarkClient(server_token=settings.POSTMARK_API_TOKEN),
+    email_service.send_email_with_template(
         template_id=settings.VERIFY_EMAIL_TEMPLATE_ID,
+        db=db,
+        background_tasks=background_task,
         template_dict=template_dict,
         recipient=user.email,
     )
@@ -249,15 +247,7 @@ def change_password(
     if not current_user.verify_password(password_in.old_password):
         raise UnauthorizedEndpointException(detail="Incorrect Password")
 
-    user_repo.update(
-        db,
-        db_obj=current_user,
-        obj_in={
-            "hashed_password": security.get_password_hash(
-                password=password_in.new_password
-            )
-        },
-    )
+    user_repo.update_password(db, current_user, password_in.new_password)
 
     return create_response(
         status_code=status.HTTP_200_OK,
@@ -271,7 +261,9 @@ def update_user(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
-    update_user = user_repo.update(db, db_obj=current_user, obj_in=user_in)
+    update_user = user_repo.update_columns(
+        db, id=current_user.id, values=user_in.dict(exclude_unset=True)
+    )
 
     return create_response(
         message="Account Profile Updated Successfully",
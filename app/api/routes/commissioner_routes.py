@@ -23,6 +23,7 @@ from app.repositories.user_repo import user_repo
 from app.repositories.user_type_repo import user_type_repo
 from app.core.settings.configurations import settings
 from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
     AttestDocument,
     DocumentBase,
     SlimDocumentInResponse,
@@ -30,6 +31,7 @@ from app.schemas.affidavit_schema import (
     UpdateDocument,
     document_individual_serializer,
     serialize_mongo_document,
+    slim_document_list_serialiser,
 )
 from app.schemas.court_system_schema import CourtSystemBase, CourtSystemInDB
 from app.schemas.user_schema import (
@@ -51,7 +53,10 @@ from app.database.sessions.mongo_client import document_collection
 from app.repositories.commissioner_profile_repo import comm_profile_repo
 from app.schemas.user_type_schema import UserTypeInDB
 from commonLib.response.response_schema import GenericResponse, create_response
+from commonLib.repositories.unit_of_work import unit_of_work
 from app.core.services.email import email_service
+from app.core.services.reports import document_reports
+from app.core.services.stats import stats_service
 
 router = APIRouter()
 
@@ -79,22 +84,15 @@ async def get_commissioners(
         )
         if user_type is None:
             raise HTTPException(status_code=500)
-        commissioners = user_repo.get_users_by_user_type(db, user_type_id=user_type.id)
+        commissioners = user_repo.get_users_by_user_type(
+            db, user_type_id=user_type.id, with_profile="commissioner_profile"
+        )
         # return commissioners[0].commissioner_profile.court
         for commissioner in commissioners:
             attested_documents = await document_collection.find(
-                {"commissioner_id": commissioner.id}
+                {"commissioner_id": commissioner.id}, SLIM_DOCUMENT_PROJECTION
             ).to_list(length=1000)
-            documents_serialized = [
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    attested_date=document.get("attestation_date", ""),
-                    created_at=document.get("created_at",""),
-                    status=document.get("status","")
-                )
-                for document in attested_documents
-            ]
+            documents_serialized = slim_document_list_serialiser(attested_documents)
             fullcommissioner = CommissionerInResponse(
                 id=commissioner.id,
                 first_name=commissioner.first_name,
@@ -144,7 +142,7 @@ async def create_commissioner(
         )
 
     # Check if the email is already used
-    if user_repo.get_by_email(db=db, email=db_invite.email):
+    if user_repo.email_exists(db, email=db_invite.email):
         raise HTTPException(
             status_code=409,
             detail=f"User with email {db_invite.email} already exists.",
@@ -159,33 +157,31 @@ async def create_commissioner(
         email=db_invite.email,
     )
     try:
-        db_commissioner = user_repo.create(db=db, obj_in=commissioner_obj)
-        if db_commissioner:
+        # The user, their profile and the welcome email commit together.
+        with unit_of_work(db):
+            db_commissioner = user_repo.create(db=db, obj_in=commissioner_obj)
             commissioner_profile_in = CommissionerProfileCreate(
                 commissioner_id=db_commissioner.id,
                 court_id=db_invite.court_id,
                 created_by_id=db_invite.invited_by_id,
             )
             comm_profile_repo.create(db=db, obj_in=commissioner_profile_in)
-        verify_token = user_repo.create_verification_token(
-            email=db_commissioner.email, db=db
-        )
-        
-        verification_link = (
-            f"{settings.COURT_SYSTEM_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
-        )
-        template_dict = UserCreationTemplateVariables(
-            name=f"{db_commissioner.first_name} {db_commissioner.last_name}",
-            action_url=verification_link,
-        ).dict()
-        print(verification_link)
-        email_service.send_email_with_template(
-            db=db,
-            template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
-            template_dict=template_dict,
-            recipient=db_commissioner.email,
-            background_tasks=background_tasks,
-        )
+            verify_token = db_commissioner.generate_verification_token()
+
+            verification_link = (
+                f"{settings.COURT_SYSTEM_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
+            )
+            template_dict = UserCreationTemplateVariables(
+                name=f"{db_commissioner.first_name} {db_commissioner.last_name}",
+                action_url=verification_link,
+            ).dict()
+            email_service.send_email_with_template(
+                db=db,
+                template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
+                template_dict=template_dict,
+                recipient=db_commissioner.email,
+                background_tasks=background_tasks,
+            )
         return create_response(
             status_code=status.HTTP_201_CREATED,
             message="Account created successfully",
@@ -363,6 +359,7 @@ async def update_document(
 
 
 
+    document = await document_collection.find_one({"_id": ObjectId(document_id)})
     update_result = await document_collection.update_one(
         {"_id": ObjectId(document_id)}, {"$set": document_data}
     )
@@ -377,6 +374,8 @@ async def update_document(
     )
     if not updated_document:
         raise HTTPException(status_code=404, detail="Document not found after update.")
+    await stats_service.record_transition(document, updated_document)
+    await document_reports.invalidate_for_document(updated_document)
     attested_document = serialize_mongo_document(updated_document)
     return create_response(
         status_code=status.HTTP_200_OK,
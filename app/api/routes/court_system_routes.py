@@ -1,6 +1,6 @@
 from typing import List
 from uuid import uuid4
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from loguru import logger
 from sqlalchemy.orm import Session
 from app.api.dependencies.db import get_db
@@ -10,6 +10,7 @@ from app.core.errors.exceptions import (
     ServerException,
     UnauthorizedEndpointException,
 )
+from app.core.services.reference_data import reference_data
 from app.database.sessions.session import SessionLocal
 from app.models.user_model import User
 from app.repositories.court_system_repo import (
@@ -26,13 +27,16 @@ from app.api.dependencies.authentication import (
 from app.models.court_system_models import Court, Jurisdiction, State
 from app.repositories.head_of_unit_repo import head_of_unit_repo
 from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
     SlimDocumentInResponse,
     serialize_mongo_document,
+    slim_document_list_serialiser,
 )
 from app.schemas.court_system_schema import (
     CourtInResponse,
     CourtSystemBase,
     CourtSystemInDB,
+    CourtSystemTree,
     CreateCourt,
     CreateJurisdiction,
     FullCourtInDB,
@@ -46,6 +50,7 @@ from app.schemas.user_schema import (
 
 
 from app.schemas.user_type_schema import UserTypeInDB
+from commonLib.response.conditional import conditional_response
 from commonLib.response.response_schema import GenericResponse, create_response
 from app.core.settings.configurations import settings
 
@@ -110,6 +115,7 @@ def populate_data(session):
         session.add(court)
 
     session.commit()
+    reference_data.invalidate()
 
 
 # def get_courts_under_jurisdiction(session, jurisdiction_name):
@@ -166,10 +172,13 @@ def create_state(state: CourtSystemBase, db: Session = Depends(get_db)):
     response_model=GenericResponse[List[CourtSystemInDB]],
     dependencies=[Depends(admin_permission_dependency)],
 )
-def get_all_states(db: Session = Depends(get_db)):
+def get_all_states(request: Request, response: Response, db: Session = Depends(get_db)):
     """Return a list of all states"""
     try:
-        states = state_repo.get_all(db)
+        not_modified = conditional_response(request, response, reference_data.etag(db))
+        if not_modified:
+            return not_modified
+        states = reference_data.states(db)
         return create_response(
             status_code=status.HTTP_200_OK,
             message="Successful",
@@ -181,6 +190,29 @@ def get_all_states(db: Session = Depends(get_db)):
         logger.error(e)
 
 
+@router.get(
+    "/tree",
+    status_code=status.HTTP_200_OK,
+    response_model=GenericResponse[CourtSystemTree],
+)
+def get_court_system_tree(
+    request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Every state with its jurisdictions and their courts in one response.
+    Send the returned ETag back as If-None-Match to get a 304 when nothing changed.
+    """
+    tree, etag = reference_data.tree(db)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    return create_response(
+        status_code=status.HTTP_200_OK,
+        message="Court system retrieved successfully",
+        data=tree,
+    )
+
+
 @router.get(
     "/state/{id}",
     status_code=status.HTTP_200_OK,
@@ -246,18 +278,20 @@ def create_jurisdiction(
     response_model=GenericResponse[List[CourtSystemInDB]],
     dependencies=[Depends(admin_permission_dependency)],
 )
-def get_all_jurisdictions(db: Session = Depends(get_db)):
+def get_all_jurisdictions(
+    request: Request, response: Response, db: Session = Depends(get_db)
+):
     """Return a list of all jurisdictions"""
     try:
-        jurisdictions = jurisdiction_repo.get_all(db)
+        not_modified = conditional_response(request, response, reference_data.etag(db))
+        if not_modified:
+            return not_modified
+        jurisdictions = reference_data.jurisdictions(db)
 
         return create_response(
             status_code=status.HTTP_200_OK,
             message="Jurisdictions Retrieved Successfully",
-            data=[
-                CourtSystemInDB(id=jurisdiction.id, name=jurisdiction.name)
-                for jurisdiction in jurisdictions
-            ],
+            data=jurisdictions,
         )
     except Exception as e:
         logger.error(e)
@@ -283,7 +317,7 @@ def get_jurisdiction(
             detail="This court is not in your jurisdiction"
         )
     try:
-        jurisdiction = jurisdiction_repo.get(db, id=jurisdiction_id)
+        jurisdiction = jurisdiction_repo.get_tree(db, id=jurisdiction_id)
 
         if not jurisdiction:
             raise DoesNotExistException(
@@ -329,7 +363,6 @@ async def get_all_courts(
 ):
     """Return a list of all courts"""
     try:
-        documents = []
         if current_user.user_type.name == settings.HEAD_OF_UNIT_USER_TYPE:
             courts = head_of_unit_repo.get_courts_under_jurisdiction(
                 db=db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
@@ -337,13 +370,13 @@ async def get_all_courts(
         else:
             courts = court_repo.get_all(db)
 
-        for court in courts:
-            db_documents = document_collection.find({"court_id": court.id}).to_list(
-                length=1000
-            )
-            documents.append(
-                serialize_mongo_document(document) for document in db_documents
-            )
+        documents = {court.id: [] for court in courts}
+        db_documents = document_collection.find(
+            {"court_id": {"$in": list(documents)}},
+            {**SLIM_DOCUMENT_PROJECTION, "court_id": 1},
+        )
+        async for document in db_documents:
+            documents[document["court_id"]].append(document)
 
         return create_response(
             status_code=status.HTTP_200_OK,
@@ -366,17 +399,7 @@ async def get_all_courts(
                         )
                         for commissioner in court.commissioner_profile
                     ],
-                    documents=[
-                        SlimDocumentInResponse(
-                            id=str(document["_id"]),
-                            name=document.get("name", ""),
-                            price=document.get("price", 0),
-                            attestation_date=document.get("attest", ""),
-                            created_at=document.get("created_at", ""),
-                            status=document.get("status", ""),
-                        )
-                        for document in documents
-                    ],
+                    documents=slim_document_list_serialiser(documents[court.id]),
                 )
                 for court in courts
             ],
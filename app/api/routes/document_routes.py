@@ -0,0 +1,46 @@
+import hashlib
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request, Response, status
+
+from app.core.errors.exceptions import DoesNotExistException
+from app.core.services.qr_code import qr_code_service
+from app.core.services.utils.cache import LRUCache
+from app.core.services.utils.utils import get_document_verification_url
+from app.core.settings.configurations import settings
+from app.database.sessions.mongo_client import document_collection
+
+router = APIRouter()
+
+QR_MEDIA_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+QR_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+qr_cache = LRUCache(maxsize=settings.QR_CODE_CACHE_SIZE)
+
+
+@router.get("/{document_name}/qr")
+async def get_document_qr_code(
+    document_name: str,
+    request: Request,
+    format: Literal["png", "svg"] = Query("png"),
+):
+    cached = qr_cache.get((document_name, format))
+    if cached is None:
+        document = await document_collection.find_one(
+            {"name": document_name}, {"_id": 1}
+        )
+        if not document:
+            raise DoesNotExistException(detail="Document not found")
+
+        image = await qr_code_service.render_image(
+            get_document_verification_url(document_name), format
+        )
+        etag = f'"{hashlib.sha1(image).hexdigest()}"'
+        cached = (image, etag)
+        qr_cache.set((document_name, format), cached)
+
+    image, etag = cached
+    headers = {"ETag": etag, "Cache-Control": QR_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=image, media_type=QR_MEDIA_TYPES[format], headers=headers)
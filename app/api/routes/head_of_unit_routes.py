@@ -9,13 +9,14 @@ from app.schemas.report_schema import (
 )
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api.dependencies.authentication import (
     get_currently_authenticated_user,
     head_of_unit_permission_dependency,
     admin_permission_dependency,
 )
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db, get_db
 from app.core.errors.exceptions import (
     AlreadyExistsException,
     DoesNotExistException,
@@ -29,8 +30,10 @@ from app.repositories.head_of_unit_repo import head_of_unit_repo
 from app.repositories.user_type_repo import user_type_repo
 from app.core.settings.configurations import settings
 from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
     SlimDocumentInResponse,
     serialize_mongo_document,
+    slim_document_list_serialiser,
 )
 from app.schemas.court_system_schema import CourtBase, CourtInResponse, CourtSystemInDB
 from app.schemas.shared_schema import DateRange, SlimUserInResponse
@@ -52,7 +55,10 @@ from app.repositories.commissioner_profile_repo import comm_profile_repo
 from app.schemas.user_type_schema import UserTypeInDB
 from app.repositories.court_system_repo import court_repo
 from commonLib.response.response_schema import create_response, GenericResponse
+from commonLib.repositories.unit_of_work import unit_of_work
 from app.core.services.email import email_service
+from app.core.services.dashboard import get_head_of_unit_dashboard
+from app.core.services.reports import report_engine
 
 
 router = APIRouter()
@@ -63,65 +69,17 @@ router = APIRouter()
     # dependencies=[Depends(admin_permission_dependency)]
 )
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
     """
     This endpoint returns statistics about users, invitations, affidavits, commissioners, courts, and revenue in the system.
     """
-    # Get courts under jurisdiction
-    total_courts = head_of_unit_repo.get_courts_under_jurisdiction(
-        db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
-    )
-
-    total_affidavits = []
-    total_revenue = 0
-    total_commissioners = head_of_unit_repo.get_commissioners_under_jurisdiction(
-        db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
-    )
-
-    # Loop through each court and get affidavits and revenue
-    for court in total_courts:
-        pipeline = [
-            {
-                "$match": {
-                    "court_id": court.id,
-                    "$or": [{"status": "PAID"}, {"is_attested": True}],
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "total_amount": {"$sum": "$price"},
-                    "documents": {"$push": "$$ROOT"},
-                }
-            },
-        ]
-        results = await document_collection.aggregate(pipeline).to_list(length=1)
-        if results and results[0]:
-            total_revenue += results[0]["total_amount"]
-            documents = [
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", None),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in results[0].get("documents", [])
-            ]
-            total_affidavits.append(documents)
-
-    # Create and return response
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Dashboard Stats fetched successfully.",
-        data=HeadOfUnitDashboardStat(
-            total_courts=len(total_courts),
-            total_commissioners=len(total_commissioners),
-            total_affidavits=sum(len(docs) for docs in total_affidavits),
-            total_revenue=total_revenue,
+        data=await get_head_of_unit_dashboard(
+            db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
         ),
     )
 
@@ -145,21 +103,9 @@ async def get_all_courts(
 
         for court in courts:
             db_documents = await document_collection.find(
-                {"court_id": court.id}
+                {"court_id": court.id}, SLIM_DOCUMENT_PROJECTION
             ).to_list(length=1000)
-            documents = [
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=(
-                        document.get("attest") if document.get("attest", "") else None
-                    ),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in db_documents
-            ]
+            documents = slim_document_list_serialiser(db_documents)
 
             courts_data.append(
                 {
@@ -215,7 +161,6 @@ async def get__court(
             detail="This court is not in your jurisdiction"
         )
     court = court_repo.get(db, id=court_id)
-    court_documents = []
     if not court:
         raise DoesNotExistException(detail="Court does not exist")
 
@@ -223,12 +168,9 @@ async def get__court(
         {
             "court_id": court.id,
             "status": {"$in": ["PAID", "ATTESTED"]},
-        }
+        },
+        SLIM_DOCUMENT_PROJECTION,
     ).to_list(length=1000)
-    # db_template = await template_collection.find({
-    #     "_id": ObjectId(document_in['document_in'])
-    # })
-    court_documents.extend(serialize_mongo_document(db_document))
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{court.name} Retrieved successfully",
@@ -250,17 +192,7 @@ async def get__court(
                 for commissioner_profile in court.commissioner_profile
                 for commissioner in [commissioner_profile.user]
             ],
-            documents=[
-                SlimDocumentInResponse(
-                    id=str(document.get("id")),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=document.get("attest", ""),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in court_documents
-            ],
+            documents=slim_document_list_serialiser(db_document),
         ),
     )
     # return create_response(
@@ -313,21 +245,9 @@ async def get_commissioners(
     commissioners = [commissioner.user for commissioner in commissioner_profiles]
     for commissioner in commissioners:
         attested_documents = await document_collection.find(
-            {"commissioner_id": commissioner.id}
+            {"commissioner_id": commissioner.id}, SLIM_DOCUMENT_PROJECTION
         ).to_list(length=1000)
-        documents_serialized = [
-            SlimDocumentInResponse(
-                id=str(document["_id"]),
-                name=document.get("name", ""),
-                price=document.get("price", 0),
-                attestation_date=(
-                    document.get("attest") if document.get("attest", "") else None
-                ),
-                created_at=document.get("created_at", ""),
-                status=document.get("status", ""),
-            )
-            for document in attested_documents
-        ]
+        documents_serialized = slim_document_list_serialiser(attested_documents)
         fullcommissioner = CommissionerInResponse(
             id=commissioner.id,
             first_name=commissioner.first_name,
@@ -381,7 +301,7 @@ async def create_head_of_unit(
         )
 
     # Check if the email is already used
-    if user_repo.get_by_email(db=db, email=db_invite.email):
+    if user_repo.email_exists(db, email=db_invite.email):
         raise HTTPException(
             status_code=409,
             detail=f"User with email {db_invite.email} already exists.",
@@ -396,30 +316,28 @@ async def create_head_of_unit(
         email=db_invite.email,
     )
     try:
-        db_head_of_unit = user_repo.create(db=db, obj_in=head_of_unit_obj)
-        if db_head_of_unit:
+        # The user, their head of unit record and the welcome email commit together.
+        with unit_of_work(db):
+            db_head_of_unit = user_repo.create(db=db, obj_in=head_of_unit_obj)
             head_of_unit_in = HeadOfUnitBase(
                 head_of_unit_id=db_head_of_unit.id,
                 jurisdiction_id=db_invite.jurisdiction_id,
                 created_by_id=db_invite.invited_by_id,
             )
             head_of_unit_repo.create(db=db, obj_in=head_of_unit_in)
-        verify_token = user_repo.create_verification_token(
-            email=db_head_of_unit.email, db=db
-        )
-        verification_link = f"{settings.COURT_SYSTEM_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
-        template_dict = UserCreationTemplateVariables(
-            name=f"{db_head_of_unit.first_name} {db_head_of_unit.last_name}",
-            action_url=verification_link,
-        ).dict()
-        print(verification_link)
-        email_service.send_email_with_template(
-            db=db,
-            template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
-            template_dict=template_dict,
-            recipient=db_head_of_unit.email,
-            background_tasks=background_tasks,
-        )
+            verify_token = db_head_of_unit.generate_verification_token()
+            verification_link = f"{settings.COURT_SYSTEM_FRONTEND_BASE_URL}{settings.VERIFY_EMAIL_LINK}{verify_token}"
+            template_dict = UserCreationTemplateVariables(
+                name=f"{db_head_of_unit.first_name} {db_head_of_unit.last_name}",
+                action_url=verification_link,
+            ).dict()
+            email_service.send_email_with_template(
+                db=db,
+                template_id=settings.CREATE_ACCOUNT_TEMPLATE_ID,
+                template_dict=template_dict,
+                recipient=db_head_of_unit.email,
+                background_tasks=background_tasks,
+            )
         return create_response(
             status_code=status.HTTP_201_CREATED,
             message="Account created successfully",
@@ -525,65 +443,9 @@ async def get_all_commissioners_report(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
-    commissioner_profiles = head_of_unit_repo.get_commissioners_under_jurisdiction(
-        db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
+    results = await report_engine.commissioners_report(
+        db, date_range, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
     )
-    results = []
-    if date_range.from_date:
-        date_range.from_date = datetime.datetime.strptime(
-            date_range.from_date, "%Y-%m-%d"
-        )
-    if date_range.to_date:
-        date_range.to_date = datetime.datetime.strptime(
-            date_range.to_date, "%Y-%m-%d"
-        ) + datetime.timedelta(days=1)
-
-    commissioners = [commissioner.user for commissioner in commissioner_profiles]
-
-    for commissioner in commissioners:
-
-        query = {
-            "is_attested": True,
-            "commissioner_id": commissioner.id,
-            "attestation_date": {},
-        }
-        if date_range.from_date:
-            query["attestation_date"]["$gte"] = date_range.from_date
-        if date_range.to_date:
-            query["attestation_date"]["$lt"] = date_range.to_date
-        if not query["attestation_date"]:
-            del query["attestation_date"]
-        attested_documents = await document_collection.find(query).to_list(length=1000)
-
-        commissioner_report = CommissionersReport(
-            attested_documents=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=(
-                        document.get("attest") if document.get("attest", "") else None
-                    ),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in attested_documents
-            ],
-            commissioner=FullCommissionerInResponse(
-                id=commissioner.id,
-                first_name=commissioner.first_name,
-                last_name=commissioner.last_name,
-                email=commissioner.email,
-                court=CourtSystemInDB(
-                    id=commissioner.commissioner_profile.court.id,
-                    name=commissioner.commissioner_profile.court.name,
-                ),
-                is_active=commissioner.is_active,
-                date_created=commissioner.CreatedAt,
-            ),
-        )
-
-        results.append(commissioner_report)
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Commissioners retireved successfully",
@@ -595,72 +457,22 @@ async def get_all_commissioners_report(
     # response_model=GenericResponse[CommissionersReport],
     dependencies=[Depends(head_of_unit_permission_dependency)],
 )
-async def get_all_commissioners_report(
+async def get_all_commissioners_report_by_court(
+    court_id: str,
     date_range: DateRange,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
-    # commissioner_profiles = head_of_unit_repo.get_commissioners_under_jurisdiction(
-    #     db, jurisdiction_id=current_user.head_of_unit.jurisdiction_id
-    # )
-    court = court_repo.get(db, id)
-    commissioner_profiles = court.commissioner_profile
-    results = []
-    if date_range.from_date:
-        date_range.from_date = datetime.datetime.strptime(
-            date_range.from_date, "%Y-%m-%d"
-        )
-    if date_range.to_date:
-        date_range.to_date = datetime.datetime.strptime(
-            date_range.to_date, "%Y-%m-%d"
-        ) + datetime.timedelta(days=1)
-
-    commissioners = [commissioner.user for commissioner in commissioner_profiles]
-
-    for commissioner in commissioners:
-
-        query = {
-            "is_attested": True,
-            "commissioner_id": commissioner.id,
-            "attestation_date": {},
-        }
-        if date_range.from_date:
-            query["attestation_date"]["$gte"] = date_range.from_date
-        if date_range.to_date:
-            query["attestation_date"]["$lt"] = date_range.to_date
-        if not query["attestation_date"]:
-            del query["attestation_date"]
-        attested_documents = await document_collection.find(query).to_list(length=1000)
-
-        commissioner_report = CommissionersReport(
-            attested_documents=[
-                SlimDocumentInResponse(
-                    id=str(document["_id"]),
-                    name=document.get("name", ""),
-                    price=document.get("price", 0),
-                    attestation_date=(
-                        document.get("attest") if document.get("attest", "") else None
-                    ),
-                    created_at=document.get("created_at", ""),
-                    status=document.get("status", ""),
-                )
-                for document in attested_documents
-            ],
-            commissioner=FullCommissionerInResponse(
-                id=commissioner.id,
-                first_name=commissioner.first_name,
-                last_name=commissioner.last_name,
-                email=commissioner.email,
-                court=CourtSystemInDB(
-                    id=commissioner.commissioner_profile.court.id,
-                    name=commissioner.commissioner_profile.court.name,
-                ),
-                is_active=commissioner.is_active,
-                date_created=commissioner.CreatedAt,
-            ),
+    court = court_repo.get(db, id=court_id)
+    if not court:
+        raise DoesNotExistException(detail="Court does not exist")
+    if court.jurisdiction_id != current_user.head_of_unit.jurisdiction_id:
+        raise UnauthorizedEndpointException(
+            detail="This court is not in your jurisdiction"
         )
-
-        results.append(commissioner_report)
+    results = await report_engine.commissioners_report(
+        db, date_range, court_id=court.id
+    )
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Commissioners retireved successfully",
@@ -678,67 +490,13 @@ async def get_commissioner_report(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
-    print(commissioner_id)
-    commissioner = user_repo.get(db, id=commissioner_id)
-
-    if not commissioner:
-        raise DoesNotExistException(detail="This commissioner does not exist")
-    if (
-        commissioner.commissioner_profile.court.jurisdiction_id
-        != current_user.head_of_unit.jurisdiction_id
-    ):
-        raise UnauthorizedEndpointException(
-            detail="You cannot view this commissioner's report"
-        )
-
-    if date_range.from_date:
-        date_range.from_date = d = datetime.datetime.strptime(
-            date_range.from_date, "%m/%d/%Y"
-        )
-    else:
-        date_range.from_date = None
-
-    if date_range.to_date:
-        date_range.to_date = d = datetime.datetime.strptime(
-            date_range.to_date, "%m/%d/%Y"
-        )
-    else:
-        date_range.to_date = None
-    query = {
-        "is_attested": True,
-        "commissioner_id": commissioner.id,
-        "attestation_date": {},
-    }
-    if date_range.from_date:
-        query["attestation_date"]["$gte"] = date_range.from_date
-    if date_range.to_date:
-        query["attestation_date"]["$lt"] = date_range.to_date
-    if not query["attestation_date"]:
-        del query["attestation_date"]
-    attested_documents = await document_collection.find(query).to_list(length=1000)
-
-    commissioner_report = CommissionerReport(
-        attested_documents=[
-            DocumentReports(
-                name=document.get("name", ""),
-                attested_date=(document.get("attestation_date", "")),
-                date_created=(document.get("created_at", "")),
-            )
-            for document in attested_documents
-        ],
-        commissioner=FullCommissionerInResponse(
-            id=commissioner.id,
-            first_name=commissioner.first_name,
-            last_name=commissioner.last_name,
-            email=commissioner.email,
-            court=CourtSystemInDB(
-                id=commissioner.commissioner_profile.court.id,
-                name=commissioner.commissioner_profile.court.name,
-            ),
-            is_active=str(commissioner.is_active),
-            date_created=str(commissioner.CreatedAt),
-        ),
+    commissioner_report = await report_engine.commissioner_report(
+        db,
+        commissioner_id,
+        date_range,
+        jurisdiction_id=current_user.head_of_unit.jurisdiction_id,
     )
+    commissioner = commissioner_report.commissioner
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{commissioner.first_name} {commissioner.last_name} report retireved successfully",
@@ -1,14 +1,144 @@
-from fastapi import APIRouter
+from typing import Literal, Optional
 
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
 
+from app.api.dependencies.authentication import (
+    admin_and_head_of_unit_permission_dependency,
+    get_currently_authenticated_user,
+)
+from app.api.dependencies.db import get_db
+from app.core.errors.exceptions import (
+    DoesNotExistException,
+    UnauthorizedEndpointException,
+)
+from app.core.services.exports import (
+    COMMISSIONER_EXPORT_COLUMNS,
+    DOCUMENT_EXPORT_COLUMNS,
+    export_service,
+)
+from app.core.services.reports import document_reports, report_date_range
+from app.core.settings.configurations import settings
+from app.models.user_model import User
+from app.repositories.court_system_repo import court_repo
+from app.schemas.report_schema import DocumentTimeSeriesReport
+from commonLib.response.response_schema import GenericResponse, create_response
+from commonLib.response.stream_response import ExportFormat, stream_rows
 
 
 router = APIRouter()
 
 
+def get_report_jurisdiction_id(
+    db: Session, current_user: User, court_id: Optional[str] = None
+) -> Optional[str]:
+    """Heads of unit are limited to their own jurisdiction; admins see everything."""
+    jurisdiction_id = None
+    if current_user.user_type.name == settings.HEAD_OF_UNIT_USER_TYPE:
+        jurisdiction_id = current_user.head_of_unit.jurisdiction_id
+    if court_id:
+        court = court_repo.get(db, id=court_id)
+        if not court:
+            raise DoesNotExistException(detail="Court does not exist")
+        if jurisdiction_id and court.jurisdiction_id != jurisdiction_id:
+            raise UnauthorizedEndpointException(
+                detail="This court is not in your jurisdiction"
+            )
+    return jurisdiction_id
 
 
+@router.get(
+    "/documents",
+    response_model=GenericResponse[DocumentTimeSeriesReport],
+    dependencies=[Depends(admin_and_head_of_unit_permission_dependency)],
+)
+async def get_document_report(
+    dimension: Literal["court", "template", "status", "commissioner"] = "court",
+    granularity: Literal["day", "week", "month"] = "month",
+    from_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    to_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_currently_authenticated_user),
+):
+    """
+    Documents and revenue per period, grouped by court, template, status or
+    commissioner. Heads of unit only see their own jurisdiction.
+    """
+    jurisdiction_id = get_report_jurisdiction_id(db, current_user)
+    report = await document_reports.time_series(
+        db,
+        dimension=dimension,
+        granularity=granularity,
+        date_range=report_date_range(from_date, to_date),
+        jurisdiction_id=jurisdiction_id,
+    )
+    return create_response(
+        status_code=status.HTTP_200_OK,
+        message=f"Document report by {dimension} retrieved successfully",
+        data=report,
+    )
 
-@router.get("/")
-def report():
-    return "kalakdfklkdlf"
\ No newline at end of file
+
+@router.get(
+    "/documents/export",
+    dependencies=[Depends(admin_and_head_of_unit_permission_dependency)],
+)
+def export_documents(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    court_id: Optional[str] = None,
+    commissioner_id: Optional[str] = None,
+    document_status: Optional[str] = Query(None, alias="status"),
+    from_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    to_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_currently_authenticated_user),
+):
+    """Stream every matching document as CSV or NDJSON, filtered on created_at."""
+    jurisdiction_id = get_report_jurisdiction_id(db, current_user, court_id)
+    rows = export_service.document_rows(
+        date_range=report_date_range(from_date, to_date),
+        jurisdiction_id=jurisdiction_id,
+        court_id=court_id,
+        commissioner_id=commissioner_id,
+        document_status=document_status,
+    )
+    return stream_rows(
+        rows,
+        DOCUMENT_EXPORT_COLUMNS,
+        export_format=export_format,
+        filename="documents",
+        batch_size=export_service.batch_size,
+    )
+
+
+@router.get(
+    "/commissioners/export",
+    dependencies=[Depends(admin_and_head_of_unit_permission_dependency)],
+)
+def export_commissioners_report(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    court_id: Optional[str] = None,
+    commissioner_id: Optional[str] = None,
+    from_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    to_date: Optional[str] = Query(None, description="YYYY-MM-DD or MM/DD/YYYY"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_currently_authenticated_user),
+):
+    """
+    Stream the commissioners report as one row per attested document, with the
+    same filters as the head of unit report endpoints.
+    """
+    jurisdiction_id = get_report_jurisdiction_id(db, current_user, court_id)
+    rows = export_service.commissioner_rows(
+        date_range=report_date_range(from_date, to_date),
+        jurisdiction_id=jurisdiction_id,
+        court_id=court_id,
+        commissioner_id=commissioner_id,
+    )
+    return stream_rows(
+        rows,
+        COMMISSIONER_EXPORT_COLUMNS,
+        export_format=export_format,
+        filename="commissioners_report",
+        batch_size=export_service.batch_size,
+    )
@@ -4,6 +4,7 @@ from fastapi import APIRouter
 from app.api.routes import (
     authentication_routes,
     user_routes,
+    document_routes,
     user_type_routes,
     court_system_routes,
     commissioner_routes,
@@ -29,6 +30,9 @@ router.include_router(court_system_routes.router, tags=["Court System"], prefix=
 # Routes for managing user entities
 router.include_router(user_routes.router, tags=["Users"], prefix="/users")
 
+# Public document resources such as verification QR codes
+router.include_router(document_routes.router, tags=["Documents"], prefix="/documents")
+
 
 
 
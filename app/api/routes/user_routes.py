@@ -1,18 +1,31 @@
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import uuid
+from app.core.services.qr_code import qr_code_service
+from app.core.services.dashboard import get_public_dashboard
+from app.core.services.document_names import DocumentNameLoader
+from app.core.services.reference_data import reference_data
+from app.core.services.template_catalogue import template_catalogue
+from app.core.services.stats import stats_service
 from app.core.services.utils.utils import (
     extract_preview_text_from_document,
     generate_document_name,
-    generate_qr_code_base64,
+    get_document_verification_url,
     is_valid_objectid,
 )
-from app.models.court_system_models import Court, Jurisdiction
 from app.schemas.category_schema import CategoryInResponse, FullCategoryInResponse
 from app.schemas.court_system_schema import CourtSystemInDB
 from app.schemas.shared_schema import SlimUserInResponse
 from bson import ObjectId
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.exc import IntegrityError
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -21,6 +34,11 @@ from app.api.dependencies.authentication import (
     authenticated_user_dependencies,
 )
 from app.api.dependencies.db import get_db
+from app.api.dependencies.loaders import (
+    get_async_document_name_loader,
+    get_document_name_loader,
+)
+from app.api.dependencies.pagination import PageParams, get_page_params
 from app.core.errors.exceptions import (
     AlreadyExistsException,
     DoesNotExistException,
@@ -36,11 +54,13 @@ from app.schemas.affidavit_schema import (
     DocumentCreate,
     DocumentCreateForm,
     DocumentPayment,
+    DOCUMENT_SUMMARY_PROJECTION,
     DocumentSearchResponse,
     LastestAffidavits,
     ReceiptInResponse,
     SearchResult,
     SlimDocumentInResponse,
+    SlimTemplateInResponse,
     TemplateBase,
     TemplateContent,
     TemplateInResponse,
@@ -48,7 +68,7 @@ from app.schemas.affidavit_schema import (
     serialize_mongo_document,
     template_list_serialiser,
 )
-from app.repositories.court_system_repo import state_repo
+from commonLib.response.conditional import conditional_response
 from app.schemas.email_schema import UserCreationTemplateVariables
 from app.schemas.stats_schema import PublicDashboardStat
 from app.schemas.user_schema import (
@@ -57,10 +77,11 @@ from app.schemas.user_schema import (
     UserInResponse,
 )
 from postmarker import core
-from app.database.sessions.mongo_client import template_collection, document_collection
-from app.repositories.court_system_repo import court_repo
+from app.database.sessions.mongo_client import document_collection
 from app.core.settings.configurations import settings
 from app.schemas.user_type_schema import UserTypeInDB
+from commonLib.repositories.pagination import paginate_collection, paginate_documents
+from commonLib.response.fast_response import fast_response
 from commonLib.response.response_schema import GenericResponse, create_response
 
 
@@ -72,6 +93,7 @@ CREATE_ACCOUNT_TEMPLATE_ID = settings.CREATE_ACCOUNT_TEMPLATE_ID
 
 
 @router.get("/search")
+@fast_response
 async def search_documents(
     query: str, current_user: User = Depends(get_currently_authenticated_user)
 ):
@@ -83,7 +105,8 @@ async def search_documents(
         {
             "name": {"$regex": f"^{query}", "$options": "i"},
             "created_by_id": current_user.id,
-        }
+        },
+        DOCUMENT_SUMMARY_PROJECTION,
     )
     documents_by_name = await documents_cursor.to_list(length=100)
 
@@ -102,28 +125,10 @@ async def get_dashboard_stats(
     current_user: User = Depends(get_currently_authenticated_user),
 ):
 
-    total_saved = await document_collection.count_documents(
-        {"created_by_id": current_user.id, "status": "SAVED", "is_archived": False}
-    )
-    total_paid = await document_collection.count_documents(
-        {"created_by_id": current_user.id, "status": "PAID", "is_archived": False}
-    )
-    total_attested = await document_collection.count_documents(
-        {"created_by_id": current_user.id, "status": "ATTESTED", "is_archived": False}
-    )
-    total_documents = await document_collection.count_documents(
-        {"created_by_id": current_user.id, "is_archived": False}
-    )
-
     return create_response(
         status_code=status.HTTP_200_OK,
         message="Dashboard stats retrieved successfully",
-        data=PublicDashboardStat(
-            total_saved=total_saved,
-            total_paid=total_paid,
-            total_attested=total_attested,
-            total_documents=total_documents,
-        ),
+        data=await get_public_dashboard(current_user.id),
     )
 
 
@@ -133,21 +138,18 @@ def create_user(
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
-    user_exist = user_repo.get_by_email(email=user_in.email, db=db)
-    if user_exist:
+    if user_repo.email_exists(db, email=user_in.email):
         raise AlreadyExistsException(
             detail=f"User with email {user_in.email} already exists"
         )
-    # Fetch the user type
-    user_type = user_type_repo.get_by_name(name=settings.PUBLIC_USER_TYPE, db=db)
-
-    if not user_type:
+    user_type_id = user_type_repo.get_id_by_name(db, name=settings.PUBLIC_USER_TYPE)
+    if not user_type_id:
         raise DoesNotExistException(detail="User type not found.")
 
-    user_in = UserCreate(**user_in.dict(), user_type_id=user_type.id)
+    user_in = UserCreate(**user_in.dict(), user_type_id=user_type_id)
     try:
         new_user = user_repo.create(obj_in=user_in, db=db)
-        verify_token = user_repo.create_verification_token(email=new_user.email, db=db)
+        verify_token = new_user.generate_verification_token()
         verification_link = (
             f"{PUBLIC_FRONTEND_BASE_URL}{VERIFY_EMAIL_LINK}{verify_token}"
         )
@@ -180,7 +182,7 @@ def create_user(
             last_name=new_user.last_name,
             email=new_user.email,
             is_active=new_user.is_active,
-            user_type=UserTypeInDB(name=user_type.name, id=user_type.id),
+            user_type=UserTypeInDB(name=settings.PUBLIC_USER_TYPE, id=user_type_id),
         ),
     )
 
@@ -210,15 +212,19 @@ def retrieve_current_user(
 
 
 @router.get("/my_documents", dependencies=[Depends(authenticated_user_dependencies)])
-async def get_documents(current_user: User = Depends(get_currently_authenticated_user)):
+@fast_response
+async def get_documents(
+    page: PageParams = Depends(get_page_params),
+    current_user: User = Depends(get_currently_authenticated_user),
+):
     try:
-        documents = (
-            await document_collection.find(
-                {"created_by_id": current_user.id, "is_archived": False}
-            )
-            .sort("created_at", -1)
-            .to_list(length=100)
-        )  # Set a reasonable limit
+        documents, next_cursor = await paginate_collection(
+            document_collection,
+            {"created_by_id": current_user.id, "is_archived": False},
+            cursor=page.cursor,
+            limit=page.limit,
+            projection=DOCUMENT_SUMMARY_PROJECTION,
+        )
         if not documents:
             logger.info("No documents found")
 
@@ -226,7 +232,10 @@ async def get_documents(current_user: User = Depends(get_currently_authenticated
             status_code=status.HTTP_200_OK,
             data=serialize_mongo_document(documents),
             message=f"Documents retrieved successfully",
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching documents: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching documents")
@@ -235,14 +244,20 @@ async def get_documents(current_user: User = Depends(get_currently_authenticated
 @router.get(
     "/get_archived_documents", dependencies=[Depends(authenticated_user_dependencies)]
 )
+@fast_response
 async def get_archived_documents(
+    page: PageParams = Depends(get_page_params),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
     message = "Archived documents retrieved successfully"
     try:
-        documents = await document_collection.find(
-            {"created_by_id": current_user.id, "is_archived": True}
-        ).to_list(length=100)
+        documents, next_cursor = await paginate_collection(
+            document_collection,
+            {"created_by_id": current_user.id, "is_archived": True},
+            cursor=page.cursor,
+            limit=page.limit,
+            projection=DOCUMENT_SUMMARY_PROJECTION,
+        )
         if not documents:
             logger.info("No documents found")
             message = "No Documents Found"
@@ -250,7 +265,10 @@ async def get_archived_documents(
             status_code=status.HTTP_200_OK,
             data=serialize_mongo_document(documents),
             message=message,
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching documents: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching documents")
@@ -260,7 +278,7 @@ async def get_archived_documents(
     "/get_my_latest_affidavits", dependencies=[Depends(authenticated_user_dependencies)]
 )
 async def get_my_latest_affidavits(
-    db: Session = Depends(get_db),
+    names: DocumentNameLoader = Depends(get_async_document_name_loader),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
     try:
@@ -275,17 +293,7 @@ async def get_my_latest_affidavits(
         if not documents:
             logger.info("No documents found")
 
-        documents = serialize_mongo_document(documents)
-
-        enriched_documents = []
-        for document in documents:
-            court = court_repo.get(db, id=document["court_id"])
-            template = await template_collection.find_one(
-                {"_id": ObjectId(document["template_id"])}
-            )
-            document["court"] = court.name if court else "Unknown Court"
-            document["template"] = template["name"] if template else "Unknown Template"
-            enriched_documents.append(document)
+        enriched_documents = await names.decorate(serialize_mongo_document(documents))
 
         return create_response(
             status_code=status.HTTP_200_OK,
@@ -350,7 +358,7 @@ async def get_document(
 @router.get("/get_receipt/{document_id}")
 async def get_receipt(
     document_id: str,
-    db: Session = Depends(get_db),
+    names: DocumentNameLoader = Depends(get_document_name_loader),
     current_user: User = Depends(get_currently_authenticated_user),
 ):
     if not ObjectId.is_valid(document_id):
@@ -371,21 +379,17 @@ async def get_receipt(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
             )
 
-        document = serialize_mongo_document(document)
-        court = court_repo.get(db, document["court_id"])
-
-        db_template = await template_collection.find_one(
-            {"_id": ObjectId(document["template_id"])}
-        )
-        template = serialize_mongo_document(db_template)
+        document = (await names.decorate([serialize_mongo_document(document)]))[0]
         return create_response(
             status_code=status.HTTP_200_OK,
             message=f"{document['name']} retrieve successfully",
             data=ReceiptInResponse(
-                court_name=court.name,
+                court_name=document["court"],
                 document_name=document["name"],
-                template_name=template["name"],
-                qr_code=document["qr_code"],
+                template_name=document["template"],
+                qr_code=await qr_code_service.render(
+                    get_document_verification_url(document["name"])
+                ),
                 date_created=str(document["updated_at"]),
             ),
         )
@@ -432,9 +436,7 @@ async def get_document_by_name(
     dependencies=[Depends(authenticated_user_dependencies)],
 )
 async def get_templates():
-    templates = await template_collection.find({"is_disabled": False}).to_list(
-        length=100
-    )
+    templates = await template_catalogue.all()
     if not templates:
         logger.info("No templates found")
         return create_response(
@@ -465,10 +467,15 @@ async def get_templates():
     response_model=GenericResponse[List[TemplateInResponse]],
     dependencies=[Depends(authenticated_user_dependencies)],
 )
-async def get_templates_by_category(category_id: str):
-    templates = await template_collection.find(
-        {"is_disabled": False, "category_id": category_id}
-    ).to_list(length=100)
+@fast_response
+async def get_templates_by_category(
+    category_id: str, page: PageParams = Depends(get_page_params)
+):
+    templates, next_cursor = paginate_documents(
+        await template_catalogue.by_category(category_id),
+        cursor=page.cursor,
+        limit=page.limit,
+    )
     if not templates:
         logger.info("No templates found")
         return create_response(
@@ -491,6 +498,22 @@ async def get_templates_by_category(category_id: str):
             )
             for template in templates
         ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/get_template_catalogue",
+    response_model=GenericResponse[List[SlimTemplateInResponse]],
+    dependencies=[Depends(authenticated_user_dependencies)],
+)
+async def get_template_catalogue(category_id: Optional[str] = None):
+    """Enabled templates without their content, optionally for one category."""
+    templates = await template_catalogue.slim(category_id)
+    return create_response(
+        status_code=status.HTTP_200_OK,
+        message="Templates retrieved successfully",
+        data=templates,
     )
 
 
@@ -508,22 +531,18 @@ async def get_template_for_document_creation(
         raise HTTPException(status_code=400, detail=f"Invalid ID format: {template_id}")
     logger.info(f"Fetching template with ID: {object_id}")
 
-    template_obj = await template_collection.find_one({"_id": object_id})
-    if template_obj["is_disabled"]:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Template is not available at the moment",
-        )
-    if template_obj:
-        logger.info(f"Found template: {template_obj}")
-    else:
-        logger.info("No template found")
-
+    template_obj = await template_catalogue.get(object_id)
     if not template_obj:
+        logger.info("No template found")
         raise HTTPException(
             status_code=404,
             detail=f"Template with ID {template_id} does not exist",
         )
+    if template_obj["is_disabled"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template is not available at the moment",
+        )
 
     #
     template_obj = serialize_mongo_document(template_obj)
@@ -558,9 +577,10 @@ async def delete_document(
             status_code=status.HTTP_401_UNAUTHORISED,
             detail="Only saved documents can be deleted, try archiving instead",
         )
-    deleted_count = await document_collection.delete_one({"_id": ObjectId(document_id)})
-    if deleted_count == 0:
+    delete_result = await document_collection.delete_one({"_id": ObjectId(document_id)})
+    if delete_result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Document not found")
+    await stats_service.record_transition(document, None)
     return create_response(
         status_code=status.HTTP_204_NO_CONTENT,
         message=f"{document['name']} has been deleted successfully.",
@@ -575,6 +595,7 @@ async def toggle_archive_document(
     document = await document_collection.find_one({"_id": ObjectId(document_id)})
     if not document:
         raise DoesNotExistException(detail="This document does not exist")
+    previous_document = dict(document)
 
     if document["created_by_id"] != str(current_user.id):
         raise UnauthorizedEndpointException(
@@ -604,6 +625,7 @@ async def toggle_archive_document(
     )
     if not updated_document:
         raise HTTPException(status_code=404, detail="Document not found after update.")
+    await stats_service.record_transition(previous_document, updated_document)
     return create_response(
         status_code=status.HTTP_200_OK,
         message=message,
@@ -633,7 +655,7 @@ async def update_document(
         )
 
     update_result = await document_collection.update_one(
-        {"_id": ObjectId(document_id)}, {"$set": document_data}
+        owned_document, {"$set": document_data}
     )
 
     if update_result.matched_count == 0:
@@ -651,6 +673,7 @@ async def update_document(
     )
     if not updated_document:
         raise HTTPException(status_code=404, detail="Document not found after update.")
+    await stats_service.record_transition(document, updated_document)
 
     attested_document = serialize_mongo_document(updated_document)
     return create_response(
@@ -667,9 +690,10 @@ async def pay_for_document(
     current_user: User = Depends(get_currently_authenticated_user),
 ):
 
-    document = await document_collection.find_one(
-        {"_id": ObjectId(document_id), "created_by_id": current_user.id}
-    )
+    owned_document = {"_id": ObjectId(document_id), "created_by_id": current_user.id}
+    document = await document_collection.find_one(owned_document)
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found.")
     document_data = document_in.dict(exclude_unset=True)
     document_data.update(
         {
@@ -679,7 +703,7 @@ async def pay_for_document(
     )
 
     update_result = await document_collection.update_one(
-        {"_id": ObjectId(document_id)}, {"$set": document_data}
+        owned_document, {"$set": document_data}
     )
 
     if update_result.modified_count == 0:
@@ -692,6 +716,7 @@ async def pay_for_document(
     )
     if not updated_document:
         raise HTTPException(status_code=404, detail="Document not found after update.")
+    await stats_service.record_transition(document, updated_document)
     paid_document = serialize_mongo_document(updated_document)
     return create_response(
         status_code=status.HTTP_200_OK,
@@ -701,13 +726,16 @@ async def pay_for_document(
 
 
 @router.get("/get_states", response_model=GenericResponse[List[CourtSystemInDB]])
-def get_states(db: Session = Depends(get_db)):
-    states = state_repo.get_all(db)
+def get_states(request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional_response(request, response, reference_data.etag(db))
+    if not_modified:
+        return not_modified
+    states = reference_data.states(db)
 
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{len(states)} States Retrieved Successfully!",
-        data=[CourtSystemInDB(id=state.id, name=state.name) for state in states],
+        data=states,
     )
 
 
@@ -715,17 +743,17 @@ def get_states(db: Session = Depends(get_db)):
     "/get_jurisdictions_by_state/{state_id}",
     response_model=GenericResponse[List[CourtSystemInDB]],
 )
-def get_jurisdictions_by_states(state_id: int, db: Session = Depends(get_db)):
-    jurisdictions = (
-        db.query(Jurisdiction).filter(Jurisdiction.state_id == state_id).all()
-    )
+def get_jurisdictions_by_states(
+    state_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    not_modified = conditional_response(request, response, reference_data.etag(db))
+    if not_modified:
+        return not_modified
+    jurisdictions = reference_data.jurisdictions(db, state_id=state_id)
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{len(jurisdictions)} States Retrieved Successfully!",
-        data=[
-            CourtSystemInDB(id=jurisdiction.id, name=jurisdiction.name)
-            for jurisdiction in jurisdictions
-        ],
+        data=jurisdictions,
     )
 
 
@@ -733,12 +761,20 @@ def get_jurisdictions_by_states(state_id: int, db: Session = Depends(get_db)):
     "/get_courts_by_jursdiction/{jurisdiction_id}",
     response_model=GenericResponse[List[CourtSystemInDB]],
 )
-def get_courts_by_jurisdiction(jurisdiction_id: str, db: Session = Depends(get_db)):
-    courts = db.query(Court).filter(Court.jurisdiction_id == jurisdiction_id).all()
+def get_courts_by_jurisdiction(
+    jurisdiction_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    not_modified = conditional_response(request, response, reference_data.etag(db))
+    if not_modified:
+        return not_modified
+    courts = reference_data.courts(db, jurisdiction_id=jurisdiction_id)
     return create_response(
         status_code=status.HTTP_200_OK,
         message=f"{len(courts)} States Retrieved Successfully!",
-        data=[CourtSystemInDB(id=court.id, name=court.name) for court in courts],
+        data=courts,
     )
 
 
@@ -749,10 +785,6 @@ async def create_document(
 ) -> Any:
 
     document_name = generate_document_name()
-    document_qr_code_url = (
-        f"https://e-affidavit-public-fe.vercel.app/verify-document/{document_name}"
-    )
-    qr_code_base64 = generate_qr_code_base64(document_qr_code_url)
 
     try:
         # Validate and update document data
@@ -762,7 +794,6 @@ async def create_document(
                 "name": document_name,
                 "preview_text": extract_preview_text_from_document(document_dict),
                 "status": "SAVED",
-                "qr_code": qr_code_base64,
                 "created_by_id": current_user.id,
             }
         )
@@ -790,6 +821,7 @@ async def create_document(
                 detail="Document not found after creation",
             )
 
+        await stats_service.record_transition(None, new_document)
         logger.info(f"Document {new_document['name']} created successfully")
         return create_response(
             status_code=status.HTTP_201_CREATED,
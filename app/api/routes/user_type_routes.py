@@ -14,6 +14,7 @@ from app.core.errors.exceptions import (
     ServerException,
 )
 from app.models.user_model import User
+from app.repositories.user_repo import user_repo
 from app.repositories.user_type_repo import user_type_repo
 
 from app.api.dependencies.authentication import (
@@ -193,6 +194,8 @@ def get_all_users_of_user_type(
                 verify_token="",
     
             )
-            for user in target_user_type.users
+            for user in user_repo.get_users_by_user_type(
+                db, user_type_id=target_user_type.id, with_profile="user_type"
+            )
         ],
     )
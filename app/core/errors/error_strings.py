@@ -8,4 +8,6 @@ DOES_NOT_EXIST = '{} does not exist'
 WRONG_TOKEN_PREFIX = "unsupported authorization type"
 UNAUTHORIZED_ACTION = "you can not perform this action"
 MALFORMED_PAYLOAD = "could not validate credentials"
-AUTHENTICATION_REQUIRED = "authentication required"
\ No newline at end of file
+AUTHENTICATION_REQUIRED = "authentication required"
+REVOKED_TOKEN = "this token is no longer valid, please log in again"
+INVALID_INVITE_BATCH = "{} invalid invitation(s), nothing was sent: {}"
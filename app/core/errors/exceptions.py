@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 from app.core.errors import error_strings
 from fastapi import HTTPException
 from starlette.status import (
@@ -8,6 +8,7 @@ from starlette.status import (
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
 )
 
 
@@ -120,3 +121,17 @@ class DoesNotExistException(HTTPException):
         
 
 
+class InvalidInviteBatchException(HTTPException):
+    def __init__(
+        self,
+        errors: List[str],
+        status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=error_strings.INVALID_INVITE_BATCH,
+        headers=None,
+    ):
+        self.errors = errors
+        super().__init__(
+            status_code,
+            detail=detail.format(len(errors), "; ".join(errors)),
+            headers=headers,
+        )
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.services.stats import court_scope, stats_service
+from app.core.services.utils.cache import TTLCache
+from app.core.settings.configurations import settings
+from app.database.sessions.mongo_client import document_collection
+from app.repositories.head_of_unit_repo import async_head_of_unit_repo
+from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
+    slim_document_list_serialiser,
+)
+from app.schemas.stats_schema import (
+    CourtDashboardStat,
+    HeadOfUnitDashboardStat,
+    PublicDashboardStat,
+)
+
+LATEST_DOCUMENTS_LIMIT = 5
+
+head_of_unit_dashboard_cache = TTLCache(ttl=settings.HEAD_OF_UNIT_DASHBOARD_TTL_SECONDS)
+
+PAID_OR_ATTESTED = {
+    "$or": [{"$eq": ["$status", "PAID"]}, {"$eq": ["$is_attested", True]}]
+}
+
+
+def build_public_dashboard_pipeline(user_id: str) -> List[Dict[str, Any]]:
+    """Counts, revenue per status and the latest documents in one pass.
+
+    The leading `$match` + `$sort` walk the `created_by_archived_created_at`
+    index (created_by_id, is_archived, created_at, _id) in order, so there is
+    no in-memory sort; the facets then share that single scan of the user's
+    non-archived documents.
+    """
+    return [
+        {"$match": {"created_by_id": user_id, "is_archived": False}},
+        {"$sort": {"created_at": -1, "_id": -1}},
+        {
+            "$facet": {
+                "by_status": [
+                    {
+                        "$group": {
+                            "_id": "$status",
+                            "count": {"$sum": 1},
+                            "revenue": {
+                                "$sum": {
+                                    "$cond": [
+                                        PAID_OR_ATTESTED,
+                                        {"$ifNull": ["$amount_paid", 0]},
+                                        0,
+                                    ]
+                                },
+                            },
+                        }
+                    }
+                ],
+                "latest": [
+                    {"$limit": LATEST_DOCUMENTS_LIMIT},
+                    {"$project": SLIM_DOCUMENT_PROJECTION},
+                ],
+            }
+        },
+    ]
+
+
+async def get_public_dashboard(user_id: str) -> PublicDashboardStat:
+    results = await document_collection.aggregate(
+        build_public_dashboard_pipeline(user_id)
+    ).to_list(length=1)
+    result = results[0] if results else {"by_status": [], "latest": []}
+
+    counts = {row["_id"]: row["count"] for row in result["by_status"]}
+    return PublicDashboardStat(
+        total_saved=counts.get("SAVED", 0),
+        total_paid=counts.get("PAID", 0),
+        total_attested=counts.get("ATTESTED", 0),
+        total_documents=sum(counts.values()),
+        revenue_by_status={
+            row["_id"]: row["revenue"] for row in result["by_status"] if row["_id"]
+        },
+        latest_documents=slim_document_list_serialiser(result["latest"]),
+    )
+
+
+async def get_head_of_unit_dashboard(
+    db: AsyncSession, jurisdiction_id: str
+) -> HeadOfUnitDashboardStat:
+    """Jurisdiction dashboard from the per-court stats rollup, cached for
+    HEAD_OF_UNIT_DASHBOARD_TTL_SECONDS."""
+    dashboard = head_of_unit_dashboard_cache.get(jurisdiction_id)
+    if dashboard is not None:
+        return dashboard
+
+    courts = await async_head_of_unit_repo.get_court_names_under_jurisdiction(
+        db, jurisdiction_id=jurisdiction_id
+    )
+    total_commissioners = (
+        await async_head_of_unit_repo.count_commissioners_under_jurisdiction(
+            db, jurisdiction_id=jurisdiction_id
+        )
+    )
+    totals = await stats_service.get_many([court_scope(court_id) for court_id in courts])
+
+    court_stats = []
+    for court_id, name in courts.items():
+        stats = totals[court_scope(court_id)]
+        court_stats.append(
+            CourtDashboardStat(
+                id=court_id,
+                name=name,
+                total_documents=stats["total"],
+                total_affidavits=stats["paid"] + stats["attested"],
+                total_revenue=stats["revenue"],
+            )
+        )
+    dashboard = HeadOfUnitDashboardStat(
+        total_courts=len(courts),
+        total_commissioners=total_commissioners,
+        total_affidavits=sum(court.total_affidavits for court in court_stats),
+        total_revenue=sum(court.total_revenue for court in court_stats),
+        courts=court_stats,
+    )
+    head_of_unit_dashboard_cache.set(jurisdiction_id, dashboard)
+    return dashboard
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Union
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.services.template_catalogue import template_catalogue
+from app.core.services.utils.dataloader import DataLoader
+from app.models.court_system_models import Court
+
+UNKNOWN_COURT = "Unknown Court"
+UNKNOWN_TEMPLATE = "Unknown Template"
+
+
+class DocumentNameLoader:
+    """Resolves court and template names for a set of documents in batches.
+
+    Court names come from one `IN` query per batch; template names from the
+    template catalogue. Works with either a sync or an async SQL session.
+    """
+
+    def __init__(self, db: Union[Session, AsyncSession]):
+        self.db = db
+        self.courts: DataLoader[str] = DataLoader(self._load_court_names)
+        self.templates: DataLoader[str] = DataLoader(self._load_template_names)
+
+    async def _load_court_names(self, court_ids: List[str]) -> Dict[str, str]:
+        statement = select(Court.id, Court.name).where(Court.id.in_(court_ids))
+        if isinstance(self.db, AsyncSession):
+            rows = (await self.db.execute(statement)).all()
+        else:
+            rows = self.db.execute(statement).all()
+        return dict(rows)
+
+    async def _load_template_names(self, template_ids: List[str]) -> Dict[str, str]:
+        return await template_catalogue.names(template_ids)
+
+    async def decorate(self, documents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Set `court` and `template` names on each (serialised) document."""
+        documents = list(documents)
+        courts, templates = await asyncio.gather(
+            self.courts.load_many(
+                document["court_id"]
+                for document in documents
+                if document.get("court_id")
+            ),
+            self.templates.load_many(
+                str(document["template_id"])
+                for document in documents
+                if document.get("template_id")
+            ),
+        )
+        for document in documents:
+            document["court"] = courts.get(document.get("court_id")) or UNKNOWN_COURT
+            document["template"] = (
+                templates.get(str(document.get("template_id"))) or UNKNOWN_TEMPLATE
+            )
+        return documents
@@ -0,0 +1,116 @@
+from typing import Any, Dict, List
+
+from app.database.sessions.mongo_client import document_collection
+from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
+    slim_document_list_serialiser,
+)
+
+
+ROLLUP_DOCUMENT_FIELDS = SLIM_DOCUMENT_PROJECTION
+
+
+def _status_count(status: str) -> Dict[str, Any]:
+    return {"$sum": {"$cond": [{"$eq": ["$status", status]}, 1, 0]}}
+
+
+def build_rollup_pipeline(user_ids: List[str], slim: bool = False) -> List[Dict]:
+    """One pass over every document owned by `user_ids`, grouped per owner."""
+    group = {
+        "_id": "$created_by_id",
+        "total_documents": {"$sum": 1},
+        "total_saved": _status_count("SAVED"),
+        "total_paid": _status_count("PAID"),
+        "total_attested": _status_count("ATTESTED"),
+        "total_amount": {
+            "$sum": {
+                "$cond": [
+                    {
+                        "$or": [
+                            {"$eq": ["$status", "PAID"]},
+                            {"$eq": ["$is_attested", True]},
+                        ]
+                    },
+                    {"$ifNull": ["$amount_paid", 0]},
+                    0,
+                ]
+            }
+        },
+    }
+    if not slim:
+        group["documents"] = {
+            "$push": {field: f"${field}" for field in ROLLUP_DOCUMENT_FIELDS}
+        }
+
+    return [
+        {"$match": {"created_by_id": {"$in": user_ids}}},
+        {
+            "$project": {
+                **ROLLUP_DOCUMENT_FIELDS,
+                "created_by_id": 1,
+                "is_attested": 1,
+                "amount_paid": 1,
+            }
+        },
+        {"$group": group},
+    ]
+
+
+def empty_rollup(slim: bool = False) -> Dict[str, Any]:
+    if slim:
+        return dict(
+            total_documents=0,
+            total_saved=0,
+            total_paid=0,
+            total_attested=0,
+            total_amount=0,
+        )
+    return dict(
+        total_documents=[],
+        total_saved=[],
+        total_paid=[],
+        total_attested=[],
+        total_amount=0,
+    )
+
+
+class DocumentRollupService:
+    async def get_rollups(
+        self, user_ids: List[str], slim: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return per-user document rollups keyed by user id.
+
+        In slim mode only the counts are returned, otherwise the counts are
+        replaced by the matching lists of slim documents.
+        """
+        if not user_ids:
+            return {}
+
+        rollups = {}
+        cursor = document_collection.aggregate(build_rollup_pipeline(user_ids, slim))
+        async for row in cursor:
+            rollups[row["_id"]] = self._to_rollup(row, slim)
+        return rollups
+
+    @staticmethod
+    def _to_rollup(row: Dict[str, Any], slim: bool) -> Dict[str, Any]:
+        if slim:
+            return dict(
+                total_documents=row["total_documents"],
+                total_saved=row["total_saved"],
+                total_paid=row["total_paid"],
+                total_attested=row["total_attested"],
+                total_amount=row["total_amount"],
+            )
+
+        documents = slim_document_list_serialiser(row["documents"])
+        return dict(
+            total_documents=documents,
+            total_saved=[doc for doc in documents if doc.status == "SAVED"],
+            total_paid=[doc for doc in documents if doc.status == "PAID"],
+            total_attested=[doc for doc in documents if doc.status == "ATTESTED"],
+            total_amount=row["total_amount"],
+        )
+
+
+document_rollup = DocumentRollupService()
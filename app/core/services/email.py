@@ -1,34 +1,33 @@
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
-from app.api.dependencies.db import get_db
+from app.core.services.email_outbox import email_outbox
 from app.core.settings.configurations import settings
 from app.models.email_model import Email
-from app.schemas.email_schema import EmailCreate, EmailUpdate
+from app.schemas.email_schema import EmailCreate
+from commonLib.repositories.unit_of_work import after_commit
 from app.repositories.email_repo import email_repo
 from loguru import logger
-from postmarker.core import PostmarkClient
 from pydantic import EmailStr
 
 
 class EmailService:
-    def __init__(self):
-
-        self.client = PostmarkClient(server_token=settings.POSTMARK_API_TOKEN)
-        logger.info("email")
-
     def send_email_with_template(
         self,
         template_id: int,
         db: Session,
         template_dict: Dict[str, Any],
         recipient: Union[List[EmailStr], EmailStr],
-        background_tasks: BackgroundTasks,
-    ):
-        
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Email:
+        """Queue a templated email in the outbox.
+
+        The row is delivered by `email_outbox`; with `background_tasks` the
+        worker is woken once the response has been sent.
+        """
         email = email_repo.create(
             db=db,
             obj_in=EmailCreate(
@@ -38,37 +37,39 @@ class EmailService:
                 sender=settings.DEFAULT_EMAIL_SENDER,
             ),
         )
+        logger.info(f"Queued email to {recipient}")
 
-        background_tasks.add_task(
-            self._send_email_with_template,db=db, email=email, template_dict=template_dict
-        )
-
-
+        if background_tasks is not None:
+            background_tasks.add_task(email_outbox.wake)
+        else:
+            after_commit(db, email_outbox.wake)
+        return email
 
+    def send_emails_with_template(
+        self,
+        template_id: int,
+        db: Session,
+        messages: List[Tuple[EmailStr, Dict[str, Any]]],
+        background_tasks: BackgroundTasks,
+    ) -> None:
+        """Queue one templated email per `(recipient, template_dict)` pair.
 
-    async def _send_email_with_template(
-        self, email: Email,db:Session, template_dict: Dict[str, Any]
-    ):
-        try:
-            response = self.client.emails.send_with_template(
-                TemplateId=email.template_id,
-                TemplateModel=template_dict,
-                From=settings.DEFAULT_EMAIL_SENDER,
-                To=email.recipient,
-            )
-            if response["ErrorCode"] == 0:
-                email_repo.mark_as_delivered(db,db_obj=email)
-            else:
-                email_repo.update(
-                    db_obj=email,
-                    obj_in=EmailUpdate(delivered=False, extra_data=response["Message"]),
+        Inside a unit of work the rows commit together with whatever they
+        announce; the worker is woken after the response.
+        """
+        email_repo.bulk_create(
+            db,
+            [
+                EmailCreate(
+                    template_id=template_id,
+                    template_dict=json.dumps(template_dict),
+                    recipient=recipient,
+                    sender=settings.DEFAULT_EMAIL_SENDER,
                 )
-        except Exception as e:
-            logger.error(e)
-            email_repo.update(
-                db_obj=email,
-                obj_in=EmailUpdate(delivered=False, extra_data=str(e)),
-            )
+                for recipient, template_dict in messages
+            ],
+        )
+        background_tasks.add_task(email_outbox.wake)
 
 
 email_service = EmailService()
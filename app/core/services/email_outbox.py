@@ -0,0 +1,190 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from loguru import logger
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.services.postmark import (
+    MAX_BATCH_SIZE,
+    PostmarkBatchClient,
+    PostmarkError,
+    postmark_client,
+)
+from app.core.settings.configurations import settings
+from app.database.sessions.session import SessionLocal
+from app.models.email_model import EmailStatus
+from app.repositories.email_repo import email_repo
+from app.schemas.email_schema import EmailDeliveryResult, EmailInOutbox
+
+MAX_BACKOFF_SECONDS = 3600
+
+
+class EmailOutbox:
+    """Background worker that delivers pending `Email` rows through Postmark.
+
+    Rows are written by `EmailService` in the request's transaction; the
+    worker claims them in batches, sends each batch in one Postmark call and
+    records the per-message outcome. Timeouts, connection errors, 429s and
+    5xx responses are retried with exponential backoff until `max_attempts`
+    is reached; any other rejected request fails its emails at once.
+    """
+
+    def __init__(
+        self,
+        client: PostmarkBatchClient,
+        *,
+        batch_size: int,
+        poll_seconds: float,
+        lease_seconds: int,
+        max_attempts: int,
+        backoff_seconds: int,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.client = client
+        self.session_factory = session_factory
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.poll_seconds = poll_seconds
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.client.aclose()
+
+    def wake(self) -> None:
+        """Ask the worker to drain now instead of at the next poll.
+
+        Safe to call from the sync routes' threadpool.
+        """
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                while await self.drain_once() == self.batch_size:
+                    pass
+            except Exception as e:
+                logger.error(f"Email outbox drain failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def drain_once(self) -> int:
+        """Claim, send and record one batch. Returns the number of emails claimed."""
+        emails = await run_in_threadpool(self._claim)
+        if not emails:
+            return 0
+        results = await self.deliver(emails)
+        await run_in_threadpool(self._record, results)
+        delivered = sum(result.status == EmailStatus.DELIVERED for result in results)
+        logger.info(f"Email outbox delivered {delivered} of {len(emails)} emails")
+        return len(emails)
+
+    def _claim(self) -> List[EmailInOutbox]:
+        with self.session_factory() as db:
+            return email_repo.claim_due(db, limit=self.batch_size, lease=self.lease)
+
+    def _record(self, results: List[EmailDeliveryResult]) -> None:
+        with self.session_factory() as db:
+            email_repo.record_results(db, results)
+
+    async def deliver(self, emails: List[EmailInOutbox]) -> List[EmailDeliveryResult]:
+        try:
+            responses = await self.client.send_batch_with_templates(
+                [build_message(email) for email in emails]
+            )
+        except (httpx.HTTPError, PostmarkError) as e:
+            logger.warning(f"Postmark batch of {len(emails)} failed: {str(e)}")
+            retryable = isinstance(e, httpx.TransportError) or (
+                isinstance(e, PostmarkError) and e.retryable
+            )
+            if not retryable:
+                return [
+                    EmailDeliveryResult(id=email.id, status=EmailStatus.FAILED, error=str(e))
+                    for email in emails
+                ]
+            return [self._retry_or_fail(email, str(e)) for email in emails]
+
+        results = []
+        for email, response in zip(emails, responses):
+            if response.get("ErrorCode") == 0:
+                results.append(
+                    EmailDeliveryResult(
+                        id=email.id,
+                        status=EmailStatus.DELIVERED,
+                        message_id=response.get("MessageID"),
+                    )
+                )
+            else:
+                # Per-message errors (inactive recipient, bad template model)
+                # will not succeed on a retry.
+                results.append(
+                    EmailDeliveryResult(
+                        id=email.id,
+                        status=EmailStatus.FAILED,
+                        error=response.get("Message", ""),
+                    )
+                )
+        return results
+
+    def _retry_or_fail(self, email: EmailInOutbox, error: str) -> EmailDeliveryResult:
+        if email.attempts >= self.max_attempts:
+            return EmailDeliveryResult(
+                id=email.id, status=EmailStatus.FAILED, error=error
+            )
+        delay = min(
+            self.backoff_seconds * 2 ** (email.attempts - 1), MAX_BACKOFF_SECONDS
+        )
+        return EmailDeliveryResult(
+            id=email.id,
+            status=EmailStatus.PENDING,
+            error=error,
+            next_attempt_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+        )
+
+
+def build_message(email: EmailInOutbox) -> Dict[str, Any]:
+    message: Dict[str, Any] = {
+        "From": email.sender,
+        "To": email.recipient,
+        "TemplateModel": json.loads(email.template_dict),
+    }
+    if email.template_id.isdigit():
+        message["TemplateId"] = int(email.template_id)
+    else:
+        message["TemplateAlias"] = email.template_id
+    return message
+
+
+email_outbox = EmailOutbox(
+    postmark_client,
+    batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+    poll_seconds=settings.EMAIL_OUTBOX_POLL_SECONDS,
+    lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+    max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+    backoff_seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+)
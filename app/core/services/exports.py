@@ -0,0 +1,173 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.services.reports import attestation_date_filter, date_range_filter
+from app.core.settings.configurations import settings
+from app.database.sessions.mongo_client import document_collection
+from app.database.sessions.session import SessionLocal
+from app.models.court_system_models import Court
+from app.repositories.commissioner_profile_repo import comm_profile_repo
+from app.schemas.shared_schema import DateRange
+
+DOCUMENT_EXPORT_COLUMNS = [
+    "id",
+    "name",
+    "status",
+    "court_id",
+    "court",
+    "template_id",
+    "created_by_id",
+    "commissioner_id",
+    "amount_paid",
+    "payment_ref",
+    "is_attested",
+    "created_at",
+    "attestation_date",
+]
+COMMISSIONER_EXPORT_COLUMNS = [
+    "commissioner_id",
+    "first_name",
+    "last_name",
+    "email",
+    "court_id",
+    "court",
+    "document_id",
+    "document_name",
+    "created_at",
+    "attestation_date",
+]
+DOCUMENT_EXPORT_PROJECTION = {
+    column: 1
+    for column in DOCUMENT_EXPORT_COLUMNS
+    if column not in ("id", "court")
+}
+
+
+class ExportService:
+    """Row generators for the streaming report exports.
+
+    The request's session is closed before a StreamingResponse body is
+    iterated, so SQL reads open their own short-lived session in the
+    threadpool. No connection is held while rows wait on a slow client.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+
+    async def document_rows(
+        self,
+        *,
+        date_range: Optional[DateRange] = None,
+        jurisdiction_id: Optional[str] = None,
+        court_id: Optional[str] = None,
+        commissioner_id: Optional[str] = None,
+        document_status: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        court_names = await run_in_threadpool(self._court_names, jurisdiction_id)
+
+        query: Dict[str, Any] = date_range_filter("created_at", date_range)
+        if court_id:
+            query["court_id"] = court_id
+        elif jurisdiction_id:
+            query["court_id"] = {"$in": list(court_names)}
+        if commissioner_id:
+            query["commissioner_id"] = commissioner_id
+        if document_status:
+            query["status"] = document_status
+
+        cursor = (
+            document_collection.find(query, DOCUMENT_EXPORT_PROJECTION)
+            .sort("created_at", -1)
+            .batch_size(self.batch_size)
+        )
+        async for document in cursor:
+            document["id"] = str(document.pop("_id"))
+            document["court"] = court_names.get(document.get("court_id"))
+            yield document
+
+    async def commissioner_rows(
+        self,
+        *,
+        date_range: Optional[DateRange] = None,
+        jurisdiction_id: Optional[str] = None,
+        court_id: Optional[str] = None,
+        commissioner_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """One row per attested document, commissioners fetched in batches."""
+        filters = dict(
+            jurisdiction_id=jurisdiction_id,
+            court_id=court_id,
+            commissioner_id=commissioner_id,
+        )
+        after = None
+        while True:
+            commissioners, after = await run_in_threadpool(
+                self._commissioner_batch, after, filters
+            )
+            if not commissioners:
+                return
+            cursor = (
+                document_collection.find(
+                    {
+                        "is_attested": True,
+                        "commissioner_id": {"$in": list(commissioners)},
+                        **attestation_date_filter(date_range),
+                    },
+                    {
+                        "name": 1,
+                        "commissioner_id": 1,
+                        "created_at": 1,
+                        "attestation_date": 1,
+                    },
+                )
+                .sort("attestation_date", -1)
+                .batch_size(self.batch_size)
+            )
+            async for document in cursor:
+                yield {
+                    **commissioners[document["commissioner_id"]],
+                    "document_id": str(document["_id"]),
+                    "document_name": document.get("name"),
+                    "created_at": document.get("created_at"),
+                    "attestation_date": document.get("attestation_date"),
+                }
+            if len(commissioners) < self.batch_size:
+                return
+
+    def _court_names(self, jurisdiction_id: Optional[str]) -> Dict[str, str]:
+        with SessionLocal() as db:
+            courts = db.query(Court.id, Court.name)
+            if jurisdiction_id:
+                courts = courts.filter(Court.jurisdiction_id == jurisdiction_id)
+            return dict(courts.all())
+
+    def _commissioner_batch(
+        self, after: Optional[Tuple[str, str, str]], filters: Dict[str, Optional[str]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[Tuple[str, str, str]]]:
+        """Export columns for the next batch of commissioners, keyed by id, and
+        the keyset position to continue from."""
+        with SessionLocal() as db:
+            profiles = comm_profile_repo.get_profile_batch_with_user_and_court(
+                db, batch_size=self.batch_size, after=after, **filters
+            )
+            if not profiles:
+                return {}, after
+            last = profiles[-1]
+            return (
+                {
+                    profile.commissioner_id: {
+                        "commissioner_id": profile.commissioner_id,
+                        "first_name": profile.user.first_name,
+                        "last_name": profile.user.last_name,
+                        "email": profile.user.email,
+                        "court_id": profile.court_id,
+                        "court": profile.court.name,
+                    }
+                    for profile in profiles
+                },
+                (last.user.first_name, last.user.last_name, last.id),
+            )
+
+
+export_service = ExportService(batch_size=settings.EXPORT_BATCH_SIZE)
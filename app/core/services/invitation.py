@@ -1,95 +1,248 @@
+import csv
+import io
 import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
+
 from fastapi import BackgroundTasks, HTTPException, status
 from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.errors.exceptions import InvalidInviteBatchException
 from app.core.services.email import email_service
-from postmarker import core
 from app.core.services.jwt import generate_invitation_token
+from app.models.court_system_models import Court, Jurisdiction
+from app.models.user_invite_models import UserInvite
 from app.models.user_model import User
+from app.models.user_type_model import UserType
 from app.repositories.user_invite_repo import user_invite_repo
-from app.repositories.user_type_repo import user_type_repo
 from app.schemas.user_schema import CreateInvite, InviteOperationsForm
-from sqlalchemy.orm import Session
-
 from app.core.settings.configurations import settings
+from commonLib.repositories.unit_of_work import unit_of_work
 
+DEFAULT_ORGANISATION = "E-AFFIDAVIT"
+INVITE_CSV_COLUMNS = list(InviteOperationsForm.model_fields)
+REQUIRED_CSV_COLUMNS = {"first_name", "last_name", "email"}
 
-async def process_user_invite(
-    user: InviteOperationsForm,
-    current_user: User,
+# (row number, invite) pairs; the number is reported back in validation errors.
+InviteRows = List[Tuple[int, InviteOperationsForm]]
+
+
+def invite_users_in_bulk(
     db: Session,
+    rows: InviteRows,
+    current_user: User,
     background_tasks: BackgroundTasks,
-):
-    invite_id = str(uuid.uuid4())
-    token = generate_invitation_token(invite_id)
-
-    invite_in = CreateInvite(
-        id=invite_id,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        user_type_id=user.user_type_id,
-        email=user.email,
-        court_id=user.court_id or None,
-        jurisdiction_id=user.jurisdiction_id or None,
-        invited_by_id=current_user.id,
-        token=token,
-    )
+    errors: Optional[List[str]] = None,
+) -> int:
+    """Validate, store and announce a batch of invitations.
 
-    try:
-        new_invite = user_invite_repo.create(db, obj_in=invite_in)
-      
-        organisation = determine_organisation(new_invite)
-        operations = determine_operations_base_url(new_invite.user_type.name)
+    Nothing is written unless every row is valid. The invites and their
+    emails are inserted in one transaction, so a failure leaves neither.
+    Returns the number of users invited.
+    """
+    errors = list(errors or [])
+    names = validate_invites(db, rows, errors)
+    if errors:
+        raise InvalidInviteBatchException(errors)
 
-        send_invitation_email(
-            background_tasks, new_invite, organisation, operations, token,db, current_user
+    invites, messages = [], []
+    for _, user in rows:
+        invite_id = str(uuid.uuid4())
+        token = generate_invitation_token(invite_id)
+        invite = CreateInvite(
+            id=invite_id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            user_type_id=user.user_type_id,
+            email=user.email,
+            court_id=user.court_id or None,
+            jurisdiction_id=user.jurisdiction_id or None,
+            invited_by_id=current_user.id,
+            token=token,
         )
+        invites.append(invite)
+        messages.append(
+            (invite.email, invitation_template(invite, names, token, current_user))
+        )
+
+    try:
+        with unit_of_work(db):
+            user_invite_repo.bulk_create(db, invites)
+            email_service.send_emails_with_template(
+                template_id=settings.OPERATIONS_INVITE_TEMPLATE_ID,
+                db=db,
+                messages=messages,
+                background_tasks=background_tasks,
+            )
     except Exception as e:
-        logger.error(f"Failed to process invitation for {user.email}: {str(e)}")
+        logger.error(f"Failed to store {len(invites)} invitations: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Data integrity Error: Please check the data you are passing.",
         )
+    logger.info(f"{current_user.id} invited {len(invites)} users")
+    return len(invites)
 
 
-def determine_organisation(user: InviteOperationsForm) -> str:
-    if user.court_id:
-        return user.court.name
-    elif user.jurisdiction_id:
-        return user.jurisdiction.name
-    return "E-AFFIDAVIT"
+def validate_invites(
+    db: Session, rows: InviteRows, errors: List[str]
+) -> Dict[Tuple[str, str], str]:
+    """Append a message to `errors` for every invalid row.
 
+    Returns the names of the user types, courts and jurisdictions the rows
+    refer to, which the invitation emails need.
+    """
+    invites = [user for _, user in rows]
+    names = lookup_invite_names(db, invites)
+    taken = lookup_taken_emails(db, {user.email.lower() for user in invites})
 
-def determine_operations_base_url(user_type: str) -> str:
-    return (
-        settings.ADMIN_FRONTEND_BASE_URL
-        if user_type == settings.ADMIN_USER_TYPE
-        else settings.COURT_SYSTEM_FRONTEND_BASE_URL
+    seen = set()
+    for row, user in rows:
+        problems = []
+        email = user.email.lower()
+        if email in seen:
+            problems.append("email appears more than once")
+        seen.add(email)
+        if ("registered", email) in taken:
+            problems.append("email is already registered")
+        elif ("invited", email) in taken:
+            problems.append("email already has a pending invite")
+        if ("user_type", user.user_type_id) not in names:
+            problems.append("unknown user_type_id")
+        if user.court_id and ("court", user.court_id) not in names:
+            problems.append("unknown court_id")
+        if user.jurisdiction_id and ("jurisdiction", user.jurisdiction_id) not in names:
+            problems.append("unknown jurisdiction_id")
+        if problems:
+            errors.append(row_error(row, user.email, problems))
+    return names
+
+
+def lookup_taken_emails(db: Session, emails: Set[str]) -> Set[Tuple[str, str]]:
+    """("registered" | "invited", lowercased email) for the `emails` that
+    belong to a user or to an unaccepted invite whose token has not expired,
+    in one query. Emails are compared case-insensitively."""
+    if not emails:
+        return set()
+    invite_expiry = datetime.now(timezone.utc) - timedelta(
+        minutes=settings.JWT_EXPIRE_MINUTES
     )
+    statement = union_all(
+        select(literal("registered"), func.lower(User.email)).where(
+            func.lower(User.email).in_(emails)
+        ),
+        select(literal("invited"), func.lower(UserInvite.email)).where(
+            func.lower(UserInvite.email).in_(emails),
+            UserInvite.is_accepted.is_(False),
+            UserInvite.CreatedAt > invite_expiry,
+        ),
+    )
+    return {(kind, email) for kind, email in db.execute(statement)}
 
 
-def send_invitation_email(
-    background_tasks: BackgroundTasks,
+def lookup_invite_names(
+    db: Session, invites: List[InviteOperationsForm]
+) -> Dict[Tuple[str, str], str]:
+    """Names keyed by ("user_type" | "court" | "jurisdiction", id), in one query."""
+    if not invites:
+        return {}
+    statement = union_all(
+        select(literal("user_type"), UserType.id, UserType.name).where(
+            UserType.id.in_({user.user_type_id for user in invites})
+        ),
+        select(literal("court"), Court.id, Court.name).where(
+            Court.id.in_({user.court_id for user in invites if user.court_id})
+        ),
+        select(literal("jurisdiction"), Jurisdiction.id, Jurisdiction.name).where(
+            Jurisdiction.id.in_(
+                {user.jurisdiction_id for user in invites if user.jurisdiction_id}
+            )
+        ),
+    )
+    return {(kind, id): name for kind, id, name in db.execute(statement)}
+
+
+def read_invite_csv(
+    file: BinaryIO, defaults: Dict[str, Optional[str]], max_rows: int
+) -> Tuple[InviteRows, List[str]]:
+    """Parse an uploaded invite CSV one row at a time.
+
+    Columns are the fields of `InviteOperationsForm`; empty cells fall back to
+    `defaults`, so a whole court can be onboarded from a name/email sheet.
+    Returns the valid rows, numbered by line, and an error per invalid row.
+    """
+    rows: InviteRows = []
+    errors: List[str] = []
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = REQUIRED_CSV_COLUMNS - set(reader.fieldnames or [])
+        if missing:
+            raise InvalidInviteBatchException(
+                [f"missing columns: {', '.join(sorted(missing))}"]
+            )
+        for record in reader:
+            if len(rows) + len(errors) >= max_rows:
+                errors.append(f"more than {max_rows} rows")
+                break
+            values = {
+                column: (record.get(column) or "").strip() or defaults.get(column)
+                for column in INVITE_CSV_COLUMNS
+            }
+            try:
+                rows.append((reader.line_num, InviteOperationsForm(**values)))
+            except ValidationError as e:
+                errors.append(
+                    row_error(
+                        reader.line_num,
+                        values.get("email"),
+                        [f"{error['loc'][0]}: {error['msg']}" for error in e.errors()],
+                    )
+                )
+    except UnicodeDecodeError:
+        errors.append("file is not valid UTF-8")
+    finally:
+        text.detach()
+    return rows, errors
+
+
+def row_error(row: int, email: Optional[str], problems: List[str]) -> str:
+    return f"row {row} ({email or 'no email'}): {', '.join(problems)}"
+
+
+def invitation_template(
     invite: CreateInvite,
-    organisation: str,
-    operations: str,
+    names: Dict[Tuple[str, str], str],
     token: str,
-   
-    db:Session,
-     current_user:User
-):
-    template_dict = {
+    current_user: User,
+) -> Dict[str, Any]:
+    user_type = names[("user_type", invite.user_type_id)]
+    operations = determine_operations_base_url(user_type)
+    return {
         "name": f"{invite.first_name} {invite.last_name}",
-        "invite_sender_organization_name": organisation,
+        "invite_sender_organization_name": determine_organisation(invite, names),
         "invite_url": f"{operations}{settings.ACCEPT_INVITE_URL}{token}",
-        "user_role": invite.user_type.name.capitalize(), 
-        "invite_sender_name": f"{current_user.first_name}"
+        "user_role": user_type.capitalize(),
+        "invite_sender_name": f"{current_user.first_name}",
     }
-    print(template_dict["invite_url"])
-
-    email_service.send_email_with_template(
-        db=db,
-        template_id=settings.OPERATIONS_INVITE_TEMPLATE_ID,
-        background_tasks=background_tasks,
-        template_dict=template_dict,
-        recipient=invite.email,
+
+
+def determine_organisation(
+    invite: InviteOperationsForm, names: Dict[Tuple[str, str], str]
+) -> str:
+    if invite.court_id:
+        return names[("court", invite.court_id)]
+    elif invite.jurisdiction_id:
+        return names[("jurisdiction", invite.jurisdiction_id)]
+    return DEFAULT_ORGANISATION
+
+
+def determine_operations_base_url(user_type: str) -> str:
+    return (
+        settings.ADMIN_FRONTEND_BASE_URL
+        if user_type == settings.ADMIN_USER_TYPE
+        else settings.COURT_SYSTEM_FRONTEND_BASE_URL
     )
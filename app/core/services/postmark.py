@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.settings.configurations import settings
+
+BATCH_WITH_TEMPLATES_PATH = "/email/batchWithTemplates"
+# Postmark rejects batch requests with more than 500 messages.
+MAX_BATCH_SIZE = 500
+
+
+class PostmarkError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self) -> bool:
+        """Rate limiting and server errors may pass on a later attempt; any
+        other 4xx (bad token, invalid payload) will not."""
+        return self.status_code == 429 or self.status_code >= 500
+
+
+class PostmarkBatchClient:
+    """Async client for Postmark's batch-with-templates endpoint.
+
+    One pooled `httpx.AsyncClient` is shared by every call and opened lazily
+    so it binds to the running event loop.
+    """
+
+    def __init__(
+        self,
+        server_token: str,
+        base_url: str,
+        timeout: float,
+        max_connections: int,
+    ):
+        self.server_token = server_token
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                headers={
+                    "Accept": "application/json",
+                    "X-Postmark-Server-Token": self.server_token,
+                },
+            )
+        return self._client
+
+    async def send_batch_with_templates(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Send up to `MAX_BATCH_SIZE` templated messages in one request.
+
+        Returns Postmark's per-message results, in the order of `messages`.
+        Raises `PostmarkError`, carrying the status code, when the request as
+        a whole is rejected.
+        """
+        if len(messages) > MAX_BATCH_SIZE:
+            raise ValueError(f"Postmark batches are limited to {MAX_BATCH_SIZE} messages")
+        response = await self._get_client().post(
+            BATCH_WITH_TEMPLATES_PATH, json={"Messages": messages}
+        )
+        if response.status_code != 200:
+            raise PostmarkError(
+                f"Postmark returned {response.status_code}: {response.text}",
+                status_code=response.status_code,
+            )
+        return response.json()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+postmark_client = PostmarkBatchClient(
+    server_token=settings.POSTMARK_API_TOKEN,
+    base_url=settings.POSTMARK_API_URL,
+    timeout=settings.POSTMARK_TIMEOUT_SECONDS,
+    max_connections=settings.POSTMARK_MAX_CONNECTIONS,
+)
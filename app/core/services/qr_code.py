@@ -0,0 +1,99 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from app.core.services.utils.utils import (
+    generate_qr_code_base64,
+    generate_qr_code_png,
+    generate_qr_code_svg,
+)
+from app.core.settings.configurations import settings
+
+
+class QRCodeService:
+    """Render QR codes in a process pool so PIL work stays off the event loop.
+
+    At most `max_pending` renders are queued on the pool at once; callers past
+    that wait on the semaphore instead of piling work onto the executor.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._metrics = dict(
+            rendered=0,
+            failed=0,
+            wait_seconds=0.0,
+            render_seconds=0.0,
+            max_render_seconds=0.0,
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        return self._semaphore
+
+    async def render(self, url: str) -> str:
+        """Return the QR code for `url` as a base64 encoded PNG."""
+        return await self._run(generate_qr_code_base64, url)
+
+    async def render_image(self, url: str, format: str = "png") -> bytes:
+        """Return the raw QR image for `url`, either "png" or "svg"."""
+        renderer = generate_qr_code_svg if format == "svg" else generate_qr_code_png
+        return await self._run(renderer, url)
+
+    async def _run(self, renderer: Callable, url: str):
+        queued_at = time.perf_counter()
+        async with self._get_semaphore():
+            started_at = time.perf_counter()
+            self._metrics["wait_seconds"] += started_at - queued_at
+            loop = asyncio.get_running_loop()
+            try:
+                qr_code = await loop.run_in_executor(
+                    self._get_executor(), renderer, url
+                )
+            except Exception:
+                self._metrics["failed"] += 1
+                raise
+
+        elapsed = time.perf_counter() - started_at
+        self._metrics["rendered"] += 1
+        self._metrics["render_seconds"] += elapsed
+        self._metrics["max_render_seconds"] = max(
+            self._metrics["max_render_seconds"], elapsed
+        )
+        return qr_code
+
+    async def render_many(self, urls: List[str]) -> List[str]:
+        """Render a batch of QR codes, returned in the same order as `urls`."""
+        return await asyncio.gather(*(self.render(url) for url in urls))
+
+    def metrics(self) -> Dict[str, float]:
+        rendered = self._metrics["rendered"]
+        return dict(
+            **self._metrics,
+            avg_render_seconds=(
+                self._metrics["render_seconds"] / rendered if rendered else 0.0
+            ),
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            logger.info(f"Shutting down QR code workers: {self.metrics()}")
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+qr_code_service = QRCodeService(
+    workers=settings.QR_CODE_WORKERS, max_pending=settings.QR_CODE_MAX_PENDING
+)
@@ -0,0 +1,125 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.core.settings.configurations import settings
+from app.models.court_system_models import Court, Jurisdiction, State
+from app.schemas.court_system_schema import (
+    CourtSystemInDB,
+    CourtSystemTree,
+    JurisdictionNode,
+    StateNode,
+)
+
+
+class _Snapshot:
+    def __init__(self, tree: CourtSystemTree):
+        self.loaded_at = time.monotonic()
+        self.tree = tree
+        self.etag = '"{}"'.format(
+            hashlib.sha1(orjson.dumps(tree.model_dump(exclude={"version"}))).hexdigest()
+        )
+        self.jurisdictions: Dict[Any, List[CourtSystemInDB]] = {}
+        self.courts: Dict[Any, List[CourtSystemInDB]] = {}
+        for state in tree.states:
+            self.jurisdictions[state.id] = [
+                CourtSystemInDB(id=jurisdiction.id, name=jurisdiction.name)
+                for jurisdiction in state.jurisdictions
+            ]
+            for jurisdiction in state.jurisdictions:
+                self.courts[jurisdiction.id] = jurisdiction.courts
+
+
+class ReferenceDataCache:
+    """In-process copy of the court system: states, jurisdictions and courts.
+
+    `version` bumps whenever this process changes the court system; the TTL
+    bounds how stale other workers can get. The ETag is a digest of the
+    content, so every worker serving the same data returns the same tag.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+
+    def _load(self, db: Session, version: int) -> CourtSystemTree:
+        courts = defaultdict(list)
+        for court in db.query(Court.id, Court.name, Court.jurisdiction_id).order_by(
+            Court.name
+        ):
+            courts[court.jurisdiction_id].append(
+                CourtSystemInDB(id=court.id, name=court.name)
+            )
+        jurisdictions = defaultdict(list)
+        for jurisdiction in db.query(
+            Jurisdiction.id, Jurisdiction.name, Jurisdiction.state_id
+        ).order_by(Jurisdiction.name):
+            jurisdictions[jurisdiction.state_id].append(
+                JurisdictionNode(
+                    id=jurisdiction.id,
+                    name=jurisdiction.name,
+                    courts=courts.get(jurisdiction.id, []),
+                )
+            )
+        states = [
+            StateNode(
+                id=state.id,
+                name=state.name,
+                jurisdictions=jurisdictions.get(state.id, []),
+            )
+            for state in db.query(State.id, State.name).order_by(State.name)
+        ]
+        return CourtSystemTree(version=version, states=states)
+
+    def _current(self, db: Session) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl:
+            return snapshot
+        version = self.version
+        snapshot = _Snapshot(self._load(db, version))
+        with self._lock:
+            # An invalidation while we were loading means this copy may be stale.
+            if self.version == version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def tree(self, db: Session) -> Tuple[CourtSystemTree, str]:
+        snapshot = self._current(db)
+        return snapshot.tree, snapshot.etag
+
+    def etag(self, db: Session) -> str:
+        return self._current(db).etag
+
+    def states(self, db: Session) -> List[CourtSystemInDB]:
+        return [
+            CourtSystemInDB(id=state.id, name=state.name)
+            for state in self._current(db).tree.states
+        ]
+
+    def jurisdictions(self, db: Session, *, state_id: Any = None) -> List[CourtSystemInDB]:
+        snapshot = self._current(db)
+        if state_id is not None:
+            return snapshot.jurisdictions.get(state_id, [])
+        return [
+            jurisdiction
+            for jurisdictions in snapshot.jurisdictions.values()
+            for jurisdiction in jurisdictions
+        ]
+
+    def courts(self, db: Session, *, jurisdiction_id: str) -> List[CourtSystemInDB]:
+        return self._current(db).courts.get(jurisdiction_id, [])
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._snapshot = None
+
+
+reference_data = ReferenceDataCache(ttl=settings.REFERENCE_DATA_TTL_SECONDS)
@@ -0,0 +1,332 @@
+import datetime
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.errors.exceptions import (
+    DoesNotExistException,
+    UnauthorizedEndpointException,
+)
+from app.core.services.stats import GLOBAL_SCOPE, jurisdiction_scope, stats_service
+from app.core.services.template_catalogue import template_catalogue
+from app.core.services.utils.cache import TTLCache
+from app.core.settings.configurations import settings
+from app.database.sessions.mongo_client import document_collection
+from app.models.commissioner_profile_model import CommissionerProfile
+from app.repositories.commissioner_profile_repo import comm_profile_repo
+from app.repositories.court_system_repo import court_repo
+from app.repositories.head_of_unit_repo import head_of_unit_repo
+from app.repositories.user_repo import user_repo
+from app.schemas.affidavit_schema import (
+    SLIM_DOCUMENT_PROJECTION,
+    slim_document_list_serialiser,
+)
+from app.schemas.court_system_schema import CourtSystemInDB
+from app.schemas.report_schema import (
+    CommissionerReport,
+    CommissionersReport,
+    DocumentReports,
+    DocumentTimeSeriesReport,
+    ReportBucket,
+)
+from app.schemas.shared_schema import DateRange
+from app.schemas.user_schema import FullCommissionerInResponse
+
+REPORT_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y")
+
+
+def parse_report_date(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parse a report date given as YYYY-MM-DD or MM/DD/YYYY."""
+    if not value:
+        return None
+    for date_format in REPORT_DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid date {value}, expected YYYY-MM-DD or MM/DD/YYYY",
+    )
+
+
+def report_date_range(
+    from_date: Optional[str] = None, to_date: Optional[str] = None
+) -> DateRange:
+    """DateRange from query parameters, rejecting bad dates before any work starts."""
+    parse_report_date(from_date)
+    parse_report_date(to_date)
+    return DateRange(from_date=from_date, to_date=to_date)
+
+
+def date_range_filter(
+    field: str, date_range: Optional[DateRange]
+) -> Dict[str, Any]:
+    """Mongo range on `field`; `to_date` is inclusive of the whole day."""
+    if date_range is None:
+        return {}
+    from_date = parse_report_date(date_range.from_date)
+    to_date = parse_report_date(date_range.to_date)
+    date_filter = {}
+    if from_date:
+        date_filter["$gte"] = from_date
+    if to_date:
+        date_filter["$lt"] = to_date + datetime.timedelta(days=1)
+    return {field: date_filter} if date_filter else {}
+
+
+def attestation_date_filter(date_range: Optional[DateRange]) -> Dict[str, Any]:
+    return date_range_filter("attestation_date", date_range)
+
+
+def commissioner_summary(profile: CommissionerProfile) -> FullCommissionerInResponse:
+    commissioner = profile.user
+    return FullCommissionerInResponse(
+        id=commissioner.id,
+        first_name=commissioner.first_name,
+        last_name=commissioner.last_name,
+        email=commissioner.email,
+        court=CourtSystemInDB(id=profile.court.id, name=profile.court.name),
+        is_active=commissioner.is_active,
+    )
+
+
+class CommissionerReportEngine:
+    """Builds commissioner reports with one SQL query and one Mongo query."""
+
+    async def attested_documents_by_commissioner(
+        self,
+        commissioner_ids: List[str],
+        date_range: Optional[DateRange] = None,
+        projection: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        documents = defaultdict(list)
+        if not commissioner_ids:
+            return documents
+        query = {
+            "is_attested": True,
+            "commissioner_id": {"$in": commissioner_ids},
+            **attestation_date_filter(date_range),
+        }
+        projection = {**(projection or SLIM_DOCUMENT_PROJECTION), "commissioner_id": 1}
+        cursor = document_collection.find(query, projection).sort("attestation_date", -1)
+        async for document in cursor:
+            documents[document["commissioner_id"]].append(document)
+        return documents
+
+    async def commissioners_report(
+        self,
+        db: Session,
+        date_range: Optional[DateRange] = None,
+        *,
+        jurisdiction_id: Optional[str] = None,
+        court_id: Optional[str] = None,
+    ) -> List[CommissionersReport]:
+        profiles = comm_profile_repo.get_profiles_with_user_and_court(
+            db, jurisdiction_id=jurisdiction_id, court_id=court_id
+        )
+        documents = await self.attested_documents_by_commissioner(
+            [profile.commissioner_id for profile in profiles], date_range
+        )
+        return [
+            CommissionersReport(
+                commissioner=commissioner_summary(profile),
+                attested_documents=slim_document_list_serialiser(
+                    documents.get(profile.commissioner_id, [])
+                ),
+            )
+            for profile in profiles
+        ]
+
+    async def commissioner_report(
+        self,
+        db: Session,
+        commissioner_id: str,
+        date_range: Optional[DateRange] = None,
+        *,
+        jurisdiction_id: Optional[str] = None,
+    ) -> CommissionerReport:
+        profiles = comm_profile_repo.get_profiles_with_user_and_court(
+            db, commissioner_id=commissioner_id
+        )
+        if not profiles:
+            raise DoesNotExistException(detail="This commissioner does not exist")
+        profile = profiles[0]
+        if jurisdiction_id and profile.court.jurisdiction_id != jurisdiction_id:
+            raise UnauthorizedEndpointException(
+                detail="You cannot view this commissioner's report"
+            )
+        documents = await self.attested_documents_by_commissioner(
+            [commissioner_id],
+            date_range,
+            projection={"name": 1, "attestation_date": 1, "created_at": 1},
+        )
+        return CommissionerReport(
+            commissioner=commissioner_summary(profile),
+            attested_documents=[
+                DocumentReports(
+                    name=document.get("name", ""),
+                    attested_date=document.get("attestation_date"),
+                    date_created=document.get("created_at"),
+                )
+                for document in documents.get(commissioner_id, [])
+            ],
+        )
+
+
+report_engine = CommissionerReportEngine()
+
+
+# Grouping key and the date each dimension is bucketed on.
+REPORT_DIMENSIONS = {
+    "court": ("$court_id", "created_at"),
+    "template": ("$template_id", "created_at"),
+    "status": ("$status", "created_at"),
+    "commissioner": ("$commissioner_id", "attestation_date"),
+}
+REPORT_GRANULARITIES = ("day", "week", "month")
+
+
+def build_time_series_pipeline(
+    match: Dict[str, Any], dimension: str, granularity: str
+) -> List[Dict[str, Any]]:
+    key, date_field = REPORT_DIMENSIONS[dimension]
+    truncate = {"date": f"${date_field}", "unit": granularity}
+    if granularity == "week":
+        truncate["startOfWeek"] = "monday"
+    return [
+        {"$match": {**match, date_field: {"$ne": None, **match.get(date_field, {})}}},
+        {
+            "$group": {
+                "_id": {"period": {"$dateTrunc": truncate}, "key": key},
+                "documents": {"$sum": 1},
+                "revenue": {
+                    "$sum": {
+                        "$cond": [
+                            {
+                                "$or": [
+                                    {"$eq": ["$status", "PAID"]},
+                                    {"$eq": ["$is_attested", True]},
+                                ]
+                            },
+                            {"$ifNull": ["$amount_paid", 0]},
+                            0,
+                        ]
+                    }
+                },
+            }
+        },
+        {"$sort": {"_id.period": 1, "_id.key": 1}},
+    ]
+
+
+class DocumentReportService:
+    """Time-bucketed document reports by court, template, status or commissioner.
+
+    Results are cached per (scope, dimension, granularity, range) and a scope's
+    entries are dropped whenever a document in it is attested.
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(ttl=settings.REPORT_CACHE_TTL_SECONDS, maxsize=256)
+        self._generations: Dict[str, int] = defaultdict(int)
+
+    async def _names(
+        self, db: Session, dimension: str, keys: List[str]
+    ) -> Dict[str, str]:
+        if not keys:
+            return {}
+        if dimension == "court":
+            return {
+                court.id: court.name
+                for court in court_repo.get_multi_by_ids(db, ids=keys)
+            }
+        if dimension == "commissioner":
+            return {
+                user.id: f"{user.first_name} {user.last_name}"
+                for user in user_repo.get_multi_by_ids(db, ids=keys)
+            }
+        if dimension == "template":
+            return await template_catalogue.names(keys)
+        return {key: key for key in keys}
+
+    async def time_series(
+        self,
+        db: Session,
+        *,
+        dimension: str,
+        granularity: str,
+        date_range: Optional[DateRange] = None,
+        jurisdiction_id: Optional[str] = None,
+    ) -> DocumentTimeSeriesReport:
+        scope = jurisdiction_scope(jurisdiction_id) if jurisdiction_id else GLOBAL_SCOPE
+        from_date = parse_report_date(date_range.from_date if date_range else None)
+        to_date = parse_report_date(date_range.to_date if date_range else None)
+        cache_key = (scope, dimension, granularity, from_date, to_date)
+        report = self._cache.get(cache_key)
+        if report is not None:
+            return report
+        generation = self._generations[scope]
+
+        _, date_field = REPORT_DIMENSIONS[dimension]
+        match: Dict[str, Any] = {}
+        if jurisdiction_id:
+            courts = head_of_unit_repo.get_courts_under_jurisdiction(
+                db, jurisdiction_id=jurisdiction_id
+            )
+            match["court_id"] = {"$in": [court.id for court in courts]}
+        if dimension == "commissioner":
+            match["is_attested"] = True
+        date_filter = {}
+        if from_date:
+            date_filter["$gte"] = from_date
+        if to_date:
+            date_filter["$lt"] = to_date + datetime.timedelta(days=1)
+        if date_filter:
+            match[date_field] = date_filter
+
+        rows = await document_collection.aggregate(
+            build_time_series_pipeline(match, dimension, granularity)
+        ).to_list(length=None)
+        names = await self._names(
+            db, dimension, list({row["_id"]["key"] for row in rows if row["_id"]["key"]})
+        )
+        report = DocumentTimeSeriesReport(
+            scope=scope,
+            dimension=dimension,
+            granularity=granularity,
+            from_date=from_date,
+            to_date=to_date,
+            buckets=[
+                ReportBucket(
+                    period=row["_id"]["period"],
+                    key=row["_id"]["key"],
+                    name=names.get(row["_id"]["key"]),
+                    documents=row["documents"],
+                    revenue=row["revenue"],
+                )
+                for row in rows
+            ],
+        )
+        # Skip caching if the scope was invalidated while we were computing.
+        if self._generations[scope] == generation:
+            self._cache.set(cache_key, report)
+        return report
+
+    async def invalidate_for_document(self, document: Optional[Dict[str, Any]]) -> None:
+        """Drop cached reports covering `document`, called after attestation."""
+        scopes = {GLOBAL_SCOPE}
+        if document and document.get("court_id"):
+            jurisdiction_id = await stats_service.get_jurisdiction_id(document["court_id"])
+            if jurisdiction_id:
+                scopes.add(jurisdiction_scope(jurisdiction_id))
+        for scope in scopes:
+            self._generations[scope] += 1
+        for key in self._cache.keys():
+            if key[0] in scopes:
+                self._cache.pop(key)
+
+
+document_reports = DocumentReportService()
@@ -0,0 +1,220 @@
+"""Pre-aggregated document counters for the dashboards.
+
+Each stats document holds the counters for one scope: ``court:<id>`` (read
+by the head-of-unit dashboard) or ``global`` (the admin dashboard). The
+public dashboard aggregates the user's own documents, see `dashboard`.
+Document lifecycle routes call `record_transition` with the document before
+and after the change, and the difference is applied to every affected scope
+with a single `$inc`.
+
+The counters are derived data. If they drift (a failed write, a manual edit),
+rebuild them with:
+
+    python -m app.core.services.stats reconcile
+"""
+import argparse
+import asyncio
+import datetime
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from pymongo import ReplaceOne, UpdateOne
+
+from app.core.services.utils.cache import LRUCache
+from app.database.sessions.mongo_client import document_collection, stats_collection
+from app.database.sessions.session import AsyncSessionLocal
+from app.repositories.court_system_repo import async_court_repo
+
+
+STATUSES = ("SAVED", "PAID", "ATTESTED")
+COUNTERS = (
+    "total",
+    "saved",
+    "paid",
+    "attested",
+    "active_total",
+    "active_saved",
+    "active_paid",
+    "active_attested",
+    "revenue",
+)
+GLOBAL_SCOPE = "global"
+
+
+def court_scope(court_id: str) -> str:
+    return f"court:{court_id}"
+
+
+def jurisdiction_scope(jurisdiction_id: str) -> str:
+    return f"jurisdiction:{jurisdiction_id}"
+
+
+def document_counters(document: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """What a single document contributes to the counters of its scopes."""
+    if not document:
+        return {}
+    counters = {"total": 1}
+    active = not document.get("is_archived", False)
+    if active:
+        counters["active_total"] = 1
+    status = document.get("status")
+    if status in STATUSES:
+        counters[status.lower()] = 1
+        if active:
+            counters[f"active_{status.lower()}"] = 1
+    if status == "PAID" or document.get("is_attested"):
+        counters["revenue"] = document.get("amount_paid") or 0
+    return counters
+
+
+def _counter_group(key: Any) -> Dict[str, Any]:
+    """`$group` stage computing `document_counters` in bulk, for reconciliation."""
+    active = {"$ne": ["$is_archived", True]}
+
+    def count(*conditions):
+        return {"$sum": {"$cond": [{"$and": list(conditions)}, 1, 0]}}
+
+    group = {
+        "_id": key,
+        "total": {"$sum": 1},
+        "active_total": count(active),
+        "revenue": {
+            "$sum": {
+                "$cond": [
+                    {
+                        "$or": [
+                            {"$eq": ["$status", "PAID"]},
+                            {"$eq": ["$is_attested", True]},
+                        ]
+                    },
+                    {"$ifNull": ["$amount_paid", 0]},
+                    0,
+                ]
+            }
+        },
+    }
+    for status in STATUSES:
+        is_status = {"$eq": ["$status", status]}
+        group[status.lower()] = count(is_status)
+        group[f"active_{status.lower()}"] = count(is_status, active)
+    return {"$group": group}
+
+
+class StatsService:
+    def __init__(self):
+        self._court_jurisdictions = LRUCache(maxsize=4096)
+
+    async def get_jurisdiction_id(self, court_id: str) -> Optional[str]:
+        if court_id in self._court_jurisdictions:
+            return self._court_jurisdictions.get(court_id)
+        async with AsyncSessionLocal() as db:
+            court = await async_court_repo.get(db, id=court_id)
+        jurisdiction_id = court.jurisdiction_id if court else None
+        self._court_jurisdictions.set(court_id, jurisdiction_id)
+        return jurisdiction_id
+
+    async def _scopes(self, document: Optional[Dict[str, Any]]) -> List[str]:
+        if not document:
+            return []
+        scopes = [GLOBAL_SCOPE]
+        if document.get("court_id"):
+            scopes.append(court_scope(document["court_id"]))
+        return scopes
+
+    async def record_transition(
+        self,
+        before: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> None:
+        """Apply the counter delta of a document going from `before` to `after`.
+
+        Pass `before=None` for a new document and `after=None` for a deleted one.
+        Failures are logged, not raised: stats never block a document write.
+        """
+        try:
+            deltas: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            for scope in await self._scopes(before):
+                for counter, value in document_counters(before).items():
+                    deltas[scope][counter] -= value
+            for scope in await self._scopes(after):
+                for counter, value in document_counters(after).items():
+                    deltas[scope][counter] += value
+
+            now = datetime.datetime.now(datetime.timezone.utc)
+            operations = []
+            for scope, counters in deltas.items():
+                increments = {key: value for key, value in counters.items() if value}
+                if increments:
+                    operations.append(
+                        UpdateOne(
+                            {"_id": scope},
+                            {"$inc": increments, "$set": {"updated_at": now}},
+                            upsert=True,
+                        )
+                    )
+            if operations:
+                await stats_collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"Could not update document stats: {str(e)}")
+
+    async def get(self, scope: str) -> Dict[str, int]:
+        stats = await stats_collection.find_one({"_id": scope}) or {}
+        return {counter: stats.get(counter, 0) for counter in COUNTERS}
+
+    async def get_many(self, scopes: List[str]) -> Dict[str, Dict[str, int]]:
+        """Counters for each of `scopes` in one query; missing scopes are zero."""
+        found = {
+            stats["_id"]: stats
+            async for stats in stats_collection.find({"_id": {"$in": scopes}})
+        }
+        return {
+            scope: {counter: found.get(scope, {}).get(counter, 0) for counter in COUNTERS}
+            for scope in scopes
+        }
+
+    async def ensure_initialised(self) -> None:
+        """Build the collection on first boot so dashboards do not start at zero."""
+        if not await stats_collection.find_one({"_id": GLOBAL_SCOPE}, {"_id": 1}):
+            await self.reconcile()
+
+    async def reconcile(self) -> int:
+        """Rebuild every stats document from the documents collection."""
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        rebuilt: Dict[str, Dict[str, int]] = {}
+
+        async for row in document_collection.aggregate([_counter_group(None)]):
+            rebuilt[GLOBAL_SCOPE] = row
+
+        court_rows = document_collection.aggregate([_counter_group("$court_id")])
+        async for row in court_rows:
+            if row["_id"]:
+                rebuilt[court_scope(row["_id"])] = row
+
+        operations = [
+            ReplaceOne(
+                {"_id": scope},
+                {
+                    **{counter: counters[counter] for counter in COUNTERS},
+                    "updated_at": started_at,
+                },
+                upsert=True,
+            )
+            for scope, counters in rebuilt.items()
+        ]
+        if operations:
+            await stats_collection.bulk_write(operations, ordered=False)
+        # Scopes that no longer have any documents were not touched above.
+        await stats_collection.delete_many({"updated_at": {"$lt": started_at}})
+        logger.info(f"Reconciled {len(operations)} stats documents")
+        return len(operations)
+
+
+stats_service = StatsService()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain the stats collection.")
+    parser.add_argument("command", choices=["reconcile"])
+    parser.parse_args()
+    asyncio.run(stats_service.reconcile())
@@ -0,0 +1,124 @@
+"""In-process cache of the template collection.
+
+Templates change rarely and are read on every document creation flow, so the
+whole collection is loaded in one query and indexed by id and by category.
+Admin template writes call `invalidate`; the TTL bounds how long other
+workers can serve a stale catalogue. Concurrent misses share one load.
+"""
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from bson import ObjectId
+
+from app.core.settings.configurations import settings
+from app.database.sessions.mongo_client import template_collection
+from app.schemas.affidavit_schema import SlimTemplateInResponse
+
+
+class _Catalogue:
+    def __init__(self, templates: List[Dict[str, Any]]):
+        self.loaded_at = time.monotonic()
+        self.templates = templates
+        self.by_id = {str(template["_id"]): template for template in templates}
+        self.by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for template in templates:
+            self.by_category[template.get("category_id")].append(template)
+
+
+def _enabled(templates: List[Dict[str, Any]], include_disabled: bool):
+    if include_disabled:
+        return list(templates)
+    return [template for template in templates if not template.get("is_disabled")]
+
+
+class TemplateCatalogue:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._catalogue: Optional[_Catalogue] = None
+        self._extra: Dict[str, Dict[str, Any]] = {}
+        self._generation = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def _single_flight(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled request doesn't cancel the load for the others.
+        return await asyncio.shield(future)
+
+    async def _load(self) -> _Catalogue:
+        generation = self._generation
+        catalogue = _Catalogue(await template_collection.find({}).to_list(length=None))
+        if generation == self._generation:
+            self._catalogue = catalogue
+            self._extra = {}
+        return catalogue
+
+    async def _current(self) -> _Catalogue:
+        catalogue = self._catalogue
+        if catalogue is not None and time.monotonic() - catalogue.loaded_at < self.ttl:
+            return catalogue
+        return await self._single_flight(("catalogue", self._generation), self._load)
+
+    async def all(self, *, include_disabled: bool = False) -> List[Dict[str, Any]]:
+        return _enabled((await self._current()).templates, include_disabled)
+
+    async def by_category(
+        self, category_id: str, *, include_disabled: bool = False
+    ) -> List[Dict[str, Any]]:
+        catalogue = await self._current()
+        return _enabled(catalogue.by_category.get(category_id, []), include_disabled)
+
+    async def get(self, template_id: Any) -> Optional[Dict[str, Any]]:
+        """Raw template document, or None. Templates created on another worker
+        since the last load are fetched individually."""
+        template_id = str(template_id)
+        catalogue = await self._current()
+        template = catalogue.by_id.get(template_id) or self._extra.get(template_id)
+        if template is not None or not ObjectId.is_valid(template_id):
+            return template
+
+        async def load_one():
+            generation = self._generation
+            template = await template_collection.find_one({"_id": ObjectId(template_id)})
+            if template is not None and generation == self._generation:
+                self._extra[template_id] = template
+            return template
+
+        return await self._single_flight(("template", template_id), load_one)
+
+    async def names(self, template_ids: List[Any]) -> Dict[str, str]:
+        names = {}
+        for template_id in set(map(str, template_ids)):
+            template = await self.get(template_id)
+            if template is not None:
+                names[template_id] = template.get("name")
+        return names
+
+    async def slim(self, category_id: Optional[str] = None) -> List[SlimTemplateInResponse]:
+        """Enabled templates without their `content`."""
+        templates = (
+            await self.by_category(category_id) if category_id else await self.all()
+        )
+        return [
+            SlimTemplateInResponse(
+                id=str(template["_id"]),
+                name=template["name"],
+                price=template["price"],
+                description=template["description"],
+                category_id=template["category_id"],
+            )
+            for template in templates
+        ]
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._catalogue = None
+        self._extra = {}
+
+
+template_catalogue = TemplateCatalogue(ttl=settings.TEMPLATE_CACHE_TTL_SECONDS)
@@ -0,0 +1,165 @@
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Set
+
+from loguru import logger
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.services.utils.cache import TTLCache
+from app.core.settings.configurations import settings
+from app.repositories.user_invalidation_repo import user_invalidation_repo
+
+
+class CachedUser(BaseModel):
+    """What permission checks need to know about a user, without the ORM row."""
+
+    id: str
+    user_type: str
+    is_active: bool
+    activation_version: int
+
+
+class UserCache:
+    """Per-process cache of `CachedUser`, keyed by user id.
+
+    The user repository invalidates an entry locally on every write, and
+    records activation and user type changes, with the user's new
+    `activation_version`, in the `user_invalidations` table. `sync` reads
+    that table at most every `sync_seconds`, evicts the users changed by
+    other workers and keeps the latest version of each, so a deactivation
+    takes effect on every worker within `sync_seconds` instead of the
+    cache TTL.
+
+    Access tokens carry the user type and version they were minted with;
+    while the latest versions are fresh, `from_claims` trusts them for a
+    user that is not cached, since any later change would have raised the
+    version above the token's.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int,
+        sync_seconds: float,
+        token_lifetime_seconds: float,
+    ):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+        self.sync_seconds = sync_seconds
+        # Every token minted before a change expires inside the window, and
+        # rows committed late still fall in it.
+        self.window = timedelta(
+            seconds=token_lifetime_seconds + 2 * max(ttl, sync_seconds)
+        )
+        self._next_sync = 0.0
+        self._synced_at: Optional[float] = None
+        self._seen: Set[int] = set()
+        self._versions: Dict[str, int] = {}
+        self._sync_lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[CachedUser]:
+        return self._cache.get(user_id)
+
+    def set(self, user) -> CachedUser:
+        cached_user = CachedUser(
+            id=user.id,
+            user_type=user.user_type.name,
+            is_active=user.is_active,
+            activation_version=user.activation_version,
+        )
+        self._cache.set(user.id, cached_user)
+        return cached_user
+
+    def from_claims(self, token_details: Dict[str, Any]) -> Optional[CachedUser]:
+        """Cache and return the user described by an access token's claims.
+
+        Returns None, so the caller loads the user instead, when the token
+        predates the `user_type` claim or the versions have not been synced
+        recently enough to rule out a later change.
+        """
+        if (
+            "user_type" not in token_details
+            or token_details.get("ver") is None
+            or not self.is_fresh()
+        ):
+            return None
+        cached_user = CachedUser(
+            id=token_details["id"],
+            user_type=token_details["user_type"],
+            is_active=True,
+            activation_version=token_details["ver"],
+        )
+        self._cache.set(cached_user.id, cached_user)
+        return cached_user
+
+    def is_revoked(self, user_id: str, activation_version: int) -> bool:
+        """Whether a token with this version was minted before a change that
+        `sync` has seen."""
+        return activation_version < self._versions.get(user_id, activation_version)
+
+    def is_fresh(self) -> bool:
+        return (
+            self._synced_at is not None
+            and time.monotonic() - self._synced_at < 2 * self.sync_seconds
+        )
+
+    def invalidate(self, user_id: str, activation_version: Optional[int] = None) -> None:
+        """Evict `user_id`; with `activation_version`, also revoke the
+        user's older tokens on this worker ahead of the next `sync`."""
+        self._cache.pop(user_id)
+        if activation_version is not None:
+            self._versions[user_id] = max(
+                activation_version, self._versions.get(user_id, 0)
+            )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def record_change(self, db: Session, user_id: str, activation_version: int) -> None:
+        """Tell every worker that `user_id` changed; commits with `db`."""
+        user_invalidation_repo.record(
+            db,
+            user_id=user_id,
+            activation_version=activation_version,
+            retention=2 * self.window,
+        )
+
+    def sync(self, db: Session) -> None:
+        """Evict users changed on any worker since the last sync.
+
+        Runs at most every `sync_seconds`; concurrent requests skip it
+        rather than wait. On a database error the TTL remains the bound and
+        `from_claims` stops trusting tokens once the versions go stale.
+        """
+        if time.monotonic() < self._next_sync:
+            return
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() < self._next_sync:
+                return
+            self._next_sync = time.monotonic() + self.sync_seconds
+            seen, versions = set(), {}
+            for id, user_id, activation_version in user_invalidation_repo.get_recent(
+                db, window=self.window
+            ):
+                if id not in self._seen:
+                    self.invalidate(user_id)
+                seen.add(id)
+                versions[user_id] = max(activation_version, versions.get(user_id, 0))
+            self._seen, self._versions = seen, versions
+            self._synced_at = time.monotonic()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Could not sync the user cache: {str(e)}")
+        finally:
+            self._sync_lock.release()
+
+
+user_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    maxsize=settings.USER_CACHE_SIZE,
+    sync_seconds=settings.USER_CACHE_SYNC_SECONDS,
+    token_lifetime_seconds=settings.JWT_EXPIRE_MINUTES * 60,
+)
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[List[Hashable]], Awaitable[Dict[Hashable, V]]]
+
+
+class DataLoader(Generic[V]):
+    """Request-scoped batching loader.
+
+    `load` calls made in the same event-loop tick are collected and resolved
+    with a single call to `batch_load_fn`, which receives the distinct keys
+    and returns a mapping of the keys it found. Results are memoised for the
+    lifetime of the loader, so create one per request.
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn):
+        self.batch_load_fn = batch_load_fn
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Hashable] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key: Hashable) -> "asyncio.Future[Optional[V]]":
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._queue:
+            loop.call_soon(self._schedule_dispatch)
+        self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Optional[V]]:
+        keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in keys))
+        return dict(zip(keys, values))
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        try:
+            results = await self.batch_load_fn(keys)
+        except Exception as error:
+            for key in keys:
+                self._cache.pop(key).set_exception(error)
+            return
+        for key in keys:
+            self._cache[key].set_result(results.get(key))
@@ -7,6 +7,8 @@ from bson import ObjectId
 from loguru import logger
 from base64 import b64encode
 
+from app.core.settings.configurations import settings
+
 
 def generate_document_name(length: int = 10) -> str:
     """Generate a random document name."""
@@ -15,16 +17,49 @@ def generate_document_name(length: int = 10) -> str:
 
 
 
-def generate_qr_code_base64(url: str, version: int = 1, box_size: int = 10, border: int = 5) -> str:
-    """Generate a QR code for a given URL and return it as a base64 encoded string."""
+def generate_qr_code_png(url: str, version: int = 1, box_size: int = 10, border: int = 5) -> bytes:
+    """Generate a QR code for a given URL and return the PNG bytes."""
     qr = qrcode.QRCode(version=version, box_size=box_size, border=border)
     qr.add_data(url)
     qr.make(fit=True)
     img = qr.make_image(fill='black', back_color='white')
     with BytesIO() as buffered:
         img.save(buffered)
-        img_base64 = b64encode(buffered.getvalue()).decode('utf-8')
-    return img_base64
+        return buffered.getvalue()
+
+
+def generate_qr_code_svg(url: str, version: int = 1, border: int = 5) -> bytes:
+    """Generate a QR code for a given URL as a single-path SVG in module units."""
+    qr = qrcode.QRCode(version=version, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    size = len(matrix)
+    path = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < size:
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < size and row[x]:
+                x += 1
+            path.append(f"M{start} {y}h{x - start}v1H{start}z")
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" '
+        f'shape-rendering="crispEdges"><rect width="{size}" height="{size}" fill="#fff"/>'
+        f'<path d="{"".join(path)}"/></svg>'
+    ).encode("utf-8")
+
+
+def generate_qr_code_base64(url: str, version: int = 1, box_size: int = 10, border: int = 5) -> str:
+    """Generate a QR code for a given URL and return it as a base64 encoded string."""
+    return b64encode(generate_qr_code_png(url, version, box_size, border)).decode('utf-8')
+
+
+def get_document_verification_url(document_name: str) -> str:
+    return f"{settings.DOCUMENT_VERIFICATION_URL.rstrip('/')}/{document_name}"
 
 
 
@@ -1,5 +1,5 @@
 import os
-from typing import Any
+from typing import Any, Optional
 
 from pathlib import Path
 
@@ -16,6 +16,7 @@ class CustomSettings(BaseSettings):
     PROJECT_NAME: str = "E-Affidavit Server"
     API_URL_PREFIX: str
     POSTGRES_DB_URL: str
+    ASYNC_POSTGRES_DB_URL: Optional[str] = None
     MONGO_DB_URL: str
     JWT_TOKEN_PREFIX: str
     JWT_ALGORITHM: str
@@ -44,6 +45,30 @@ class CustomSettings(BaseSettings):
     RESET_PASSWORD_URL:str
     SENDER_NAME:str
     ACCEPT_INVITE_URL:str
+    QR_CODE_WORKERS: int = 2
+    QR_CODE_MAX_PENDING: int = 64
+    QR_CODE_CACHE_SIZE: int = 1024
+    HEAD_OF_UNIT_DASHBOARD_TTL_SECONDS: int = 60
+    REPORT_CACHE_TTL_SECONDS: int = 300
+    EXPORT_BATCH_SIZE: int = 500
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_SYNC_SECONDS: float = 5
+    QUERY_COUNT_WARNING_THRESHOLD: int = 20
+    REFERENCE_DATA_TTL_SECONDS: int = 600
+    TEMPLATE_CACHE_TTL_SECONDS: int = 300
+    POSTMARK_API_URL: str = "https://api.postmarkapp.com"
+    POSTMARK_TIMEOUT_SECONDS: float = 10
+    POSTMARK_MAX_CONNECTIONS: int = 10
+    EMAIL_OUTBOX_BATCH_SIZE: int = 100
+    EMAIL_OUTBOX_POLL_SECONDS: float = 15
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: int = 30
+    INVITE_CSV_MAX_ROWS: int = 5000
+    DOCUMENT_VERIFICATION_URL: str = (
+        "https://e-affidavit-public-fe.vercel.app/verify-document"
+    )
 
 
 
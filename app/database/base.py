@@ -6,6 +6,8 @@ from app.models.email_model import Email
 from app.models.head_of_unit_model import HeadOfUnit
 from app.models.user_type_model import UserType
 from app.models.user_model import User
+from app.models.user_invite_models import UserInvite
+from app.models.user_invalidation_model import UserInvalidation
 from app.models.affidavit_models import AffidavitCategory
 from app.models.payment_model import Payment
 
@@ -9,5 +9,6 @@ db_client = client.get_database("E-Affidavit-dev")
 # You can also access a specific collection like this:
 template_collection = db_client["templates"]
 document_collection = db_client["documents"]
+stats_collection = db_client["stats"]
 
 
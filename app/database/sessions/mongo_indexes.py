@@ -0,0 +1,200 @@
+"""Declarative registry of the Mongo indexes the routes rely on.
+
+Indexes are reconciled on startup and can be managed by hand with:
+
+    python -m app.database.sessions.mongo_indexes reconcile [--drop-extra]
+    python -m app.database.sessions.mongo_indexes explain
+"""
+import argparse
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+from app.database.sessions.mongo_client import (
+    db_client,
+    document_collection,
+    template_collection,
+)
+
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    document_collection.name: [
+        IndexModel([("name", ASCENDING)], name="name_unique", unique=True),
+        IndexModel(
+            [
+                ("created_by_id", ASCENDING),
+                ("status", ASCENDING),
+                ("is_archived", ASCENDING),
+            ],
+            name="created_by_status_archived",
+        ),
+        IndexModel(
+            [
+                ("created_by_id", ASCENDING),
+                ("is_archived", ASCENDING),
+                ("created_at", DESCENDING),
+                # Tie-breaker of the dashboard and keyset-paginated sorts.
+                ("_id", DESCENDING),
+            ],
+            name="created_by_archived_created_at",
+        ),
+        IndexModel(
+            [("commissioner_id", ASCENDING), ("attestation_date", DESCENDING)],
+            name="commissioner_attestation_date",
+        ),
+        IndexModel(
+            [("court_id", ASCENDING), ("status", ASCENDING)],
+            name="court_status",
+        ),
+    ],
+    template_collection.name: [
+        # create_template checks for an existing name before inserting.
+        IndexModel([("name", ASCENDING)], name="name"),
+        IndexModel(
+            [("category_id", ASCENDING), ("is_disabled", ASCENDING)],
+            name="category_disabled",
+        ),
+        IndexModel([("is_disabled", ASCENDING)], name="is_disabled"),
+        IndexModel([("created_by_id", ASCENDING)], name="created_by"),
+    ],
+}
+
+
+# Representative filters for the hot queries, used by the explain report.
+HOT_QUERIES: Dict[str, List[Dict[str, Any]]] = {
+    document_collection.name: [
+        {"name": "sample"},
+        {"created_by_id": "sample", "status": "SAVED", "is_archived": False},
+        {"created_by_id": "sample", "is_archived": True},
+        {"commissioner_id": "sample", "attestation_date": {"$ne": None}},
+        {"court_id": "sample", "status": "ATTESTED"},
+        {"court_id": {"$in": ["sample"]}},
+    ],
+    template_collection.name: [
+        {"name": "sample"},
+        {"category_id": "sample", "is_disabled": False},
+        {"is_disabled": False},
+        {"created_by_id": "sample"},
+    ],
+}
+
+
+IndexSpec = Tuple[Tuple[Tuple[str, Any], ...], bool]
+
+
+def _spec(index: Dict[str, Any]) -> IndexSpec:
+    """Keys and uniqueness of an index, as compared during reconciliation.
+
+    Accepts both `IndexModel.document` and an `index_information()` entry.
+    """
+    keys = index["key"].items() if isinstance(index["key"], dict) else index["key"]
+    return (
+        tuple(
+            (field, int(direction) if isinstance(direction, (int, float)) else direction)
+            for field, direction in keys
+        ),
+        bool(index.get("unique", False)),
+    )
+
+
+async def reconcile_indexes(drop_extra: bool = False) -> Dict[str, Dict[str, List[str]]]:
+    """Create missing indexes and optionally drop ones not in the registry.
+
+    Indexes are matched on their keys and uniqueness, not their names, so an
+    index that already exists under another name is left alone. A registry
+    index whose name is taken by a different spec is rebuilt. Each index is
+    created on its own; one that fails (say a unique build over duplicate
+    values) is reported in `failed` without stopping the others.
+    """
+    summary = {}
+    for collection_name, models in INDEXES.items():
+        collection = db_client[collection_name]
+        existing = {
+            name: _spec(info)
+            for name, info in (await collection.index_information()).items()
+        }
+        existing_specs = set(existing.values())
+        wanted_specs = {_spec(model.document) for model in models}
+        created, rebuilt, failed = [], [], []
+
+        for model in models:
+            name, spec = model.document["name"], _spec(model.document)
+            if spec in existing_specs:
+                continue
+            try:
+                if name in existing:
+                    await collection.drop_index(name)
+                await collection.create_indexes([model])
+                (rebuilt if name in existing else created).append(name)
+            except PyMongoError as e:
+                logger.error(f"Could not create Mongo index {collection_name}.{name}: {e}")
+                failed.append(name)
+
+        extra = [
+            name
+            for name, spec in existing.items()
+            if name != "_id_"
+            and spec not in wanted_specs
+            and name not in rebuilt + failed
+        ]
+        if drop_extra:
+            for name in extra:
+                await collection.drop_index(name)
+
+        summary[collection_name] = dict(
+            created=created,
+            rebuilt=rebuilt,
+            failed=failed,
+            extra=extra,
+            dropped=extra if drop_extra else [],
+        )
+        logger.info(f"Mongo indexes for {collection_name}: {summary[collection_name]}")
+    return summary
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    stages = [plan.get("stage", "")]
+    if "inputStage" in plan:
+        stages += _plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+
+async def explain_report() -> List[Dict[str, Any]]:
+    """Explain every hot query and flag the ones answered by a collection scan."""
+    report = []
+    for collection_name, filters in HOT_QUERIES.items():
+        collection = db_client[collection_name]
+        for query in filters:
+            explanation = await collection.find(query).explain()
+            stages = _plan_stages(explanation["queryPlanner"]["winningPlan"])
+            report.append(
+                dict(
+                    collection=collection_name,
+                    filter=query,
+                    stages=stages,
+                    collection_scan="COLLSCAN" in stages,
+                )
+            )
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    if args.command == "reconcile":
+        await reconcile_indexes(drop_extra=args.drop_extra)
+        return
+
+    for row in await explain_report():
+        flag = "COLLSCAN" if row["collection_scan"] else "ok"
+        print(f"[{flag}] {row['collection']} {row['filter']} -> {' > '.join(row['stages'])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the Mongo index registry.")
+    parser.add_argument("command", choices=["reconcile", "explain"])
+    parser.add_argument("--drop-extra", action="store_true")
+    asyncio.run(_main(parser.parse_args()))
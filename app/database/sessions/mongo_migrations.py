@@ -0,0 +1,30 @@
+"""One-off Mongo data migrations.
+
+    python -m app.database.sessions.mongo_migrations <name>
+"""
+import argparse
+import asyncio
+
+from loguru import logger
+
+from app.database.sessions.mongo_client import document_collection
+
+
+async def drop_stored_qr_codes() -> int:
+    """Remove the base64 QR blobs; codes are now rendered by /documents/{name}/qr."""
+    result = await document_collection.update_many(
+        {"qr_code": {"$exists": True}}, {"$unset": {"qr_code": ""}}
+    )
+    logger.info(f"Removed stored QR codes from {result.modified_count} documents")
+    return result.modified_count
+
+
+MIGRATIONS = {
+    "drop_stored_qr_codes": drop_stored_qr_codes,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a Mongo data migration.")
+    parser.add_argument("migration", choices=list(MIGRATIONS))
+    asyncio.run(MIGRATIONS[parser.parse_args().migration]())
@@ -0,0 +1,32 @@
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Holds a one-item list rather than an int so increments made inside the
+# threadpool (sync routes) are visible to the middleware that reads it.
+_query_count: ContextVar[Optional[List[int]]] = ContextVar("query_count", default=None)
+
+
+def _count_query(*_) -> None:
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def install_query_counter(*engines: Engine) -> None:
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _count_query):
+            event.listen(engine, "before_cursor_execute", _count_query)
+
+
+def start_counting() -> List[int]:
+    counter = [0]
+    _query_count.set(counter)
+    return counter
+
+
+def current_query_count() -> int:
+    counter = _query_count.get()
+    return counter[0] if counter is not None else 0
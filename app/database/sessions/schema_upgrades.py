@@ -0,0 +1,87 @@
+"""Additive changes to SQL tables that already exist.
+
+`Base.metadata.create_all` creates missing tables but never alters existing
+ones. Columns added to a model after its table was deployed are listed in
+`COLUMN_UPGRADES` and added by `upgrade_schema` at startup, together with
+their indexes and an optional backfill of the rows already there.
+"""
+from typing import Callable, List, NamedTuple, Optional
+
+from loguru import logger
+from sqlalchemy import Column, case, inspect, text, true, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateColumn
+
+from app.models.email_model import Email, EmailStatus
+from app.models.user_invalidation_model import UserInvalidation
+from app.models.user_model import User
+
+# Key for pg_advisory_xact_lock, so concurrent app processes upgrade one at a time.
+SCHEMA_UPGRADE_LOCK = 720_531_001
+
+
+class ColumnUpgrade(NamedTuple):
+    column: Column
+    backfill: Optional[Callable[[Connection], None]] = None
+
+
+def backfill_email_status(connection: Connection) -> None:
+    # Emails queued before the outbox were sent (or not) by the old
+    # background task; none of them should be picked up and sent again.
+    connection.execute(
+        update(Email.__table__).values(
+            status=case(
+                (Email.__table__.c.delivered == true(), EmailStatus.DELIVERED),
+                else_=EmailStatus.FAILED,
+            )
+        )
+    )
+
+
+COLUMN_UPGRADES: List[ColumnUpgrade] = [
+    ColumnUpgrade(Email.__table__.c.status, backfill_email_status),
+    ColumnUpgrade(Email.__table__.c.attempts),
+    ColumnUpgrade(Email.__table__.c.next_attempt_at),
+    ColumnUpgrade(Email.__table__.c.message_id),
+    ColumnUpgrade(User.__table__.c.activation_version),
+    ColumnUpgrade(UserInvalidation.__table__.c.activation_version),
+]
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """Add every missing column in `COLUMN_UPGRADES`. Safe to run repeatedly.
+
+    Returns the added columns as "table.column".
+    """
+    added = []
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_UPGRADE_LOCK}
+            )
+        inspector = inspect(connection)
+        existing = {}
+        for upgrade in COLUMN_UPGRADES:
+            column, table = upgrade.column, upgrade.column.table
+            if table.name not in existing:
+                existing[table.name] = {
+                    info["name"] for info in inspector.get_columns(table.name)
+                }
+            if column.name in existing[table.name]:
+                continue
+
+            preparer = connection.dialect.identifier_preparer
+            definition = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(
+                text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}")
+            )
+            for index in table.indexes:
+                if column.name in index.columns:
+                    index.create(connection, checkfirst=True)
+            if upgrade.backfill is not None:
+                upgrade.backfill(connection)
+            added.append(f"{table.name}.{column.name}")
+
+    if added:
+        logger.info(f"Added columns {', '.join(added)}")
+    return added
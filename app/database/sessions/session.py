@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from  app.core.settings.configurations import settings
 
@@ -11,7 +13,18 @@ engine = create_engine(url,pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def get_async_url(sync_url: str) -> str:
+    """Swap the sync driver in the Postgres URL for asyncpg."""
+    return make_url(sync_url).set(drivername="postgresql+asyncpg").render_as_string(
+        hide_password=False
+    )
 
 
-
-
+async_url = settings.ASYNC_POSTGRES_DB_URL or get_async_url(url)
+async_engine = create_async_engine(async_url, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
@@ -8,13 +8,21 @@ from starlette.middleware import Middleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from app.database.sessions.session import engine
+from app.database.sessions.query_counter import install_query_counter, start_counting
+from app.database.sessions.session import async_engine, engine
+from app.core.services.email_outbox import email_outbox
+from app.core.services.qr_code import qr_code_service
+from app.core.services.stats import stats_service
 from app.database.base import Base
 from app.database.sessions.mongo_client import db_client, client
+from app.database.sessions.mongo_indexes import reconcile_indexes
+from app.database.sessions.schema_upgrades import upgrade_schema
 from app.api.routes.routes import router as global_router
 
 
 Base.metadata.create_all(engine)
+upgrade_schema(engine)
+install_query_counter(engine, async_engine.sync_engine)
 # CORS configuration
 origins = ["*"]  
 methods = ["GET", "POST", "PUT", "DELETE", "PATCH"]  
@@ -43,8 +51,14 @@ def create_application_instance() -> FastAPI:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         logger.info(f"Request: {request.method} {request.url}")
+        queries = start_counting()
         response = await call_next(request)
         logger.info(f"Response: {response.status_code}")
+        response.headers["X-Query-Count"] = str(queries[0])
+        if queries[0] > settings.QUERY_COUNT_WARNING_THRESHOLD:
+            logger.warning(
+                f"{request.method} {request.url.path} ran {queries[0]} SQL queries"
+            )
         return response
 
     @app.exception_handler(RequestValidationError)
@@ -83,6 +97,15 @@ async def startup_db_client():
     app.mongodb_client = client
 
     app.mongodb = app.mongodb_client.get_database("E-affidavit-dev")
+    try:
+        await reconcile_indexes()
+    except Exception as e:
+        logger.error(f"Could not reconcile Mongo indexes: {str(e)}")
+    try:
+        await stats_service.ensure_initialised()
+    except Exception as e:
+        logger.error(f"Could not initialise document stats: {str(e)}")
+    email_outbox.start()
     print("Hello world")
 
 
@@ -90,6 +113,9 @@ async def startup_db_client():
 async def shutdown_db_client():
     print("bye world")
     app.mongodb_client.close()
+    await email_outbox.stop()
+    await async_engine.dispose()
+    qr_code_service.shutdown()
 
 
 if __name__=="__main__":
@@ -1,6 +1,12 @@
 from sqlalchemy.sql.sqltypes import JSON
 from commonLib.models.base_class import Base
-from sqlalchemy import Column, ForeignKey, Integer, Boolean, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Boolean, String, func
+
+
+class EmailStatus:
+    PENDING = "PENDING"
+    DELIVERED = "DELIVERED"
+    FAILED = "FAILED"
 
 
 class Email(Base):
@@ -12,3 +18,15 @@ class Email(Base):
     template_dict = Column(String, nullable=False)
     sender = Column(String, nullable=False)
     extra_data = Column(String, default="")
+    status = Column(
+        String,
+        nullable=False,
+        index=True,
+        default=EmailStatus.PENDING,
+        server_default=EmailStatus.PENDING,
+    )
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    message_id = Column(String, nullable=True)
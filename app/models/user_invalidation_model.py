@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String
+from commonLib.models.base_class import Base
+
+
+class UserInvalidation(Base):
+    """A change to a user's activation or user type, read by every worker's
+    user cache so the change takes effect everywhere within seconds.
+
+    Tokens whose `ver` is below `activation_version` were minted before the
+    change and are revoked.
+    """
+
+    __tablename__ = "user_invalidations"
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(String, nullable=False)
+    activation_version = Column(Integer, nullable=False, server_default="0")
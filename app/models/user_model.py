@@ -5,7 +5,7 @@ from loguru import logger
 from sqlalchemy import Integer, Column, Boolean, String, ForeignKey
 from sqlalchemy.orm import relationship
 from commonLib.models.base_class import Base
-from app.schemas.jwt_schema import JWTEMAIL, JWTUser
+from app.schemas.jwt_schema import JWTEMAIL, JWTAccess
 from app.core.settings.configurations import settings
 from app.core.settings.security import security
 
@@ -26,6 +26,9 @@ class User(Base):
     is_active = Column(Boolean, nullable=False, default=False)
     hashed_password = Column(String, nullable=False)
     user_type_id = Column(String, ForeignKey("user_types.id"))
+    # Bumped whenever the user is (de)activated or changes user type; tokens
+    # carry it as `ver` and are rejected once it moves on.
+    activation_version = Column(Integer, nullable=False, default=0, server_default="0")
     user_type = relationship("UserType", back_populates="users")
     # This will link to the `user_id` in CommissionerProfile
     commissioner_profile = relationship(
@@ -65,7 +68,9 @@ class User(Base):
         if not self.is_active:
             raise Exception("user is not active")
 
-        jwt_content = JWTUser(id=self.id).dict()
+        jwt_content = JWTAccess(
+            id=self.id, user_type=self.user_type.name, ver=self.activation_version
+        ).dict()
         if expires_delta is None:
             expires_delta = timedelta(minutes=JWT_EXPIRE_MINUTES)
 
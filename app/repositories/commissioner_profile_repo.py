@@ -1,6 +1,10 @@
+from typing import List, Optional, Tuple
 from uuid import uuid4
 from app.models.commissioner_profile_model import CommissionerProfile
-from sqlalchemy.orm import Session
+from app.models.court_system_models import Court
+from app.models.user_model import User
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, contains_eager
 from app.schemas.user_schema import CommissionerAttestation, CommissionerProfileBase
 
 from commonLib.repositories.relational_repository import Base, ModelType
@@ -13,10 +17,7 @@ class CommissionerRepositiories(Base[CommissionerProfile]):
             court_id=obj_in.court_id,
             created_by_id=obj_in.created_by_id,
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.save(db, db_obj)
 
     def get_profile_by_commissioner_id(self, db, *, commissioner_id: str):
         return (
@@ -25,6 +26,58 @@ class CommissionerRepositiories(Base[CommissionerProfile]):
             .first()
         )
 
+    def _profiles_with_user_and_court_query(
+        self,
+        db: Session,
+        *,
+        jurisdiction_id: Optional[str] = None,
+        court_id: Optional[str] = None,
+        commissioner_id: Optional[str] = None,
+    ):
+        query = (
+            db.query(CommissionerProfile)
+            .join(CommissionerProfile.user)
+            .join(CommissionerProfile.court)
+            .options(
+                contains_eager(CommissionerProfile.user),
+                contains_eager(CommissionerProfile.court),
+            )
+        )
+        if jurisdiction_id:
+            query = query.filter(Court.jurisdiction_id == jurisdiction_id)
+        if court_id:
+            query = query.filter(CommissionerProfile.court_id == court_id)
+        if commissioner_id:
+            query = query.filter(CommissionerProfile.commissioner_id == commissioner_id)
+        return query.order_by(User.first_name, User.last_name, CommissionerProfile.id)
+
+    def get_profiles_with_user_and_court(
+        self, db: Session, **filters: Optional[str]
+    ) -> List[CommissionerProfile]:
+        """Commissioner profiles with `user` and `court` loaded in one joined query."""
+        return self._profiles_with_user_and_court_query(db, **filters).all()
+
+    def get_profile_batch_with_user_and_court(
+        self,
+        db: Session,
+        *,
+        batch_size: int,
+        after: Optional[Tuple[str, str, str]] = None,
+        **filters: Optional[str],
+    ) -> List[CommissionerProfile]:
+        """Up to `batch_size` profiles ordered as `get_profiles_with_user_and_court`.
+
+        `after` is the (first_name, last_name, id) of the last profile of the
+        previous batch, so each batch is an independent keyset query.
+        """
+        query = self._profiles_with_user_and_court_query(db, **filters)
+        if after:
+            query = query.filter(
+                tuple_(User.first_name, User.last_name, CommissionerProfile.id)
+                > tuple_(*after)
+            )
+        return query.limit(batch_size).all()
+
     def updateAttestation(
         self, db, *, attestation_obj: CommissionerAttestation, db_obj
     ):
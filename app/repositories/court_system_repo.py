@@ -1,18 +1,83 @@
-from typing import Type
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional, Tuple, Type
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.models.commissioner_profile_model import CommissionerProfile
 from app.models.court_system_models import Court, Jurisdiction, State
-from commonLib.repositories.relational_repository import Base, ModelType
+from app.models.head_of_unit_model import HeadOfUnit
+from app.models.user_model import User
+from app.core.services.reference_data import reference_data
+from commonLib.repositories.relational_repository import AsyncBase, Base, ModelType
+from commonLib.repositories.unit_of_work import after_commit
 
 
 
 class CourtSystemRepositories(Base[ModelType]):
     def __init__(self, model: Type[ModelType]) -> None:
-        self.model = model
+        super().__init__(model)
+
+    # Every write changes the cached court system reference data.
+    def create(self, db: Session, *, obj_in) -> ModelType:
+        db_obj = super().create(db, obj_in=obj_in)
+        after_commit(db, reference_data.invalidate)
+        return db_obj
+
+    def update(self, db: Session, *, db_obj: ModelType, obj_in) -> ModelType:
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        after_commit(db, reference_data.invalidate)
+        return db_obj
+
+    def remove(self, db: Session, *, id) -> ModelType:
+        db_obj = super().remove(db, id=id)
+        after_commit(db, reference_data.invalidate)
+        return db_obj
+
     def get_by_name(self, db: Session, *, name):
         return db.query(self.model).filter(self.model.name == name).first()
-    pass
+
+
+def jurisdiction_tree_options() -> Tuple[Any, ...]:
+    """Loader options for jurisdiction -> courts -> commissioner profiles -> users.
+
+    Relative to Jurisdiction, so they can be chained from other entities
+    (e.g. a head of unit's jurisdiction). Costs two SELECT IN queries on top of
+    the query they are attached to.
+    """
+    return (
+        joinedload(Jurisdiction.state),
+        joinedload(Jurisdiction.head_of_unit).joinedload(HeadOfUnit.user),
+        selectinload(Jurisdiction.courts)
+        .selectinload(Court.commissioner_profile)
+        .joinedload(CommissionerProfile.user)
+        .joinedload(User.user_type),
+    )
+
+
+def jurisdiction_commissioners(jurisdiction: Jurisdiction) -> List[User]:
+    return [
+        commissioner_profile.user
+        for court in jurisdiction.courts
+        for commissioner_profile in court.commissioner_profile
+    ]
+
+
+class JurisdictionRepositories(CourtSystemRepositories[Jurisdiction]):
+    def build_loader_profiles(self):
+        return {"tree": jurisdiction_tree_options()}
+
+    def get_tree(self, db: Session, *, id: str) -> Optional[Jurisdiction]:
+        return self.get(db, id=id, with_profile="tree")
+
+    def get_trees(self, db: Session, *, ids: List[str]) -> List[Jurisdiction]:
+        if not ids:
+            return []
+        return (
+            self.query(db, with_profile="tree")
+            .filter(Jurisdiction.id.in_(ids))
+            .all()
+        )
+
 
 state_repo = CourtSystemRepositories[State](State)
 court_repo = CourtSystemRepositories[Court](Court)
-jurisdiction_repo = CourtSystemRepositories[Jurisdiction](Jurisdiction)
+jurisdiction_repo = JurisdictionRepositories(Jurisdiction)
 
+async_court_repo = AsyncBase[Court](Court)
@@ -1,13 +1,73 @@
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Union
 
-from app.models.email_model import Email
+from app.models.email_model import Email, EmailStatus
+from app.schemas.email_schema import EmailDeliveryResult, EmailInOutbox
 from commonLib.repositories.relational_repository import Base
 from sqlalchemy.orm import Session
 
 
 class EmailRepository(Base[Email]):
     def mark_as_delivered(self, db: Session, *, db_obj: Email) -> Email:
-        return super().update(db, db_obj=db_obj, obj_in={"delivered": True})
+        return super().update(
+            db, db_obj=db_obj, obj_in={"delivered": True, "status": EmailStatus.DELIVERED}
+        )
+
+    def claim_due(
+        self, db: Session, *, limit: int, lease: timedelta
+    ) -> List[EmailInOutbox]:
+        """Lease up to `limit` pending emails that are due for an attempt.
+
+        `next_attempt_at` is pushed forward by `lease`, so rows claimed by a
+        worker that dies mid-send become due again. `SKIP LOCKED` keeps
+        concurrent workers from claiming the same rows.
+        """
+        now = datetime.now(timezone.utc)
+        emails = (
+            db.query(Email)
+            .filter(Email.status == EmailStatus.PENDING, Email.next_attempt_at <= now)
+            .order_by(Email.next_attempt_at, Email.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for email in emails:
+            email.attempts += 1
+            email.next_attempt_at = now + lease
+            claimed.append(
+                EmailInOutbox(
+                    id=email.id,
+                    recipient=email.recipient,
+                    template_id=email.template_id,
+                    template_dict=email.template_dict,
+                    sender=email.sender,
+                    attempts=email.attempts,
+                )
+            )
+        db.commit()
+        return claimed
+
+    def record_results(self, db: Session, results: List[EmailDeliveryResult]) -> None:
+        db.bulk_update_mappings(
+            Email,
+            [
+                {
+                    "id": result.id,
+                    "status": result.status,
+                    "delivered": result.status == EmailStatus.DELIVERED,
+                    "message_id": result.message_id,
+                    "extra_data": result.error or "",
+                    **(
+                        {"next_attempt_at": result.next_attempt_at}
+                        if result.next_attempt_at
+                        else {}
+                    ),
+                }
+                for result in results
+            ],
+        )
+        db.commit()
 
 
 email_repo = EmailRepository(Email)
@@ -1,12 +1,14 @@
-from typing import List
+from typing import Dict, List
 from uuid import uuid4
 from app.models.commissioner_profile_model import CommissionerProfile
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.court_system_models import Court
 from app.models.head_of_unit_model import HeadOfUnit
 from app.schemas.user_schema import  HeadOfUnitBase, HeadOfUnitCreate
 
-from commonLib.repositories.relational_repository import Base
+from commonLib.repositories.relational_repository import AsyncBase, Base
 
 
 class HeadOfUnitRepositories(Base[HeadOfUnit]):
@@ -17,10 +19,7 @@ class HeadOfUnitRepositories(Base[HeadOfUnit]):
             jurisdiction_id = obj_in.jurisdiction_id,
             created_by_id = obj_in.created_by_id
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.save(db, db_obj)
 
     def get_commissioners_under_jurisdiction(self, db: Session, jurisdiction_id: str) -> List[CommissionerProfile]:
         court_ids = db.query(Court.id).filter(Court.jurisdiction_id == jurisdiction_id).all()
@@ -32,3 +31,33 @@ class HeadOfUnitRepositories(Base[HeadOfUnit]):
         courts = db.query(Court).filter(Court.jurisdiction_id == jurisdiction_id).all()
         return courts
 head_of_unit_repo = HeadOfUnitRepositories(HeadOfUnit)
+
+
+class AsyncHeadOfUnitRepositories(AsyncBase[HeadOfUnit]):
+    async def get_court_ids_under_jurisdiction(
+        self, db: AsyncSession, jurisdiction_id: str
+    ) -> List[str]:
+        result = await db.scalars(
+            select(Court.id).where(Court.jurisdiction_id == jurisdiction_id)
+        )
+        return result.all()
+
+    async def get_court_names_under_jurisdiction(
+        self, db: AsyncSession, jurisdiction_id: str
+    ) -> Dict[str, str]:
+        result = await db.execute(
+            select(Court.id, Court.name).where(Court.jurisdiction_id == jurisdiction_id)
+        )
+        return dict(result.all())
+
+    async def count_commissioners_under_jurisdiction(
+        self, db: AsyncSession, jurisdiction_id: str
+    ) -> int:
+        return await db.scalar(
+            select(func.count(CommissionerProfile.id))
+            .join(Court, CommissionerProfile.court_id == Court.id)
+            .where(Court.jurisdiction_id == jurisdiction_id)
+        )
+
+
+async_head_of_unit_repo = AsyncHeadOfUnitRepositories(HeadOfUnit)
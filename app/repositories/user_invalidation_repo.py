@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.user_invalidation_model import UserInvalidation
+from commonLib.repositories.relational_repository import Base
+
+
+class UserInvalidationRepository(Base[UserInvalidation]):
+    def record(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        activation_version: int,
+        retention: timedelta,
+    ) -> None:
+        """Stage an invalidation for `user_id`; it commits with the user change.
+
+        Rows older than `retention` are no longer read by any cache and are
+        deleted in the same transaction.
+        """
+        db.execute(
+            delete(UserInvalidation).where(
+                UserInvalidation.CreatedAt < datetime.now(timezone.utc) - retention
+            )
+        )
+        db.add(
+            UserInvalidation(user_id=user_id, activation_version=activation_version)
+        )
+
+    def get_recent(
+        self, db: Session, *, window: timedelta
+    ) -> List[Tuple[int, str, int]]:
+        """(id, user_id, activation_version) of the invalidations recorded in
+        the last `window`."""
+        return db.execute(
+            select(
+                UserInvalidation.id,
+                UserInvalidation.user_id,
+                UserInvalidation.activation_version,
+            ).where(
+                UserInvalidation.CreatedAt > datetime.now(timezone.utc) - window
+            )
+        ).all()
+
+
+user_invalidation_repo = UserInvalidationRepository(UserInvalidation)
@@ -1,22 +1,103 @@
 from uuid import uuid4
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Union
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.models.commissioner_profile_model import CommissionerProfile
+from app.models.head_of_unit_model import HeadOfUnit
 from app.models.user_invite_models import UserInvite
-from commonLib.repositories.relational_repository import Base
+from app.repositories.court_system_repo import jurisdiction_tree_options
+from commonLib.repositories.relational_repository import AsyncBase, Base
+from commonLib.repositories.unit_of_work import after_commit, unit_of_work
 from app.models.user_model import User
+from app.core.services.user_cache import user_cache
 from app.core.settings.security import security
 from app.schemas.user_schema import UserCreate
-from app.core.settings.security import security
 
 
 
 
 
 class UserRepositories(Base[User]):
+    def build_loader_profiles(self):
+        return {
+            "user_type": (joinedload(User.user_type),),
+            "head_of_unit_tree": (
+                joinedload(User.user_type),
+                joinedload(User.head_of_unit)
+                .joinedload(HeadOfUnit.jurisdiction)
+                .options(*jurisdiction_tree_options()),
+            ),
+            "commissioner_profile": (
+                joinedload(User.user_type),
+                joinedload(User.commissioner_profile).joinedload(CommissionerProfile.court),
+            ),
+            "invites": (
+                joinedload(User.user_type),
+                selectinload(User.invited_by).options(
+                    joinedload(UserInvite.user_type), joinedload(UserInvite.user)
+                ),
+            ),
+        }
+
+    def get_with_user_type(self, db: Session, *, id: str) -> Optional[User]:
+        return self.get(db, id=id, with_profile="user_type")
+
+    # Changes that bump `activation_version`, revoking the user's tokens, and
+    # that other workers' user caches must see; see `UserCache.sync`.
+    AUTH_FIELDS = {"is_active", "user_type_id"}
+
+    def update(self, db: Session, *, db_obj: User, obj_in) -> User:
+        fields = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+        if not any(
+            field in fields and fields[field] != getattr(db_obj, field)
+            for field in self.AUTH_FIELDS
+        ):
+            user = super().update(db, db_obj=db_obj, obj_in=obj_in)
+            after_commit(db, lambda: user_cache.invalidate(user.id))
+            return user
+        with unit_of_work(db):
+            user = super().update(
+                db,
+                db_obj=db_obj,
+                obj_in={**fields, "activation_version": User.activation_version + 1},
+            )
+            db.flush()
+            self._record_change(db, user.id, user.activation_version)
+        return user
+
+    def update_columns(self, db: Session, *, id: str, values) -> Optional[User]:
+        if not self.AUTH_FIELDS & set(values):
+            user = super().update_columns(db, id=id, values=values)
+            after_commit(db, lambda: user_cache.invalidate(id))
+            return user
+        with unit_of_work(db):
+            user = super().update_columns(
+                db,
+                id=id,
+                values={**values, "activation_version": User.activation_version + 1},
+            )
+            if user is not None:
+                self._record_change(db, id, user.activation_version)
+        return user
+
+    def remove(self, db: Session, *, id: str) -> User:
+        with unit_of_work(db):
+            user = super().remove(db, id=id)
+            self._record_change(db, id, user.activation_version + 1)
+        return user
+
+    def _record_change(self, db: Session, id: str, activation_version: int) -> None:
+        user_cache.record_change(db, id, activation_version)
+        after_commit(db, lambda: user_cache.invalidate(id, activation_version))
+
     def get_by_email(self, db: Session, *, email):
         return db.query(User).filter(User.email == email).first()
 
+    def email_exists(self, db: Session, *, email) -> bool:
+        return self.exists_where(db, User.email == email)
+
     def create(self, db, *, obj_in: UserCreate):
         db_obj = User(
             id=uuid4().hex,
@@ -27,10 +108,7 @@ class UserRepositories(Base[User]):
             # is_active=True
         )
         db_obj.set_password(obj_in.password)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.save(db, db_obj)
 
     def create_verification_token(self, db: Session, *, email):
         user = db.query(User).filter(User.email == email).first()
@@ -49,17 +127,56 @@ class UserRepositories(Base[User]):
     ) -> User:
         if db_obj.is_active == status:
             return db_obj
-        return super().update(db, db_obj=db_obj, obj_in={"is_active": status})
+        return self.update_columns(db, id=db_obj.id, values={"is_active": status})
+
 
+    def get_users_by_user_type(
+        self, db: Session, *, user_type_id: str, with_profile: Optional[str] = None
+    ) -> List[User]:
+        return (
+            self.query(db, with_profile=with_profile)
+            .filter(User.user_type_id == user_type_id)
+            .all()
+        )
 
-    def get_users_by_user_type(self, db: Session, *, user_type_id: str) -> List[User]:
-        return db.query(User).filter(User.user_type_id == user_type_id).all()
+    def get_users_page_by_user_type(
+        self,
+        db: Session,
+        *,
+        user_type_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        with_profile: Optional[str] = None,
+    ) -> Tuple[List[User], Optional[str]]:
+        return self.get_page(
+            db,
+            cursor=cursor,
+            limit=limit,
+            query=self.query(db, with_profile=with_profile).filter(
+                User.user_type_id == user_type_id
+            ),
+        )
 
     def update_password(self, db: Session,db_obj:User, password: str) -> User:
-        user = user_repo.update(
-            db=db,
-            db_obj=db_obj,
-            obj_in={"hashed_password": security.get_password_hash(password)},
+        return self.update_columns(
+            db,
+            id=db_obj.id,
+            values={"hashed_password": security.get_password_hash(password)},
         )
-        return user
 user_repo = UserRepositories(User)
+
+
+
+class AsyncUserRepositories(AsyncBase[User]):
+    async def get_page_with_user_type(
+        self, db: AsyncSession, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[str]]:
+        return await self.get_page(
+            db,
+            cursor=cursor,
+            limit=limit,
+            statement=select(User).options(joinedload(User.user_type)),
+        )
+
+
+async_user_repo = AsyncUserRepositories(User)
@@ -1,3 +1,4 @@
+from typing import Optional
 from app.models.user_type_model import UserType
 from sqlalchemy.orm import Session
 from commonLib.repositories.relational_repository import Base
@@ -6,6 +7,9 @@ from commonLib.repositories.relational_repository import Base
 class UserTypeRepositories(Base[UserType]):
     def get_by_name(self, db: Session, *, name:str) -> UserType:
         return db.query(UserType).filter(UserType.name == name).first()
+
+    def get_id_by_name(self, db: Session, *, name: str) -> Optional[str]:
+        return self.get_value(db, UserType.id, UserType.name == name)
     
 
 
@@ -1,6 +1,6 @@
 import datetime
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Type
 from fastapi import HTTPException
 from pydantic import BaseModel
 from bson import ObjectId
@@ -99,7 +99,6 @@ class UpdateDocument(BaseModel):
     template_id: str
     court_id: Optional[str] = None
     document_data: TemplateContent
-    qr_code: Optional[str] = None
     is_attested: Optional[bool] = None
     name: str
 
@@ -123,6 +122,24 @@ class SlimDocumentInResponse(BaseModel):
     status: str
 
 
+class DocumentSummary(BaseModel):
+    id: str
+    name: str
+    template_id: str
+    court_id: Optional[str] = None
+    created_by_id: str
+    commissioner_id: Optional[str] = None
+    status: str
+    preview_text: Optional[str] = None
+    is_attested: Optional[bool] = None
+    is_archived: Optional[bool] = None
+    amount_paid: Optional[int] = None
+    payment_ref: Optional[str] = None
+    attestation_date: Optional[datetime.datetime] = None
+    created_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
+
+
 class DocumentPayment(BaseModel):
 
     payment_ref: str
@@ -138,7 +155,6 @@ class LastestAffidavits(SlimDocumentInResponse):
 class DocumentCreate(DocumentCreateForm):
     created_by_id: str
     name: str
-    qr_code: str
     preview_text: str
     created_at: datetime = datetime.datetime.now(datetime.timezone.utc)
     status: str
@@ -201,7 +217,6 @@ def document_individual_serializer(data) -> dict:
             "attestation_date": attestation_date,
             "status": data.get("status"),
             "payment_ref": data.get("payment_ref", ""),
-            "qr_code: str": data.get("qr_code: str", ""),
         }
     except KeyError as e:
         logging.error(f"Missing key in document data: {e}")
@@ -245,9 +260,36 @@ def serialize_mongo_document(document):
     return serialized_document
 
 
+def mongo_projection(schema: Type[BaseModel]) -> Dict[str, int]:
+    """Build a Mongo projection holding only the fields declared on `schema`."""
+    return {
+        "_id" if field == "id" else field: 1 for field in schema.model_fields
+    }
+
+
+SLIM_DOCUMENT_PROJECTION = mongo_projection(SlimDocumentInResponse)
+DOCUMENT_SUMMARY_PROJECTION = mongo_projection(DocumentSummary)
+
+
+def slim_document_individual_serializer(data) -> SlimDocumentInResponse:
+    attestation_date = data.get("attestation_date")
+    return SlimDocumentInResponse(
+        id=str(data["_id"]),
+        name=data.get("name", ""),
+        price=data.get("price", 0),
+        attestation_date=str(attestation_date) if attestation_date else None,
+        created_at=data.get("created_at"),
+        status=data.get("status", ""),
+    )
+
+
 def template_list_serialiser(templates) -> list:
     return [template_individual_serializer(template) for template in templates]
 
 
 def document_list_serialiser(documents) -> list:
     return [document_individual_serializer(document) for document in documents]
+
+
+def slim_document_list_serialiser(documents) -> List[SlimDocumentInResponse]:
+    return [slim_document_individual_serializer(document) for document in documents]
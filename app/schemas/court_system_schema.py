@@ -68,3 +68,16 @@ class CourtBase(CourtSystemBase):
 class CourtInResponse(CourtBase):
     commissioners: List[SlimUserInResponse]
     documents: List[SlimDocumentInResponse]
+
+
+class JurisdictionNode(CourtSystemInDB):
+    courts: List[CourtSystemInDB]
+
+
+class StateNode(CourtSystemInDB):
+    jurisdictions: List[JurisdictionNode]
+
+
+class CourtSystemTree(BaseModel):
+    version: int
+    states: List[StateNode]
@@ -1,3 +1,4 @@
+import datetime
 from pydantic import BaseModel
 from typing import Any, Dict, Optional
 from app.core.settings.configurations import settings
@@ -19,6 +20,19 @@ class EmailUpdate(BaseModel):
     extra_data: Optional[str]
 
 
+class EmailInOutbox(Email):
+    id: int
+    attempts: int
+
+
+class EmailDeliveryResult(BaseModel):
+    id: int
+    status: str
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+    next_attempt_at: Optional[datetime.datetime] = None
+
+
 class EmailTemplateVariables(BaseModel):
     name: str
 
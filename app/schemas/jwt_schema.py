@@ -7,6 +7,10 @@ from pydantic import BaseModel, EmailStr
 class JWTUser(BaseModel):
     id: str
 
+class JWTAccess(JWTUser):
+    user_type: str
+    ver: int
+
 class JWTEMAIL(BaseModel):
     email:EmailStr
 
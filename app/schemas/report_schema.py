@@ -1,6 +1,6 @@
 import datetime
 from app.schemas.affidavit_schema import SlimDocumentInResponse
-from typing import List
+from typing import List, Optional
 from app.schemas.user_schema import FullCommissionerInResponse
 from pydantic import BaseModel
 
@@ -19,3 +19,20 @@ class CommissionersReport(BaseModel):
 class CommissionerReport(BaseModel):
     commissioner: FullCommissionerInResponse
     attested_documents: List[DocumentReports]
+
+
+class ReportBucket(BaseModel):
+    period: datetime.datetime
+    key: Optional[str] = None
+    name: Optional[str] = None
+    documents: int
+    revenue: int
+
+
+class DocumentTimeSeriesReport(BaseModel):
+    scope: str
+    dimension: str
+    granularity: str
+    from_date: Optional[datetime.datetime] = None
+    to_date: Optional[datetime.datetime] = None
+    buckets: List[ReportBucket]
@@ -1,5 +1,9 @@
+from typing import Dict, List
+
 from pydantic import BaseModel
 
+from app.schemas.affidavit_schema import SlimDocumentInResponse
+
 
 class AdminDashboardStat(BaseModel):
     total_users: int
@@ -13,10 +17,21 @@ class PublicDashboardStat(BaseModel):
     total_paid: int
     total_attested: int
     total_documents: int
+    revenue_by_status: Dict[str, int] = {}
+    latest_documents: List[SlimDocumentInResponse] = []
+
+
+class CourtDashboardStat(BaseModel):
+    id: str
+    name: str
+    total_documents: int
+    total_affidavits: int
+    total_revenue: int
 
 
 class HeadOfUnitDashboardStat(BaseModel):
     total_courts: int
     total_commissioners: int
     total_revenue: int
-    total_affidavits: int
\ No newline at end of file
+    total_affidavits: int
+    courts: List[CourtDashboardStat] = []
\ No newline at end of file
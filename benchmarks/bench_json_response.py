@@ -0,0 +1,93 @@
+"""Compare the default GenericResponse path with `fast_response` on a large document list.
+
+    python -m benchmarks.bench_json_response [--documents 2000] [--requests 50]
+
+Both routes return the same `create_response` payload of slim documents. The
+default route validates it against `response_model` and re-encodes it with
+`jsonable_encoder`; the fast route serialises it once with orjson.
+"""
+import argparse
+import asyncio
+import datetime
+import time
+from typing import List
+
+import httpx
+from bson import ObjectId
+from fastapi import FastAPI
+
+from commonLib.response.fast_response import fast_response
+from commonLib.response.response_schema import GenericResponse, create_response
+from pydantic import BaseModel
+
+
+class BenchDocument(BaseModel):
+    id: str
+    name: str
+    status: str
+    preview_text: str
+    amount_paid: int
+    created_at: datetime.datetime
+    attestation_date: datetime.datetime
+
+
+def make_documents(count: int) -> List[BenchDocument]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        BenchDocument(
+            id=str(ObjectId()),
+            name=f"DOC{index:07d}",
+            status="ATTESTED",
+            preview_text="I, the deponent, solemnly swear that " * 2,
+            amount_paid=1500,
+            created_at=now,
+            attestation_date=now,
+        )
+        for index in range(count)
+    ]
+
+
+def build_app(documents: List[BenchDocument]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=GenericResponse[List[BenchDocument]])
+    async def default_route():
+        return create_response(status_code=200, message="ok", data=documents)
+
+    @app.get("/fast", response_model=GenericResponse[List[BenchDocument]])
+    @fast_response
+    async def fast_route():
+        return create_response(status_code=200, message="ok", data=documents)
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    await client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return (time.perf_counter() - started) / requests
+
+
+async def main(documents: int, requests: int) -> None:
+    app = build_app(make_documents(documents))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        default = await measure(client, "/default", requests)
+        fast = await measure(client, "/fast", requests)
+        assert (await client.get("/default")).json() == (await client.get("/fast")).json()
+
+    print(f"{documents} documents, {requests} requests each")
+    print(f"default GenericResponse: {default * 1000:8.2f} ms/request")
+    print(f"fast_response:           {fast * 1000:8.2f} ms/request")
+    print(f"speed-up:                {default / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.documents, args.requests))
@@ -0,0 +1,130 @@
+"""Compare the ways `Base` can update a `User` row.
+
+    python -m benchmarks.bench_repository_update [--users 200] [--rounds 5]
+
+Runs against an in-memory SQLite database, so it measures the Python side of
+each path and the number of statements, not Postgres round trips. Needs the
+same settings environment as the app. Each user is loaded with its user type,
+as the authenticated user is in a request, and then has `is_active` toggled.
+
+- encoded update: the previous `Base.update`, which ran `jsonable_encoder`
+  over the whole object to find the fields to set, then committed and
+  refreshed. It recurses forever once a back-referenced relationship such
+  as `User.invited_by` is loaded, so only the user type is loaded here.
+- update: the current `Base.update`, which reads the column names from the
+  mapper, then commits and refreshes.
+- update_columns: one `UPDATE ... RETURNING` of the changed columns.
+"""
+import argparse
+import time
+from typing import Callable, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.base import Base as DeclarativeBase
+from app.models.user_model import User
+from app.models.user_type_model import UserType
+from commonLib.repositories.relational_repository import Base
+
+repository = Base(User)
+
+
+def build_database(users: int) -> sessionmaker:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    DeclarativeBase.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(UserType(id="admin", name="ADMIN"))
+        for index in range(users):
+            db.add(
+                User(
+                    id=f"user-{index}",
+                    first_name="Bench",
+                    last_name=f"User {index}",
+                    email=f"user-{index}@example.com",
+                    hashed_password="x" * 60,
+                    user_type_id="admin",
+                )
+            )
+        db.commit()
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def encoded_update(db: Session, user: User, is_active: bool) -> None:
+    obj_data = jsonable_encoder(user)
+    update_data = {"is_active": is_active}
+    for field in obj_data:
+        if field in update_data:
+            setattr(user, field, update_data[field])
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+
+def update(db: Session, user: User, is_active: bool) -> None:
+    repository.update(db, db_obj=user, obj_in={"is_active": is_active})
+
+
+def update_columns(db: Session, user: User, is_active: bool) -> None:
+    repository.update_columns(db, id=user.id, values={"is_active": is_active})
+
+
+def measure(
+    session_factory: sessionmaker,
+    users: int,
+    rounds: int,
+    toggle: Callable[[Session, User, bool], None],
+) -> Tuple[float, float]:
+    """Time one update per freshly loaded user, as a request would do it."""
+    engine = session_factory.kw["bind"]
+    statements = 0
+    elapsed = 0.0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    for round_ in range(rounds):
+        for index in range(users):
+            with session_factory() as db:
+                user = repository.get(db, f"user-{index}", with_profile=None)
+                user.user_type
+                event.listen(engine, "before_cursor_execute", count)
+                started = time.perf_counter()
+                toggle(db, user, round_ % 2 == 0)
+                elapsed += time.perf_counter() - started
+                event.remove(engine, "before_cursor_execute", count)
+            with session_factory() as db:
+                assert repository.get(db, f"user-{index}").is_active == (round_ % 2 == 0)
+    updates = users * rounds
+    return elapsed / updates, statements / updates
+
+
+def main(users: int, rounds: int) -> None:
+    session_factory = build_database(users)
+    results = [
+        (name, *measure(session_factory, users, rounds, toggle))
+        for name, toggle in (
+            ("encoded update", encoded_update),
+            ("update", update),
+            ("update_columns", update_columns),
+        )
+    ]
+
+    print(f"{users} users x {rounds} rounds")
+    baseline = results[0][1]
+    for name, seconds, statements in results:
+        print(
+            f"{name:15} {seconds * 1000:8.3f} ms/update "
+            f"{statements:4.1f} statements {baseline / seconds:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.users, args.rounds)
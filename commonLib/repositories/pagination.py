@@ -0,0 +1,108 @@
+"""Keyset pagination shared by the SQL and Mongo repositories.
+
+Pages are ordered newest first on (created_at, id). The cursor handed back to
+clients is an opaque urlsafe base64 token of the last row's sort key.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: Optional[datetime], id: Any) -> str:
+    payload = json.dumps(
+        [created_at.isoformat() if created_at else None, str(id)],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return (datetime.fromisoformat(created_at) if created_at else None), id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+
+def build_page(
+    rows: Sequence[Any], limit: int, key: Callable[[Any], Tuple[Any, Any]]
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim the extra look-ahead row and return the cursor for the next page."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+def mongo_keyset_filter(cursor: str, sort_field: str = "created_at") -> Dict[str, Any]:
+    created_at, id = decode_cursor(cursor)
+    if not ObjectId.is_valid(id):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+    id = ObjectId(id)
+    # Documents without a sort value sort last in descending order.
+    if created_at is None:
+        return {sort_field: None, "_id": {"$lt": id}}
+    return {
+        "$or": [
+            {sort_field: {"$lt": created_at}},
+            {sort_field: created_at, "_id": {"$lt": id}},
+            {sort_field: None},
+        ]
+    }
+
+
+async def paginate_collection(
+    collection,
+    query: Dict[str, Any],
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    projection: Optional[Dict[str, Any]] = None,
+    sort_field: str = "created_at",
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return one page of `collection` documents matching `query`."""
+    if cursor:
+        query = {"$and": [query, mongo_keyset_filter(cursor, sort_field)]}
+    documents = (
+        await collection.find(query, projection)
+        .sort([(sort_field, -1), ("_id", -1)])
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+    return build_page(
+        documents, limit, lambda document: (document.get(sort_field), document["_id"])
+    )
+
+
+def paginate_documents(
+    documents: Sequence[Dict[str, Any]],
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    sort_field: str = "created_at",
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """`paginate_collection` over documents already held in memory."""
+
+    def sort_key(document):
+        value = document.get(sort_field)
+        # Same order as Mongo: descending, documents without a value last.
+        return (value is not None, value or datetime.min, document["_id"])
+
+    ordered = sorted(documents, key=sort_key, reverse=True)
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        if not ObjectId.is_valid(id):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+        after = (created_at is not None, created_at or datetime.min, ObjectId(id))
+        ordered = [document for document in ordered if sort_key(document) < after]
+    return build_page(
+        ordered[: limit + 1],
+        limit,
+        lambda document: (document.get(sort_field), document["_id"]),
+    )
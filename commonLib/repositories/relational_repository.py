@@ -1,55 +1,194 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi import HTTPException
+from sqlalchemy import and_, exists, func, insert, inspect, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from fastapi.encoders import jsonable_encoder
 from commonLib.models.base_class import Base as BaseDeclarativeClass
+from commonLib.repositories.pagination import build_page, decode_cursor
+from commonLib.repositories.unit_of_work import in_unit_of_work, unit_of_work
 from sqlalchemy.exc import IntegrityError
 
 ModelType = TypeVar("ModelType", bound=BaseDeclarativeClass)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+BULK_BATCH_SIZE = 1000
+# Below this many estimated rows an exact count is cheap enough and is used
+# instead of the planner estimate.
+APPROXIMATE_COUNT_THRESHOLD = 100_000
+# Postgres keeps a row estimate per table, refreshed by VACUUM and ANALYZE;
+# -1 means the table has never been analysed.
+APPROXIMATE_COUNT_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+)
+
+
+def count_statement(model: Type[ModelType]):
+    return select(func.count()).select_from(model)
+
+
+def supports_approximate_count(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+
+def keyset_condition(model: Type[ModelType], cursor: str):
+    """Rows strictly after `cursor` in (CreatedAt, id) descending order."""
+    created_at, id = decode_cursor(cursor)
+    return or_(
+        model.CreatedAt < created_at,
+        and_(model.CreatedAt == created_at, model.id < id),
+    )
+
 
 class Base(Generic[ModelType]):
     def __init__(self, model: Type[ModelType]) -> None:
         self.model = model
+        self._loader_profiles: Optional[Dict[str, Tuple[Any, ...]]] = None
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
+    def build_loader_profiles(self) -> Dict[str, Tuple[Any, ...]]:
+        """Named bundles of loader options, selected with `with_profile=` so
+        routes don't lazy-load relationships row by row. Built on first use,
+        once every mapper has been imported."""
+        return {}
 
-        return db.query(self.model).filter(self.model.id == id).first()
+    def loader_options(self, with_profile: Optional[str]) -> Tuple[Any, ...]:
+        if with_profile is None:
+            return ()
+        if self._loader_profiles is None:
+            self._loader_profiles = self.build_loader_profiles()
+        try:
+            return self._loader_profiles[with_profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown loader profile {with_profile!r} for {self.model.__name__}"
+            )
+
+    def query(self, db: Session, *, with_profile: Optional[str] = None):
+        return db.query(self.model).options(*self.loader_options(with_profile))
+
+    def get(
+        self, db: Session, id: Any, *, with_profile: Optional[str] = None
+    ) -> Optional[ModelType]:
+
+        return self.query(db, with_profile=with_profile).filter(self.model.id == id).first()
 
     def exist(self, db: Session, id: Any) -> bool:
-        data = self.get(db, id)
-        return data if data else False
+        return self.exists_where(db, self.model.id == id)
+
+    def exists_where(self, db: Session, *criteria) -> bool:
+        """`SELECT EXISTS (...)`: no row is loaded or built."""
+        return db.scalar(select(exists().where(*criteria)))
+
+    def get_value(self, db: Session, column, *criteria) -> Any:
+        """The value of one column from the first matching row, or None."""
+        return db.scalar(select(column).where(*criteria).limit(1))
 
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        with_profile: Optional[str] = None,
     ) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return self.query(db, with_profile=with_profile).offset(skip).limit(limit).all()
 
     def get_multi_by_ids(self, db: Session, *, ids: List[int]) -> List[ModelType]:
         in_condition = self.model.id.in_(ids)
         return db.query(self.model).filter(in_condition)
 
-    def get_all(self, db: Session) -> List[ModelType]:
-        return db.query(self.model).all()
+    def get_all(
+        self, db: Session, *, with_profile: Optional[str] = None
+    ) -> List[ModelType]:
+        return self.query(db, with_profile=with_profile).all()
     
-    def get_count(self, db:Session)->int :  
-        return db.query(self.model).count()
+    def get_count(self, db: Session, *, approximate: bool = False) -> int:
+        """Row count; with `approximate`, large Postgres tables return the
+        planner's estimate instead of scanning the table."""
+        if approximate and supports_approximate_count(db.get_bind()):
+            estimate = db.scalar(
+                APPROXIMATE_COUNT_SQL, {"table": self.model.__table__.fullname}
+            )
+            if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                return estimate
+        return db.scalar(count_statement(self.model))
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        query=None,
+        with_profile: Optional[str] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Return one newest-first page and the cursor of the next one.
+
+        `query` narrows the rows (filters, joins, loader options); it defaults
+        to every row of the model loaded with `with_profile`.
+        """
+        query = query if query is not None else self.query(db, with_profile=with_profile)
+        if cursor:
+            query = query.filter(keyset_condition(self.model, cursor))
+        rows = (
+            query.order_by(self.model.CreatedAt.desc(), self.model.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        return build_page(rows, limit, lambda row: (row.CreatedAt, row.id))
+
+    def save(self, db: Session, db_obj: ModelType) -> ModelType:
+        """Add `db_obj`; commit and refresh it unless a unit of work is open."""
+        db.add(db_obj)
+        if not in_unit_of_work(db):
+            db.commit()
+            db.refresh(db_obj)
+        return db_obj
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
 
         db_obj = self.model(**obj_in_data)
         try:
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
-            return db_obj
+            return self.save(db, db_obj)
         except IntegrityError as e:
             db.rollback()
             raise HTTPException(status_code=400, detail="Data integrity issue.")
 
+    def bulk_create(
+        self,
+        db: Session,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        *,
+        returning: bool = False,
+    ) -> List[ModelType]:
+        """Insert rows with multi-row `INSERT ... VALUES` statements.
+
+        Every row must set the same columns. With `returning`, the new rows
+        come back as ORM objects from the same statements.
+        """
+        rows = [
+            obj_in if isinstance(obj_in, dict) else jsonable_encoder(obj_in)
+            for obj_in in objs_in
+        ]
+        created: List[ModelType] = []
+        with unit_of_work(db):
+            for start in range(0, len(rows), BULK_BATCH_SIZE):
+                statement = insert(self.model).values(rows[start : start + BULK_BATCH_SIZE])
+                if returning:
+                    created.extend(db.scalars(statement.returning(self.model)).all())
+                else:
+                    db.execute(statement)
+        return created
+
+    def bulk_update(self, db: Session, rows: Sequence[Dict[str, Any]]) -> None:
+        """Update rows by primary key; each dict holds `id` and the new values."""
+        with unit_of_work(db):
+            for start in range(0, len(rows), BULK_BATCH_SIZE):
+                db.execute(update(self.model), list(rows[start : start + BULK_BATCH_SIZE]))
+
     def get_by_field(
         self, db: Session, *, field_name: str, field_value: str
     ) -> ModelType:
@@ -66,27 +205,167 @@ class Base(Generic[ModelType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
+        for field in inspect(self.model).column_attrs.keys():
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
         try:
-            db.commit()
-            db.refresh(db_obj)
+            return self.save(db, db_obj)
         except IntegrityError as e:
             e.add_detail("An error occured while trying to update " + str(e.params))
             raise e
-        return db_obj
+
+    def update_columns(
+        self, db: Session, *, id: Any, values: Dict[str, Any]
+    ) -> Optional[ModelType]:
+        """Set `values` on row `id` with a single `UPDATE ... RETURNING`.
+
+        Only the given columns are written (keys that are not columns are
+        ignored, as in `update`) and nothing is encoded or refreshed; the
+        returned row also updates the object already in the session, if any.
+        Returns None when no row has that id.
+        """
+        columns = inspect(self.model).column_attrs.keys()
+        values = {key: value for key, value in values.items() if key in columns}
+        if not values:
+            return self.get(db, id)
+        statement = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        with unit_of_work(db):
+            return db.scalars(statement).one_or_none()
 
     def remove(self, db: Session, *, id: any) -> ModelType:
         obj = db.query(self.model).get(id)
         db.delete(obj)
-        db.commit()
+        if not in_unit_of_work(db):
+            db.commit()
         return obj
 
 
+class AsyncBase(Generic[ModelType]):
+    """Async twin of `Base` for handlers running on an `AsyncSession`.
+
+    Relationships are not lazy loaded on an async session, so callers must
+    only touch columns or relationships they loaded explicitly.
+    """
+
+    def __init__(self, model: Type[ModelType]) -> None:
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+
+    async def exist(self, db: AsyncSession, id: Any) -> bool:
+        return await self.exists_where(db, self.model.id == id)
+
+    async def exists_where(self, db: AsyncSession, *criteria) -> bool:
+        return await db.scalar(select(exists().where(*criteria)))
+
+    async def get_value(self, db: AsyncSession, column, *criteria) -> Any:
+        return await db.scalar(select(column).where(*criteria).limit(1))
+
+    async def get_multi(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> List[ModelType]:
+        result = await db.scalars(select(self.model).offset(skip).limit(limit))
+        return result.all()
+
+    async def get_multi_by_ids(
+        self, db: AsyncSession, *, ids: List[Any]
+    ) -> List[ModelType]:
+        if not ids:
+            return []
+        result = await db.scalars(select(self.model).where(self.model.id.in_(ids)))
+        return result.all()
+
+    async def get_all(self, db: AsyncSession) -> List[ModelType]:
+        result = await db.scalars(select(self.model))
+        return result.all()
+
+    async def get_count(self, db: AsyncSession, *, approximate: bool = False) -> int:
+        if approximate and supports_approximate_count(db.get_bind()):
+            estimate = await db.scalar(
+                APPROXIMATE_COUNT_SQL, {"table": self.model.__table__.fullname}
+            )
+            if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                return estimate
+        return await db.scalar(count_statement(self.model))
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        statement=None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        statement = statement if statement is not None else select(self.model)
+        if cursor:
+            statement = statement.where(keyset_condition(self.model, cursor))
+        result = await db.scalars(
+            statement.order_by(self.model.CreatedAt.desc(), self.model.id.desc())
+            .limit(limit + 1)
+        )
+        return build_page(result.all(), limit, lambda row: (row.CreatedAt, row.id))
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        obj_in_data = jsonable_encoder(obj_in)
+
+        db_obj = self.model(**obj_in_data)
+        try:
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Data integrity issue.")
+
+    async def get_by_field(
+        self, db: AsyncSession, *, field_name: str, field_value: str
+    ) -> Optional[ModelType]:
+        result = await db.scalars(
+            select(self.model)
+            .where(getattr(self.model, field_name) == field_value)
+            .limit(1)
+        )
+        return result.first()
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.dict(exclude_unset=True)
+        columns = self.model.__table__.columns.keys()
+        for field in columns:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        try:
+            await db.commit()
+            await db.refresh(db_obj)
+        except IntegrityError as e:
+            await db.rollback()
+            e.add_detail("An error occured while trying to update " + str(e.params))
+            raise e
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> ModelType:
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        await db.commit()
+        return obj
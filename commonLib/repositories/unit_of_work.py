@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy.orm import Session
+
+_DEPTH_KEY = "unit_of_work_depth"
+_CALLBACKS_KEY = "unit_of_work_after_commit"
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Group repository writes into one flush and one commit.
+
+    Inside the block `create`, `update`, `remove`, `bulk_create` and
+    `bulk_update` only stage their changes. On exit everything is flushed and
+    committed once, or rolled back if the block raised. Server generated
+    columns come back through RETURNING and objects are not expired by the
+    commit, so they can be read afterwards without a refresh SELECT.
+    Nested blocks join the outermost one.
+    """
+    depth = db.info.get(_DEPTH_KEY, 0)
+    db.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            expire_on_commit = db.expire_on_commit
+            db.expire_on_commit = False
+            try:
+                db.commit()
+            finally:
+                db.expire_on_commit = expire_on_commit
+    except Exception:
+        if depth == 0:
+            db.rollback()
+            db.info.pop(_CALLBACKS_KEY, None)
+        raise
+    finally:
+        db.info[_DEPTH_KEY] = depth
+
+    if depth == 0:
+        for callback in db.info.pop(_CALLBACKS_KEY, []):
+            callback()
+
+
+def in_unit_of_work(db: Session) -> bool:
+    return db.info.get(_DEPTH_KEY, 0) > 0
+
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Run `callback` once the surrounding unit of work has committed, or
+    straight away when there is none (the write was already committed)."""
+    if in_unit_of_work(db):
+        db.info.setdefault(_CALLBACKS_KEY, []).append(callback)
+    else:
+        callback()
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str, cache_control: str = "no-cache"
+) -> Optional[Response]:
+    """Set the validators on `response` and return a 304 to send instead when
+    the client's copy (If-None-Match) is still current."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
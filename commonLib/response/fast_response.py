@@ -0,0 +1,77 @@
+import inspect
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable, Optional
+
+import orjson
+from bson import ObjectId
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(
+        content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson-backed response that understands pydantic models, ObjectId and Decimal.
+
+    datetime, date, UUID and dataclasses are serialised natively by orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_response(
+    func: Optional[Callable] = None, *, status_code: int = 200
+) -> Callable:
+    """Return the route's payload as a `FastJSONResponse`.
+
+    Returning a Response bypasses FastAPI's `response_model` validation and
+    `jsonable_encoder` pass, so the payload is serialised exactly once. The
+    declared `response_model` still documents the route in OpenAPI. Use it on
+    read routes whose payload is already built from validated schemas:
+
+        @router.get("/items", response_model=GenericResponse[List[Item]])
+        @fast_response
+        async def get_items(): ...
+    """
+
+    def decorator(route: Callable) -> Callable:
+        def to_response(result: Any) -> Any:
+            if isinstance(result, Response):
+                return result
+            return FastJSONResponse(content=result, status_code=status_code)
+
+        if inspect.iscoroutinefunction(route):
+
+            @wraps(route)
+            async def async_wrapper(*args, **kwargs):
+                return to_response(await route(*args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(route)
+        def wrapper(*args, **kwargs):
+            return to_response(route(*args, **kwargs))
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
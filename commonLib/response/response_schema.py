@@ -10,14 +10,20 @@ class GenericResponse(GenericModel, Generic[T]):
     message: str
     status_code: int
     data: Optional[T]
+    next_cursor: Optional[str] = None
 
 
 
 
 def create_response(
-   message: str = "", status_code: int = "Success", data: Optional[T] = None
+   message: str = "",
+   status_code: int = "Success",
+   data: Optional[T] = None,
+   next_cursor: Optional[str] = None,
 ) -> GenericResponse[T]:
-    return GenericResponse[T](message=message, status_code=status_code, data=data)
+    return GenericResponse[T](
+        message=message, status_code=status_code, data=data, next_cursor=next_cursor
+    )
 
 
 
@@ -0,0 +1,72 @@
+import csv
+import datetime
+import io
+from typing import Any, AsyncIterator, Dict, List, Literal
+
+from starlette.responses import StreamingResponse
+
+from commonLib.response.fast_response import dumps
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+async def csv_chunks(
+    rows: AsyncIterator[Dict[str, Any]], columns: List[str], batch_size: int
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 1
+    async for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+async def ndjson_chunks(
+    rows: AsyncIterator[Dict[str, Any]], columns: List[str], batch_size: int
+) -> AsyncIterator[bytes]:
+    lines = []
+    async for row in rows:
+        lines.append(dumps({column: row.get(column) for column in columns}))
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def stream_rows(
+    rows: AsyncIterator[Dict[str, Any]],
+    columns: List[str],
+    *,
+    export_format: ExportFormat,
+    filename: str,
+    batch_size: int = 500,
+) -> StreamingResponse:
+    """Stream `rows` as CSV or NDJSON, writing `batch_size` rows per chunk."""
+    chunks = csv_chunks if export_format == "csv" else ndjson_chunks
+    return StreamingResponse(
+        chunks(rows, columns, batch_size),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.services.email_outbox import EmailOutbox
+from app.core.services.postmark import PostmarkBatchClient, PostmarkError
+from app.database.base import Base
+from app.models.email_model import Email, EmailStatus
+
+
+class StandInPostmark:
+    """A local HTTP server answering Postmark's batch endpoint.
+
+    Each request takes the next status code from `statuses` (200 once they
+    run out); on 200 every message is accepted unless its recipient is in
+    `rejected`.
+    """
+
+    def __init__(self):
+        self.statuses: List[int] = []
+        self.rejected: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Dict[str, Any]] = []
+        app = FastAPI()
+        app.post("/email/batchWithTemplates")(self.batch_with_templates)
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+
+    async def batch_with_templates(self, request: Request):
+        self.requests.append(
+            {
+                "token": request.headers.get("X-Postmark-Server-Token"),
+                "body": await request.json(),
+            }
+        )
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return PlainTextResponse("Service unavailable", status_code=status)
+        return JSONResponse(
+            [
+                self.rejected.get(
+                    message["To"],
+                    {"ErrorCode": 0, "Message": "OK", "MessageID": f"id-{message['To']}"},
+                )
+                for message in self.requests[-1]["body"]["Messages"]
+            ]
+        )
+
+    def start(self) -> None:
+        self.thread = threading.Thread(
+            target=self.server.run, kwargs={"sockets": [self.sock]}, daemon=True
+        )
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+@pytest.fixture
+def postmark():
+    server = StandInPostmark()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+def queue_emails(session_factory, *recipients: str) -> None:
+    with session_factory() as db:
+        for recipient in recipients:
+            db.add(
+                Email(
+                    recipient=recipient,
+                    template_id="12",
+                    template_dict=json.dumps({"name": recipient}),
+                    sender="noreply@example.com",
+                )
+            )
+        db.commit()
+
+
+def stored_emails(session_factory) -> Dict[str, Email]:
+    with session_factory() as db:
+        return {email.recipient: email for email in db.query(Email)}
+
+
+def drain_once(postmark, session_factory, **options) -> int:
+    async def run() -> int:
+        outbox = EmailOutbox(
+            PostmarkBatchClient("test-token", postmark.url, 5, 2),
+            batch_size=options.get("batch_size", 10),
+            poll_seconds=1,
+            lease_seconds=60,
+            max_attempts=options.get("max_attempts", 3),
+            backoff_seconds=options.get("backoff_seconds", 30),
+            session_factory=session_factory,
+        )
+        try:
+            return await outbox.drain_once()
+        finally:
+            await outbox.client.aclose()
+
+    return asyncio.run(run())
+
+
+def make_due(session_factory) -> None:
+    with session_factory() as db:
+        db.query(Email).update({"next_attempt_at": datetime(2000, 1, 1)})
+        db.commit()
+
+
+def test_client_sends_messages_in_one_request(postmark):
+    async def send():
+        client = PostmarkBatchClient("test-token", postmark.url, 5, 2)
+        try:
+            return await client.send_batch_with_templates(
+                [{"To": "a@example.com"}, {"To": "b@example.com"}]
+            )
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(send())
+
+    assert [result["MessageID"] for result in results] == [
+        "id-a@example.com",
+        "id-b@example.com",
+    ]
+    assert len(postmark.requests) == 1
+    assert postmark.requests[0]["token"] == "test-token"
+
+
+def test_client_raises_when_the_batch_is_rejected(postmark):
+    postmark.statuses = [503]
+
+    async def send():
+        client = PostmarkBatchClient("test-token", postmark.url, 5, 2)
+        try:
+            await client.send_batch_with_templates([{"To": "a@example.com"}])
+        finally:
+            await client.aclose()
+
+    with pytest.raises(PostmarkError, match="503") as error:
+        asyncio.run(send())
+    assert error.value.status_code == 503
+
+
+def test_drain_once_records_delivered_emails(postmark, session_factory):
+    queue_emails(session_factory, "a@example.com", "b@example.com", "c@example.com")
+
+    assert drain_once(postmark, session_factory, batch_size=2) == 2
+    assert drain_once(postmark, session_factory, batch_size=2) == 1
+    assert drain_once(postmark, session_factory, batch_size=2) == 0
+
+    emails = stored_emails(session_factory)
+    assert {email.status for email in emails.values()} == {EmailStatus.DELIVERED}
+    assert all(email.delivered for email in emails.values())
+    assert emails["a@example.com"].message_id == "id-a@example.com"
+    assert [len(request["body"]["Messages"]) for request in postmark.requests] == [2, 1]
+    assert postmark.requests[0]["body"]["Messages"][0] == {
+        "From": "noreply@example.com",
+        "To": "a@example.com",
+        "TemplateModel": {"name": "a@example.com"},
+        "TemplateId": 12,
+    }
+
+
+def test_unavailable_postmark_leaves_emails_pending_with_backoff(
+    postmark, session_factory
+):
+    postmark.statuses = [503, 503]
+    queue_emails(session_factory, "a@example.com")
+
+    started = datetime.utcnow()
+    assert drain_once(postmark, session_factory, backoff_seconds=30) == 1
+    first = stored_emails(session_factory)["a@example.com"]
+    assert first.status == EmailStatus.PENDING
+    assert first.attempts == 1
+    assert "503" in first.extra_data
+    first_delay = first.next_attempt_at - started
+    assert timedelta(seconds=29) < first_delay < timedelta(seconds=40)
+
+    # Not due yet, so nothing is claimed.
+    assert drain_once(postmark, session_factory) == 0
+
+    make_due(session_factory)
+    started = datetime.utcnow()
+    assert drain_once(postmark, session_factory, backoff_seconds=30) == 1
+    second = stored_emails(session_factory)["a@example.com"]
+    assert second.status == EmailStatus.PENDING
+    assert second.attempts == 2
+    second_delay = second.next_attempt_at - started
+    assert timedelta(seconds=59) < second_delay < timedelta(seconds=70)
+
+    make_due(session_factory)
+    assert drain_once(postmark, session_factory) == 1
+    assert stored_emails(session_factory)["a@example.com"].status == EmailStatus.DELIVERED
+
+
+def test_rejected_batch_fails_without_retry(postmark, session_factory):
+    postmark.statuses = [422]
+    queue_emails(session_factory, "a@example.com", "b@example.com")
+
+    assert drain_once(postmark, session_factory) == 2
+
+    emails = stored_emails(session_factory)
+    assert {email.status for email in emails.values()} == {EmailStatus.FAILED}
+    assert all(email.attempts == 1 for email in emails.values())
+    assert "422" in emails["a@example.com"].extra_data
+    make_due(session_factory)
+    assert drain_once(postmark, session_factory) == 0
+    assert len(postmark.requests) == 1
+
+
+def test_emails_fail_after_max_attempts(postmark, session_factory):
+    postmark.statuses = [503, 503]
+    queue_emails(session_factory, "a@example.com")
+
+    for _ in range(2):
+        make_due(session_factory)
+        assert drain_once(postmark, session_factory, max_attempts=2) == 1
+
+    email = stored_emails(session_factory)["a@example.com"]
+    assert email.status == EmailStatus.FAILED
+    assert email.attempts == 2
+    make_due(session_factory)
+    assert drain_once(postmark, session_factory, max_attempts=2) == 0
+    assert len(postmark.requests) == 2
+
+
+def test_message_errors_fail_only_that_email(postmark, session_factory):
+    postmark.rejected["bad@example.com"] = {
+        "ErrorCode": 406,
+        "Message": "You tried to send to a recipient that has been marked as inactive.",
+    }
+    queue_emails(session_factory, "a@example.com", "bad@example.com")
+
+    assert drain_once(postmark, session_factory) == 2
+
+    emails = stored_emails(session_factory)
+    assert emails["a@example.com"].status == EmailStatus.DELIVERED
+    assert emails["bad@example.com"].status == EmailStatus.FAILED
+    assert not emails["bad@example.com"].delivered
+    assert "inactive" in emails["bad@example.com"].extra_data
+    make_due(session_factory)
+    assert drain_once(postmark, session_factory) == 0